@@ -3,6 +3,8 @@ import paho.mqtt.client as mqtt
 import json
 import os
 
+from spotify.board_render import board_message, music_payload, profile_for
+
 # Import MQTT credentials from separate file
 try:
     from mqtt_credentials import MQTT_BROKER, MQTT_PORT, MQTT_USER, MQTT_PASSWORD
@@ -33,15 +35,16 @@ except ImportError:
 if SPOTIFY_ENABLED:
     try:
         import spotipy
-        from spotipy.oauth2 import SpotifyOAuth
+        from spotify.token_manager import make_token_manager
         
-        sp = spotipy.Spotify(auth_manager=SpotifyOAuth(
-            client_id=SPOTIFY_CLIENT_ID,
-            client_secret=SPOTIFY_CLIENT_SECRET,
-            redirect_uri=SPOTIFY_REDIRECT_URI,
-            scope="user-read-currently-playing user-read-playback-state",
-            cache_path=".spotify_cache"
-        ))
+        # Token refreshed in the background (shared .spotify_cache with the bridge)
+        token_manager = make_token_manager(
+            SPOTIFY_CLIENT_ID,
+            SPOTIFY_CLIENT_SECRET,
+            SPOTIFY_REDIRECT_URI,
+            ".spotify_cache"
+        )
+        sp = spotipy.Spotify(auth_manager=token_manager)
         print("Spotify client initialized successfully")
     except ImportError:
         print("Warning: spotipy library not installed. Install with: pip install spotipy")
@@ -59,13 +62,17 @@ app = Flask(__name__)
 # Valid preset IDs
 VALID_PRESETS = ["on_air", "score", "breaking", "reset", "music"]
 
-def publish_to_mqtt(topic, message_data):
+def publish_to_mqtt(topic, message_data, target=None):
     try:
         client = mqtt.Client()
         client.username_pw_set(MQTT_USER, MQTT_PASSWORD)
         client.connect(MQTT_BROKER, MQTT_PORT, 60)
         
-        message = json.dumps(message_data)
+        if target:
+            # Binary command for displays whose firmware decodes it (board_render.wire_payload)
+            message = board_message(message_data, profile_for(target))
+        else:
+            message = json.dumps(message_data)
         client.publish(topic, message)
         client.disconnect()
         return True
@@ -120,6 +127,9 @@ def handle_webhook():
                 message_data["artist"] = artist
             if song:
                 message_data["song"] = song
+            if preset_id == "music" and (artist or song):
+                # ASCII-folded lines with precomputed x (or a scroll flag) for the board
+                message_data.update(music_payload(artist, song, profile_for(target)))
 
         # Map display targets to MQTT topics
         topic_mapping = {
@@ -132,7 +142,7 @@ def handle_webhook():
         if not topic:
             return f'Invalid target display: {target}', 400
 
-        if publish_to_mqtt(topic, message_data):
+        if publish_to_mqtt(topic, message_data, target):
             return 'OK', 200
         else:
             return 'Failed to publish to MQTT', 500
@@ -167,12 +177,7 @@ def spotify_current_track(target):
         # Music preset: omit duration so the board keeps showing until the next
         # MQTT message (timer, another preset, reset). Hardcoded 30s felt like
         # the display "turning off" mid-track.
-        message_data = {
-            "mode": "preset",
-            "preset_id": "music",
-            "artist": artist,
-            "song": song,
-        }
+        message_data = music_payload(artist, song, profile_for(target))
         
         # Map display targets to MQTT topics
         topic_mapping = {
@@ -185,7 +190,7 @@ def spotify_current_track(target):
         if not topic:
             return f'Invalid target display: {target}', 400
             
-        if publish_to_mqtt(topic, message_data):
+        if publish_to_mqtt(topic, message_data, target):
             return json.dumps({
                 "status": "success",
                 "track": {
@@ -208,7 +213,7 @@ def spotify_auth():
         return 'Spotify integration not enabled. Check spotify_credentials.py and spotipy installation.', 503
     
     try:
-        auth_url = sp.auth_manager.get_authorize_url()
+        auth_url = sp.auth_manager.oauth.get_authorize_url()
         return redirect(auth_url)
     except Exception as e:
         return f'Authentication error: {str(e)}', 500
@@ -224,7 +229,8 @@ def spotify_callback():
         if not code:
             return 'No authorization code provided', 400
             
-        token_info = sp.auth_manager.get_access_token(code)
+        token_info = sp.auth_manager.oauth.get_access_token(code, as_dict=False)
+        sp.auth_manager.reload()
         return 'Spotify authentication successful! You can now use /spotify/<target> endpoints.', 200
     except Exception as e:
         return f'Authentication failed: {str(e)}', 500
@@ -250,13 +256,6 @@ def spotify_all_displays():
         artist = item.get('artists', [{}])[0].get('name', 'Unknown Artist')
         song = item.get('name', 'Unknown Song')
         
-        message_data = {
-            "mode": "preset",
-            "preset_id": "music",
-            "artist": artist,
-            "song": song,
-        }
-        
         # Map display targets to MQTT topics
         topic_mapping = {
             'wc': 'home/displays/wc',
@@ -267,7 +266,7 @@ def spotify_all_displays():
         results = {}
         for target in ['wc', 'bathroom', 'eva']:
             topic = topic_mapping[target]
-            success = publish_to_mqtt(topic, message_data)
+            success = publish_to_mqtt(topic, music_payload(artist, song, profile_for(target)), target)
             results[target] = "success" if success else "failed"
         
         return json.dumps({
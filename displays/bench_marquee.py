@@ -0,0 +1,126 @@
+#!/usr/bin/env python3
+"""
+Host benchmark: heap allocation per second of marquee scrolling, the previous character
+marquee (a new string slice per step for label.text, a list of the marquee keys per tick)
+against the prerendered strip in marquee.py (offset + blit).
+
+  python3 displays/bench_marquee.py --seconds 60 --fps 30
+
+Counts with tracemalloc the bytes allocated during each tick (peak above the level before the
+tick, so short-lived objects are included). The blit does nothing here: on the board it is
+native bitmaptools code.
+"""
+
+import argparse
+import json
+from pathlib import Path
+import sys
+import tracemalloc
+
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+
+from fakes import FakeBitmap, FakeTerminalFont, null_blit
+from marquee import Marquee, TextLayout
+
+# Short enough that strip offsets stay <= 256 px: CPython then reuses its cached small ints, as
+# CircuitPython does for every int below 2**30 (longer lines only add host-side int boxing)
+TEXT = "Bohemian Rhapsody (Remaster)"
+CHARS = 10
+CHAR_PX = 6
+GAP = "   "
+
+
+class FakeLabel:
+    def __init__(self):
+        self.text = ""
+
+
+class CharMarquee:
+    """The previous tick_music_marquees(): label.text = wrapped[i:i + chars] once per character."""
+
+    def __init__(self, text):
+        loop = text + GAP
+        self.label = FakeLabel()
+        self.marquees = {id(self.label): {"label": self.label, "wrapped": loop + loop[:CHARS], "n": len(loop), "idx": 0}}
+
+    def tick(self, frame):
+        if frame % CHAR_PX:
+            return
+        for lid in list(self.marquees.keys()):
+            st = self.marquees[lid]
+            i = (st["idx"] + 1) % st["n"]
+            st["idx"] = i
+            st["label"].text = st["wrapped"][i : i + CHARS]
+
+
+class StripMarquee:
+    """marquee.Marquee scrolled to the elapsed time of each frame (same speed as the old one)."""
+
+    def __init__(self, text, fps):
+        self.rows = (Marquee(CHARS * CHAR_PX, 12, 462, bitmap=FakeBitmap, blit=null_blit),)
+        m = self.rows[0]
+        font = FakeTerminalFont()
+        m.render(font, TextLayout(font, text), len(GAP) * CHAR_PX, 1000 // fps)
+        m.active = True
+        assert m.loop_w + m.width <= 256
+        # Elapsed ms per frame, already within one loop (the board restarts the clock every loop)
+        self.elapsed = [frame * 1000 // fps % m.loop_ms for frame in range(fps * 2 * m.loop_ms // 1000)]
+
+    def tick(self, frame):
+        elapsed = self.elapsed[frame % len(self.elapsed)]
+        for m in self.rows:
+            if m.active and m.loop_w:
+                m.scroll_to(elapsed)
+
+
+def _tick_bytes(tick, frame):
+    """Peak bytes allocated above the starting level while tick(frame) runs."""
+    before = tracemalloc.get_traced_memory()[0]
+    tracemalloc.reset_peak()
+    tick(frame)
+    return tracemalloc.get_traced_memory()[1] - before
+
+
+def _noop(frame):
+    for _ in ():
+        pass
+
+
+def measure(marquee, frames):
+    tracemalloc.start()
+    # get_traced_memory() allocates its result and CPython heap-allocates loop iterators (MicroPython
+    # keeps them on the stack): calibrate both away with an empty tick over no rows
+    overhead = max(_tick_bytes(_noop, frame) for frame in range(100))
+    allocating = 0
+    total = 0
+    for frame in range(frames):
+        extra = _tick_bytes(marquee.tick, frame) - overhead
+        if extra > 0:
+            allocating += 1
+            total += extra
+    tracemalloc.stop()
+    return allocating, total
+
+
+def run_bench(seconds=60.0, fps=30):
+    frames = int(seconds * fps)
+    report = {"seconds": seconds, "frames_per_second": fps, "text": TEXT}
+    for name, marquee in (("char_marquee", CharMarquee(TEXT)), ("strip_marquee", StripMarquee(TEXT, fps))):
+        allocating, total = measure(marquee, frames)
+        report[name] = {
+            "allocating_ticks_per_second": round(allocating / seconds, 2),
+            "bytes_per_second": round(total / seconds, 1),
+        }
+    return report
+
+
+def main():
+    p = argparse.ArgumentParser(description="Marquee allocation benchmark (host, tracemalloc)")
+    p.add_argument("--seconds", type=float, default=60.0, help="Simulated scrolling time (default: 60)")
+    p.add_argument("--fps", type=int, default=30, help="Ticks per second (default: 30)")
+    args = p.parse_args()
+    print(json.dumps(run_bench(args.seconds, args.fps), indent=2))
+
+
+if __name__ == "__main__":
+    main()
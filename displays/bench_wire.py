@@ -0,0 +1,87 @@
+#!/usr/bin/env python3
+"""
+Host benchmark: size and parse cost of display commands, JSON as the board parses it today
+(json.loads, then the dict copy of flatten_mqtt_payload) against the binary wire format
+decoded into a reused wire.Command.
+
+  python3 displays/bench_wire.py --runs 20000
+
+Per sample message: body bytes, microseconds per parse and bytes allocated per parse
+(tracemalloc peak). json is native code and decode() interpreted Python here as on the board,
+so the times compare like with like; on the M4 the allocation column matters most (every
+object parsed is heap the next GC pause has to walk).
+"""
+
+import argparse
+import json
+from pathlib import Path
+import sys
+import time
+import tracemalloc
+
+_HERE = Path(__file__).resolve().parent
+sys.path.insert(0, str(_HERE))
+sys.path.insert(0, str(_HERE.parent))
+
+from spotify.board_render import lyric_frames, lyrics_payload, music_payload, profile_for, wire_payload
+from wire import Command, decode
+
+
+def samples():
+    wc = profile_for("wc")
+    lines = [(4000 * k, "Is this the real life? Is this just fantasy?") for k in range(8)]
+    frames = lyric_frames(lines, wc, 40000)
+    return {
+        "timer": {"name": "Pizza", "duration": 720},
+        "music": music_payload("Queen", "Bohemian Rhapsody (Remastered 2011)", wc),
+        "lyrics": lyrics_payload("spotify:track:4u7EnebtmKWzUH433cf5Qv", frames, 0, 61250, True, True),
+    }
+
+
+def parse_json(body, cmd):
+    data = json.loads(str(body, "utf-8"))
+    return dict(data)
+
+
+def parse_wire(body, cmd):
+    return decode(body, cmd)
+
+
+def _cost(parse, body, cmd, runs):
+    start = time.perf_counter()
+    for _ in range(runs):
+        parse(body, cmd)
+    us = (time.perf_counter() - start) / runs * 1e6
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    tracemalloc.reset_peak()
+    parse(body, cmd)
+    allocated = tracemalloc.get_traced_memory()[1] - before
+    tracemalloc.stop()
+    return round(us, 2), allocated
+
+
+def run_bench(runs=20000):
+    cmd = Command()
+    report = {"runs": runs}
+    for name, payload in samples().items():
+        row = {}
+        for fmt, body, parse in (
+            ("json", json.dumps(payload).encode("utf-8"), parse_json),
+            ("wire", wire_payload(payload), parse_wire),
+        ):
+            us, allocated = _cost(parse, body, cmd, runs)
+            row[fmt] = {"bytes": len(body), "parse_us": us, "parse_alloc_bytes": allocated}
+        report[name] = row
+    return report
+
+
+def main():
+    p = argparse.ArgumentParser(description="Display command size / parse benchmark (host)")
+    p.add_argument("--runs", type=int, default=20000, help="Parses per message and format (default: 20000)")
+    args = p.parse_args()
+    print(json.dumps(run_bench(args.runs), indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -7,6 +7,7 @@ import displayio
 import os
 import supervisor
 import microcontroller
+from timebase import Countdown, Stopwatch, NS_PER_S
 import watchdog
 from adafruit_matrixportal.matrixportal import MatrixPortal
 from adafruit_display_text.label import Label
@@ -34,6 +35,22 @@ RED = 0xFF0000
 WHITE = 0xFFFFFF
 BLACK = 0x000000
 
+# Border effects: palette indices 1..BORDER_PHASES repeat around the 188-pixel perimeter
+# (188 % 4 == 0, so patterns wrap without a seam). Presets name an effect as "border_mode".
+BORDER_PHASES = 4
+# name: (seconds per frame, frames); a frame is the level (0-255) of each palette index, or
+# "rainbow" (hue wheel rotating around the border). Level 0 = pixel off.
+BORDER_EFFECTS = {
+    "none": (0, ((0, 0, 0, 0),)),
+    "solid": (0, ((255, 255, 255, 255),)),
+    "animated": (0.2, ((255, 0, 255, 0), (0, 255, 0, 255))),  # running ants
+    "blinking": (0.5, ((255, 0, 255, 0), (0, 0, 0, 0))),  # dashed on / off
+    "chase": (0.08, ((255, 96, 24, 0), (0, 255, 96, 24), (24, 0, 255, 96), (96, 24, 0, 255))),
+    "pulse": (0.08, tuple((v, v, v, v) for v in (40, 80, 130, 190, 255, 190, 130, 80))),
+    "rainbow": (0.1, "rainbow"),
+}
+BORDER_RAINBOW_FRAMES = 16
+
 # Enable serial output for debugging
 try:
     supervisor.runtime.serial_connected = True
@@ -180,19 +197,42 @@ class DisplayText:
                     scroll_info["pause_start"] = current_time
 
 class BorderManager:
+    """
+    Palette-cycling border: the perimeter is drawn once with palette indices 1..BORDER_PHASES
+    repeating along it, everything else is index 0. An effect (BORDER_EFFECTS) is a list of
+    frames precomputed into palette colors when the effect or color changes, so each animation
+    frame is BORDER_PHASES palette writes and no bitmap pixel is ever rewritten.
+    """
     def __init__(self, matrixportal):
         self.matrixportal = matrixportal
         self.animation_step = 0
-        self.current_mode = "none"  # none, solid, animated, blinking
+        self.current_mode = "none"  # a BORDER_EFFECTS name
+        self.color = RED
+        self.frames = ((None,) * BORDER_PHASES,)
+        self.frame_interval = 0
         self.last_animation_update = time.monotonic()
         self.setup_border()
         
     def setup_border(self):
-        """Initialize border display elements"""
-        self.border_bitmap = displayio.Bitmap(DISPLAY_WIDTH, DISPLAY_HEIGHT, 2)
-        self.border_palette = displayio.Palette(2)
+        """Initialize border display elements (the only place border pixels are written)"""
+        self.border_bitmap = displayio.Bitmap(DISPLAY_WIDTH, DISPLAY_HEIGHT, BORDER_PHASES + 1)
+        self.border_palette = displayio.Palette(BORDER_PHASES + 1)
         self.border_palette[0] = BLACK
-        self.border_palette[1] = RED
+        i = 0
+        # Clockwise from the top-left corner, so effects run around the border
+        for x in range(DISPLAY_WIDTH):
+            self.border_bitmap[x, 0] = 1 + i % BORDER_PHASES
+            i += 1
+        for y in range(1, DISPLAY_HEIGHT):
+            self.border_bitmap[DISPLAY_WIDTH-1, y] = 1 + i % BORDER_PHASES
+            i += 1
+        for x in range(DISPLAY_WIDTH-2, -1, -1):
+            self.border_bitmap[x, DISPLAY_HEIGHT-1] = 1 + i % BORDER_PHASES
+            i += 1
+        for y in range(DISPLAY_HEIGHT-2, 0, -1):
+            self.border_bitmap[0, y] = 1 + i % BORDER_PHASES
+            i += 1
+        self.clear_pixels()
         
         self.border_grid = displayio.TileGrid(
             self.border_bitmap,
@@ -201,180 +241,189 @@ class BorderManager:
         
         self.border_group = displayio.Group()
         self.border_group.append(self.border_grid)
-        
-    def draw_pixel(self, x, y, on=True):
-        """Draw a single border pixel"""
-        if 0 <= x < DISPLAY_WIDTH and 0 <= y < DISPLAY_HEIGHT:
-            self.border_bitmap[x, y] = 1 if on else 0
+
+    def _set_entry(self, index, color):
+        """Palette index to color; None = off (same as index 0)"""
+        self.border_palette[index] = BLACK if color is None else color
+
+    def _apply(self, frame):
+        for k in range(BORDER_PHASES):
+            self._set_entry(k + 1, frame[k])
+
+    def _scale(self, level):
+        if level <= 0:
+            return None
+        if level >= 255:
+            return self.color
+        c = self.color
+        r = ((c >> 16) & 0xFF) * level // 255
+        g = ((c >> 8) & 0xFF) * level // 255
+        return (r << 16) | (g << 8) | ((c & 0xFF) * level // 255)
+
+    def _wheel(self, pos):
+        """Hue wheel 0-255 -> 0xRRGGBB (full saturation)"""
+        pos &= 0xFF
+        if pos < 85:
+            return ((255 - pos * 3) << 16) | ((pos * 3) << 8)
+        if pos < 170:
+            pos -= 85
+            return ((255 - pos * 3) << 8) | (pos * 3)
+        pos -= 170
+        return ((pos * 3) << 16) | (255 - pos * 3)
+
+    def _build_frames(self):
+        """Precompute the current effect's frames as palette colors (on effect / color change only)"""
+        interval, levels = BORDER_EFFECTS[self.current_mode]
+        self.frame_interval = interval
+        if levels == "rainbow":
+            step = 256 // BORDER_RAINBOW_FRAMES
+            self.frames = tuple(
+                tuple(self._wheel(k * 256 // BORDER_PHASES + f * step) for k in range(BORDER_PHASES))
+                for f in range(BORDER_RAINBOW_FRAMES)
+            )
+        else:
+            self.frames = tuple(tuple(self._scale(v) for v in frame) for frame in levels)
+
+    def set_effect(self, name):
+        """Start a named border effect (BORDER_EFFECTS); False if the name is unknown"""
+        if name not in BORDER_EFFECTS:
+            print(f"Unknown border effect: {name}")
+            return False
+        if name == self.current_mode and self.frame_interval:
+            return True  # Already animating: keep the phase (countdown re-sends "animated" every second)
+        self.current_mode = name
+        self.animation_step = 0
+        self.last_animation_update = time.monotonic()
+        self._build_frames()
+        self._apply(self.frames[0])
+        return True
+
+    def set_color(self, color):
+        """Border color for all effects (except rainbow); applied to the frame showing now"""
+        self.color = color
+        self._build_frames()
+        self._apply(self.frames[self.animation_step % len(self.frames)])
             
     def clear_pixels(self):
-        """Clear all border pixels without changing mode"""
-        for i in range(DISPLAY_WIDTH):
-            for j in range(DISPLAY_HEIGHT):
-                self.border_bitmap[i, j] = 0
+        """Hide all border pixels without changing mode"""
+        self._apply((None,) * BORDER_PHASES)
                 
     def clear_border(self):
         """Clear border and reset mode"""
-        self.current_mode = "none"
-        self.clear_pixels()
+        self.set_effect("none")
                 
     def set_dashed(self):
-        """Set dashed border"""
-        self.clear_pixels()
-        for x in range(DISPLAY_WIDTH):
-            if x % 2 == 0:  # Only draw every other pixel for dashed effect
-                self.draw_pixel(x, 0)
-                self.draw_pixel(x, DISPLAY_HEIGHT-1)
-        for y in range(DISPLAY_HEIGHT):
-            if y % 2 == 0:  # Only draw every other pixel for dashed effect
-                self.draw_pixel(0, y)
-                self.draw_pixel(DISPLAY_WIDTH-1, y)
+        """Set dashed border (every other perimeter pixel), without changing mode"""
+        self._apply((self.color, None) * (BORDER_PHASES // 2))
 
     def set_solid_border(self):
         """Set solid continuous border"""
-        self.current_mode = "solid"
-        self.clear_pixels()
-        # Draw continuous lines for all border pixels
-        for x in range(DISPLAY_WIDTH):
-            self.draw_pixel(x, 0)  # Top border
-            self.draw_pixel(x, DISPLAY_HEIGHT-1)  # Bottom border
-        for y in range(DISPLAY_HEIGHT):
-            self.draw_pixel(0, y)  # Left border
-            self.draw_pixel(DISPLAY_WIDTH-1, y)  # Right border
+        self.set_effect("solid")
             
     def set_animated(self):
-        """Switch to animated border mode"""
-        self.current_mode = "animated"
-        self.animation_step = 0
+        """Switch to animated border mode (running ants)"""
+        self.set_effect("animated")
             
     def set_blinking(self):
         """Switch to blinking border mode"""
-        self.current_mode = "blinking"
-        self.animation_step = 0
+        self.set_effect("blinking")
 
     def update_animation(self, current_time):
-        """Update border animation based on current mode"""
-        if self.current_mode == "none" or self.current_mode == "solid":
+        """Advance the current effect by one frame when due: BORDER_PHASES palette writes"""
+        if not self.frame_interval or len(self.frames) < 2:
             return
-            
-        # Only update animations every 0.2 seconds for animated, 0.5 for blinking
-        animation_interval = 0.2 if self.current_mode == "animated" else 0.5
-        if (current_time - self.last_animation_update) < animation_interval:
+        if (current_time - self.last_animation_update) < self.frame_interval:
             return
             
         self.last_animation_update = current_time
-        
-        if self.current_mode == "animated":
-            self.animation_step = (self.animation_step + 1) % 2
-            self.clear_pixels()  # Don't change mode when clearing for animation
-            for i in range(DISPLAY_WIDTH + DISPLAY_HEIGHT * 2):
-                if (i + self.animation_step) % 2 == 0:
-                    if i < DISPLAY_WIDTH:
-                        self.draw_pixel(i, 0)
-                        self.draw_pixel(i, DISPLAY_HEIGHT-1)
-                    else:
-                        pos = i - DISPLAY_WIDTH
-                        if pos < DISPLAY_HEIGHT:
-                            self.draw_pixel(DISPLAY_WIDTH-1, pos)
-                        else:
-                            self.draw_pixel(0, pos - DISPLAY_HEIGHT)
-        elif self.current_mode == "blinking":
-            self.animation_step = (self.animation_step + 1) % 2
-            if self.animation_step == 0:
-                self.set_dashed()
-            else:
-                self.clear_pixels()  # Don't change mode when clearing for animation
+        self.animation_step = (self.animation_step + 1) % len(self.frames)
+        self._apply(self.frames[self.animation_step])
 
 class TimerManager:
+    """Countdown -> DONE -> stopwatch, computed from absolute monotonic_ns times (timebase.py)"""
     def __init__(self):
         self.current_countdown = None
         self.stopwatch_start = None
         self.done_start = None
-        self.last_second = None
+        self.countdown_clock = None
+        self.stopwatch_clock = None
         
     def start_countdown(self, name, duration):
         """Start a new countdown"""
         if not isinstance(duration, (int, float)) or duration <= 0:
             return False
             
+        self.countdown_clock = Countdown(duration, time.monotonic_ns())
         self.current_countdown = {
             "name": name,
             "duration": int(duration),
             "remaining": int(duration)
         }
-        self.last_second = time.monotonic()
+        self.stopwatch_clock = None
         self.stopwatch_start = None
         self.done_start = None
         return True
+
+    def clear(self):
+        """Stop the countdown / stopwatch (no more timer deadlines until the next start_countdown)"""
+        self.current_countdown = None
+        self.countdown_clock = None
+        self.stopwatch_start = None
+        self.stopwatch_clock = None
+        self.done_start = None
+
+    def next_change_ns(self):
+        """monotonic_ns of the next displayed-second change (None: nothing running)"""
+        now = time.monotonic_ns()
+        if self.current_countdown:
+            if self.done_start:
+                return self.done_start + DONE_DISPLAY_TIME * NS_PER_S
+            return self.countdown_clock.next_change_ns(now) or now
+        if self.stopwatch_clock:
+            return self.stopwatch_clock.next_change_ns(now)
+        return None
         
     def update_countdown(self, current_time):
-        """Update countdown state"""
+        """Update countdown state (current_time is unused: time comes from monotonic_ns)"""
         if not self.current_countdown:
             return None
-            
-        # Only update when a full second has passed
-        if current_time - self.last_second >= 1.0:
-            # Decrement remaining time
-            self.current_countdown["remaining"] -= 1
-            self.last_second = current_time
-            
-            if self.current_countdown["remaining"] > 0:
-                return {
-                    "type": "countdown",
-                    "name": self.current_countdown["name"],
-                    "minutes": self.current_countdown["remaining"] // 60,
-                    "seconds": self.current_countdown["remaining"] % 60,
-                    "remaining": self.current_countdown["remaining"],
-                    "update": True
-                }
-            else:
-                if not self.done_start:  # Only set done_start once when first entering DONE state
-                    self.done_start = current_time
-                    self.last_second = current_time
-                    return {"type": "done", "first": True}
-                elif current_time - self.done_start >= DONE_DISPLAY_TIME:
-                    self.stopwatch_start = current_time
-                    self.last_second = current_time
-                    self.current_countdown = None
-                    self.done_start = None
-                    return {"type": "stopwatch_start"}
-                return {"type": "done", "first": False}
-                
-        elif self.current_countdown["remaining"] > 0:
+
+        now = time.monotonic_ns()
+        remaining, changed = self.countdown_clock.tick(now)
+        self.current_countdown["remaining"] = remaining
+        if remaining > 0:
             return {
                 "type": "countdown",
                 "name": self.current_countdown["name"],
-                "minutes": self.current_countdown["remaining"] // 60,
-                "seconds": self.current_countdown["remaining"] % 60,
-                "remaining": self.current_countdown["remaining"],
-                "update": False
+                "minutes": remaining // 60,
+                "seconds": remaining % 60,
+                "remaining": remaining,
+                "update": changed
             }
-            
+
+        # DONE for DONE_DISPLAY_TIME from the deadline itself (not from when update() noticed)
+        if not self.done_start:
+            self.done_start = self.countdown_clock.deadline_ns
+            return {"type": "done", "first": True}
+        if now - self.done_start >= DONE_DISPLAY_TIME * NS_PER_S:
+            self.stopwatch_clock = Stopwatch(self.done_start + DONE_DISPLAY_TIME * NS_PER_S)
+            self.stopwatch_start = self.stopwatch_clock.start_ns
+            self.current_countdown = None
+            self.done_start = None
+            return {"type": "stopwatch_start"}
         return {"type": "done", "first": False}
             
     def update_stopwatch(self, current_time):
-        """Update stopwatch state"""
-        if self.stopwatch_start is None:
+        """Update stopwatch state (current_time is unused: time comes from monotonic_ns)"""
+        if self.stopwatch_start is None or self.stopwatch_clock is None:
             return None
             
-        elapsed_time = current_time - self.stopwatch_start
-        elapsed_seconds = int(elapsed_time)
-        
-        # Only trigger update when a full second has passed
-        if current_time - self.last_second >= 1.0:
-            self.last_second = current_time
-            return {
-                "type": "stopwatch",
-                "minutes": elapsed_seconds // 60,
-                "seconds": elapsed_seconds % 60,
-                "update": True
-            }
-            
+        elapsed_seconds, changed = self.stopwatch_clock.tick(time.monotonic_ns())
         return {
             "type": "stopwatch",
             "minutes": elapsed_seconds // 60,
             "seconds": elapsed_seconds % 60,
-            "update": False
+            "update": changed
         }
 
 class PresetManager:
@@ -619,9 +668,7 @@ class CountdownDisplay:
             data = json.loads(message)
             
             # Clear any existing displays
-            self.timer_manager.current_countdown = None
-            self.timer_manager.stopwatch_start = None
-            self.timer_manager.done_start = None
+            self.timer_manager.clear()
             self.preset_manager.clear_preset()
             
             # Reset display to default state
@@ -637,7 +684,7 @@ class CountdownDisplay:
                 self.matrixportal.set_background(BLACK)
                 self.text_manager.title_label.color = WHITE
                 self.text_manager.timer_label.color = WHITE
-                self.border_manager.border_palette[1] = RED  # Reset border to default red
+                self.border_manager.set_color(RED)  # Reset border to default red
                 
                 if "name" in data and "duration" in data:
                     if self.timer_manager.start_countdown(data["name"], data["duration"]):
@@ -698,15 +745,8 @@ class CountdownDisplay:
                             self.text_manager.update_text("", self.text_manager.timer_label, 20)
                         
                         # Set border color and mode
-                        self.border_manager.border_palette[1] = preset_config["border_color"]
-                        if preset_config["border_mode"] == "solid":
-                            self.border_manager.set_solid_border()
-                        elif preset_config["border_mode"] == "animated":
-                            self.border_manager.set_animated()
-                        elif preset_config["border_mode"] == "blinking":
-                            self.border_manager.set_blinking()
-                        elif preset_config["border_mode"] == "none":
-                            self.border_manager.clear_border()
+                        self.border_manager.set_color(preset_config["border_color"])
+                        self.border_manager.set_effect(preset_config["border_mode"])
                         
                         print(f"Preset {data['preset_id']} started successfully")
         except Exception as e:
@@ -781,7 +821,7 @@ class CountdownDisplay:
                         self.matrixportal.set_background(BLACK)
                         self.text_manager.title_label.color = WHITE
                         self.text_manager.timer_label.color = WHITE
-                        self.border_manager.border_palette[1] = RED  # Reset border to default red
+                        self.border_manager.set_color(RED)  # Reset border to default red
                         
                         if self.timer_manager.start_countdown(trigger["name"], trigger["duration"]):
                             self.text_manager.update_text(trigger["name"], self.text_manager.title_label, 8)
@@ -803,15 +843,8 @@ class CountdownDisplay:
                             self.text_manager.update_text("", self.text_manager.timer_label, 20)
                             
                             # Set border color and mode
-                            self.border_manager.border_palette[1] = preset_config["border_color"]
-                            if preset_config["border_mode"] == "solid":
-                                self.border_manager.set_solid_border()
-                            elif preset_config["border_mode"] == "animated":
-                                self.border_manager.set_animated()
-                            elif preset_config["border_mode"] == "blinking":
-                                self.border_manager.set_blinking()
-                            elif preset_config["border_mode"] == "none":
-                                self.border_manager.clear_border()
+                            self.border_manager.set_color(preset_config["border_color"])
+                            self.border_manager.set_effect(preset_config["border_mode"])
                 return
             
             # Update timer state
@@ -0,0 +1,103 @@
+"""
+Host stand-ins for the displayio / bitmaptools / font objects the board helpers use, for
+test_marquee.py and bench_marquee.py. Only what marquee.py needs: Bitmap indexing and fill,
+bitmaptools.blit with its keyword region, and fonts returning glyphs shaped like terminalio's.
+"""
+
+from collections import namedtuple
+
+Glyph = namedtuple("Glyph", "bitmap tile_index width height dx dy shift_x shift_y")
+
+
+class FakeBitmap:
+    """displayio.Bitmap: bitmap[x, y] values, fill(), width / height."""
+
+    def __init__(self, width, height, value_count):
+        self.width = width
+        self.height = height
+        self.value_count = value_count
+        self.data = bytearray(width * height)
+
+    def __getitem__(self, xy):
+        x, y = xy
+        return self.data[y * self.width + x]
+
+    def __setitem__(self, xy, value):
+        x, y = xy
+        self.data[y * self.width + x] = value
+
+    def fill(self, value):
+        for i in range(len(self.data)):
+            self.data[i] = value
+
+    def column(self, x):
+        return tuple(self[x, y] for y in range(self.height))
+
+
+def fake_blit(dest, source, x, y, *, x1, y1, x2, y2):
+    """bitmaptools.blit: copy source[x1:x2, y1:y2] to dest at (x, y); out-of-range raises like the board."""
+    if not (0 <= x1 <= x2 <= source.width and 0 <= y1 <= y2 <= source.height):
+        raise ValueError("source region out of range")
+    if not (0 <= x and x + x2 - x1 <= dest.width and 0 <= y and y + y2 - y1 <= dest.height):
+        raise ValueError("destination out of range")
+    rows = [[source[sx, sy] for sx in range(x1, x2)] for sy in range(y1, y2)]
+    for dy, row in enumerate(rows):
+        for dx, value in enumerate(row):
+            dest[x + dx, y + dy] = value
+
+
+def null_blit(dest, source, x, y, *, x1, y1, x2, y2):
+    """bitmaptools.blit stand-in that copies nothing (benchmarks: the real one is native, allocation-free)."""
+
+
+def glyph_pattern(code, column, row):
+    """Deterministic pixel pattern per character, so tests can tell glyphs and columns apart."""
+    return 1 if (code * 7 + column * 3 + row) % 5 == 0 else 0
+
+
+class FakeTerminalFont:
+    """terminalio.FONT: 6x12 cells for printable ASCII tiled in one bitmap, 2-tuple bounding box."""
+
+    def __init__(self, width=6, height=12):
+        self.width = width
+        self.height = height
+        self.bitmap = FakeBitmap(width * 95, height, 2)
+        for code in range(32, 127):
+            for c in range(width):
+                for r in range(height):
+                    self.bitmap[(code - 32) * width + c, r] = glyph_pattern(code, c, r)
+
+    def get_bounding_box(self):
+        return self.width, self.height
+
+    def get_glyph(self, code):
+        if not 32 <= code < 127:
+            return None
+        return Glyph(self.bitmap, code - 32, self.width, self.height, 0, 0, self.width, 0)
+
+
+class FakeBitmapFont:
+    """adafruit_bitmap_font font: one bitmap per glyph, proportional advance, 4-tuple bounding box."""
+
+    def __init__(self, height=9, descent=2):
+        self.height = height
+        self.descent = descent
+        self.glyphs = {}
+
+    def get_bounding_box(self):
+        return 8, self.height, 0, -self.descent
+
+    def get_glyph(self, code):
+        if code not in self.glyphs:
+            if not 32 <= code < 127:
+                return None
+            # "i" / "l" narrow, "m" / "w" wide, the rest 4 px; "j" hangs below the baseline
+            w = {105: 1, 108: 1, 109: 5, 119: 5, 32: 0}.get(code, 4)
+            h = 9 if code == 106 else 7
+            dy = -2 if code == 106 else 0
+            bitmap = FakeBitmap(max(1, w), h, 2)
+            for c in range(w):
+                for r in range(h):
+                    bitmap[c, r] = glyph_pattern(code, c, r)
+            self.glyphs[code] = Glyph(bitmap, 0, w, h, 0, dy, w + 1 if w else 3, 0)
+        return self.glyphs[code]
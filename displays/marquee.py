@@ -0,0 +1,201 @@
+"""
+Allocation-free, pixel-smooth scrolling text for the MatrixPortal boards (displays/wc/code.py).
+
+The text is drawn once per message, glyph by glyph (terminalio.FONT or an adafruit_bitmap_font
+font), into a preallocated strip bitmap laid out as  text + gap + first view width of text  so
+any window of view width starting before the end of text + gap is continuous. Scrolling only
+blits the window at the current pixel offset into the view bitmap (shown by a TileGrid): no
+strings, lists or bitmaps are created per frame. Text is measured through LayoutCache, so a
+string is laid out once per font for centering, the scroll decision and drawing.
+
+Copy next to code.py on the CIRCUITPY drive. Plain Python on purpose; on the host
+(bench_marquee.py, test_marquee.py) pass the bitmap class and blit function explicitly.
+"""
+
+try:
+    import bitmaptools
+    import displayio
+except ImportError:
+    bitmaptools = None
+    displayio = None
+
+
+def font_metrics(font):
+    """(box width, box height, ascent) for terminalio.FONT (2-tuple box) and bitmap fonts (4-tuple)."""
+    box = font.get_bounding_box()
+    height = box[1]
+    ascent = height + box[3] if len(box) > 3 else height
+    return box[0], height, ascent
+
+
+class TextLayout:
+    """
+    text measured in font: width is the sum of glyph advances (what is drawn, so characters the
+    font has no glyph for count 0), glyphs / xs the glyph run with each glyph's pen position.
+    """
+
+    def __init__(self, font, text):
+        glyphs = []
+        xs = []
+        x = 0
+        for ch in text:
+            glyph = font.get_glyph(ord(ch))
+            if glyph is None:
+                continue
+            glyphs.append(glyph)
+            xs.append(x)
+            x += glyph.shift_x
+        self.glyphs = tuple(glyphs)
+        self.xs = tuple(xs)
+        self.width = x
+
+
+class LayoutCache:
+    """
+    (font, text) -> TextLayout, at most size entries (oldest replaced first), so centering and
+    marquee decisions measure a string once per font and the cache cannot grow on the M4.
+    """
+
+    def __init__(self, size):
+        self.size = size
+        self.order = [None] * size
+        self.next = 0
+        self.layouts = {}
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, font, text):
+        key = (font, text)
+        layout = self.layouts.get(key)
+        if layout is not None:
+            self.hits += 1
+            return layout
+        self.misses += 1
+        layout = TextLayout(font, text)
+        old = self.order[self.next]
+        if old is not None:
+            del self.layouts[old]
+        self.order[self.next] = key
+        self.next = (self.next + 1) % self.size
+        self.layouts[key] = layout
+        return layout
+
+    def width(self, font, text):
+        return self.get(font, text).width
+
+
+def draw_layout(bitmap, layout, ascent, blit, limit=None):
+    """
+    Blit a TextLayout into bitmap from x = 0 (top row = ascent above the baseline), stopping
+    before the first glyph whose advance would pass limit; returns the end x.
+    """
+    limit = bitmap.width if limit is None else limit
+    x = 0
+    for i in range(len(layout.glyphs)):
+        glyph = layout.glyphs[i]
+        x = layout.xs[i]
+        if x + glyph.shift_x > limit:
+            return x
+        w = glyph.width
+        h = glyph.height
+        if w and h:
+            # terminalio keeps every glyph in one tiled bitmap; bitmap fonts use one bitmap per glyph
+            per_row = glyph.bitmap.width // w
+            sx = (glyph.tile_index % per_row) * w
+            sy = (glyph.tile_index // per_row) * h
+            dx = x + glyph.dx
+            dy = ascent - h - glyph.dy
+            if dx < 0:
+                sx -= dx
+                w += dx
+                dx = 0
+            if dy < 0:
+                sy -= dy
+                h += dy
+                dy = 0
+            if dy + h > bitmap.height:
+                h = bitmap.height - dy
+            if w > 0 and h > 0:
+                blit(bitmap, glyph.bitmap, dx, dy, x1=sx, y1=sy, x2=sx + w, y2=sy + h)
+    return layout.width
+
+
+class Marquee:
+    """
+    One text row: view (width x height, shown by the caller's TileGrid) and a strip of
+    strip_width px. Text wider than the view scrolls, driven by elapsed time (scroll_to), so
+    the speed does not depend on how often the main loop gets round to it; narrower text is
+    centered and static. active / start_ms / palette / tilegrid are filled in by the caller.
+    """
+
+    def __init__(self, width, height, strip_width, bitmap=None, blit=None):
+        bitmap = bitmap or displayio.Bitmap
+        self.blit = blit or bitmaptools.blit
+        self.width = width
+        self.height = height
+        self.view = bitmap(width, height, 2)
+        self.strip = bitmap(strip_width, height, 2)
+        self.text_w = 0
+        self.loop_w = 0
+        self.offset = 0
+        self.ms_per_px = 1
+        self.loop_ms = 0
+        self.active = False
+        self.start_ms = 0
+        self.palette = None
+        self.tilegrid = None
+
+    def render(self, font, layout, gap_px, ms_per_px):
+        """
+        Draw a TextLayout of font once (cut where the strip runs out) and show it from the start;
+        returns its width. Scrolls one pixel every ms_per_px when wider than the view (loop_w > 0).
+        """
+        ascent = font_metrics(font)[2]
+        self.strip.fill(0)
+        limit = self.strip.width - gap_px - self.width
+        self.text_w = draw_layout(self.strip, layout, ascent, self.blit, limit)
+        self.offset = 0
+        self.ms_per_px = ms_per_px
+        if self.text_w <= self.width:
+            self.loop_w = 0
+            self.loop_ms = 0
+            self.view.fill(0)
+            if self.text_w:
+                x = (self.width - self.text_w) // 2
+                self.blit(self.view, self.strip, x, 0, x1=0, y1=0, x2=self.text_w, y2=self.height)
+            return self.text_w
+        self.loop_w = self.text_w + gap_px
+        self.loop_ms = self.loop_w * ms_per_px
+        # Repeat the start after the gap so the window wraps without a seam
+        self.blit(self.strip, self.strip, self.loop_w, 0, x1=0, y1=0, x2=self.width, y2=self.height)
+        self.show()
+        return self.text_w
+
+    def scroll_to(self, elapsed_ms):
+        """Show the window elapsed_ms after the start; blits only when the pixel offset changes."""
+        if not self.loop_w:
+            return False
+        offset = (elapsed_ms // self.ms_per_px) % self.loop_w
+        if offset == self.offset:
+            return False
+        self.offset = offset
+        self.show()
+        return True
+
+    def ms_to_next_px(self, elapsed_ms):
+        """Milliseconds from elapsed_ms until the offset moves on (None when static)."""
+        if not self.loop_w:
+            return None
+        return self.ms_per_px - elapsed_ms % self.ms_per_px
+
+    def show(self):
+        self.blit(
+            self.view,
+            self.strip,
+            0,
+            0,
+            x1=self.offset,
+            y1=0,
+            x2=self.offset + self.width,
+            y2=self.height,
+        )
@@ -0,0 +1,36 @@
+"""
+What the board display shows, as a flat dict of elements, for displays/wc/code.py.
+
+A message is turned into the screen it wants (background, text color, border color / effect,
+radio symbol, top and bottom row) and only the elements that differ from what is shown are
+redrawn, instead of clearing everything and building it again. A row is a (kind, text, y)
+tuple; its kind says how it is drawn (centered label, music line, bridge-rendered line, or a
+row owned by the countdown / lyrics code).
+
+Copy next to code.py on the CIRCUITPY drive. Plain Python, no board imports (test_screen.py).
+"""
+
+ELEMENTS = ("background", "text_color", "border_color", "border_mode", "radio", "top", "bottom")
+
+
+class Screen:
+    """Elements last applied; anything drawn outside apply is forgotten so the next message redraws it."""
+
+    def __init__(self):
+        self.shown = {}
+
+    def changes(self, want):
+        """Names of the elements in want that differ from what is shown, in ELEMENTS (drawing) order"""
+        shown = self.shown
+        return [n for n in ELEMENTS if n in want and (n not in shown or shown[n] != want[n])]
+
+    def applied(self, want):
+        self.shown.update(want)
+
+    def forget(self, *names):
+        """Element(s) changed behind our back (DONE, stopwatch, border effect); all when none given"""
+        if not names:
+            self.shown = {}
+            return
+        for n in names:
+            self.shown.pop(n, None)
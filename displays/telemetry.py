@@ -0,0 +1,99 @@
+"""
+Board health telemetry for the MatrixPortal boards (displays/wc/code.py).
+
+Errors and health events are only recorded here (fixed counters and a small ring of the last
+errors, nothing grows), and one compact combined report is built when it is due: every
+MIN_INTERVAL_S while degraded, otherwise starting at BASE_INTERVAL_S and doubling up to
+MAX_INTERVAL_S while the board stays healthy. A new error pulls the next report forward to at
+most MIN_INTERVAL_S away, so a burst of errors is reported together. The caller queues the
+report (outbox, flushed after mqtt loop()); nothing here publishes.
+
+Copy next to code.py on the CIRCUITPY drive. Plain Python (test_telemetry.py).
+"""
+
+MIN_INTERVAL_S = 10
+BASE_INTERVAL_S = 30
+MAX_INTERVAL_S = 300
+LAST_ERRORS = 4
+DETAIL_CHARS = 40
+
+# Error kinds the board reports, each counted on its own; anything else only counts as "errors"
+COUNTERS = (
+    "errors",
+    "events",
+    "wifi_disconnected",
+    "wifi_error",
+    "mqtt_disconnected",
+    "mqtt_send_failed",
+    "mqtt_error",
+)
+
+
+class Telemetry:
+    def __init__(self, now_s, counters=COUNTERS, last_errors=LAST_ERRORS):
+        self.counts = {}
+        for name in counters:
+            self.counts[name] = 0
+        self.size = last_errors
+        self.error_kinds = [""] * last_errors
+        self.error_times = [0.0] * last_errors
+        self.error_details = [""] * last_errors
+        self.error_next = 0
+        self.window_errors = 0
+        self.last_event = ""
+        self.last_event_at = 0.0
+        self.interval_s = 0  # first healthy report: BASE_INTERVAL_S
+        self.next_at = now_s
+        self.reports = 0
+
+    def event(self, name, now_s):
+        self.counts["events"] += 1
+        self.last_event = name
+        self.last_event_at = now_s
+
+    def error(self, kind, detail, now_s):
+        """Count kind and keep it with a short detail in the last-errors ring; report within MIN_INTERVAL_S."""
+        self.counts["errors"] += 1
+        if kind in self.counts:
+            self.counts[kind] += 1
+        slot = self.error_next
+        self.error_kinds[slot] = kind
+        self.error_times[slot] = now_s
+        self.error_details[slot] = str(detail)[:DETAIL_CHARS]
+        self.error_next = (slot + 1) % self.size
+        self.window_errors += 1
+        if self.next_at > now_s + MIN_INTERVAL_S:
+            self.next_at = now_s + MIN_INTERVAL_S
+
+    def due(self, now_s):
+        return now_s >= self.next_at
+
+    def report(self, now_s, degraded=False):
+        """
+        The combined report (counters since boot, last errors as [kind, seconds ago, detail] newest
+        first, last event); schedules the next one. degraded: link down / poor quality from the caller.
+        """
+        degraded = degraded or self.window_errors > 0
+        errors = []
+        for k in range(self.size):
+            slot = (self.error_next - 1 - k) % self.size
+            if self.error_kinds[slot]:
+                errors.append([self.error_kinds[slot], int(now_s - self.error_times[slot]), self.error_details[slot]])
+        out = {
+            "n": self.reports,
+            "deg": degraded,
+            "c": dict(self.counts),
+            "err": errors,
+            "ev": [self.last_event, int(now_s - self.last_event_at)] if self.last_event else None,
+        }
+        if degraded:
+            self.interval_s = MIN_INTERVAL_S
+        elif self.interval_s < BASE_INTERVAL_S:
+            self.interval_s = BASE_INTERVAL_S
+        else:
+            self.interval_s = min(MAX_INTERVAL_S, self.interval_s * 2)
+        out["next"] = self.interval_s
+        self.next_at = now_s + self.interval_s
+        self.window_errors = 0
+        self.reports += 1
+        return out
@@ -0,0 +1,85 @@
+"""Quick checks for the prerendered marquee (run: python3 displays/test_marquee.py)."""
+
+from pathlib import Path
+import sys
+
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+
+from fakes import FakeBitmap, FakeBitmapFont, FakeTerminalFont, fake_blit, glyph_pattern
+from marquee import LayoutCache, Marquee, TextLayout, draw_layout, font_metrics
+
+GAP = 18
+
+
+def expected_column(text, gap, loop_x, height):
+    """Pixel column loop_x of text + gap with 6 px terminal glyphs (gap columns are blank)."""
+    i = loop_x // 6
+    if i >= len(text):
+        return (0,) * height
+    return tuple(glyph_pattern(ord(text[i]), loop_x % 6, r) for r in range(height))
+
+
+def main() -> None:
+    font = FakeTerminalFont()
+    assert font_metrics(font) == (6, 12, 12)
+    assert font_metrics(FakeBitmapFont()) == (8, 9, 7)
+
+    text = "A much longer song title"
+    m = Marquee(60, 12, 462, bitmap=FakeBitmap, blit=fake_blit)
+    assert m.render(font, TextLayout(font, text), GAP, 25) == len(text) * 6
+    assert m.loop_w == len(text) * 6 + GAP
+
+    # Every window (including the ones that wrap past the gap) shows text + gap continuously
+    for offset in list(range(0, m.loop_w, 7)) + [m.loop_w - 1]:
+        m.offset = offset
+        m.show()
+        for x in range(60):
+            assert m.view.column(x) == expected_column(text, GAP, (offset + x) % m.loop_w, 12), (offset, x)
+
+    # Time-driven: the offset follows elapsed ms (one pixel per 25 ms), not the number of calls
+    m.offset = 0
+    assert not m.scroll_to(24)
+    assert m.scroll_to(50) and m.offset == 2
+    assert m.view.column(0) == expected_column(text, GAP, 2, 12)
+    assert not m.scroll_to(74)
+    assert m.ms_to_next_px(50) == 25 and m.ms_to_next_px(74) == 1
+    assert m.loop_ms == m.loop_w * 25
+    m.scroll_to(m.loop_ms + 50)
+    assert m.offset == 2
+
+    # Longer than the strip: cut at a glyph boundary, the wrap copy still fits
+    m.render(font, TextLayout(font, "x" * 200), GAP, 25)
+    assert m.text_w % 6 == 0 and m.loop_w + 60 <= 462
+
+    # Fits the view: centered, static
+    m.render(font, TextLayout(font, "Short"), GAP, 25)
+    assert m.loop_w == 0 and m.ms_to_next_px(10) is None and not m.scroll_to(1000)
+    assert m.view.column(14) == (0,) * 12
+    assert m.view.column(15) == expected_column("Short", GAP, 0, 12)
+
+    # Bitmap font: proportional advance, glyphs placed on a shared baseline
+    bf = FakeBitmapFont()
+    bm = FakeBitmap(40, 9, 2)
+    layout = TextLayout(bf, "lij w")
+    assert layout.width == 2 + 2 + 5 + 3 + 6 and layout.xs == (0, 2, 4, 9, 12)
+    assert draw_layout(bm, layout, font_metrics(bf)[2], fake_blit) == layout.width
+    # "l" sits on the baseline (rows 0-6), "j" reaches two rows below it
+    assert bm.column(0) == tuple(glyph_pattern(ord("l"), 0, r) for r in range(7)) + (0, 0)
+    assert bm.column(4) == tuple(glyph_pattern(ord("j"), 0, r) for r in range(9))
+    assert bm.column(4)[8] == 1
+
+    # Layout cache: true widths per font (proportional, glyph-less characters count 0), bounded
+    cache = LayoutCache(3)
+    assert cache.width(font, "Hello") == 30
+    assert cache.width(bf, "Hello") == TextLayout(bf, "Hello").width != 30
+    assert cache.width(font, "Caf\u00e9 \u266b") == 4 * 6  # len() * 6 would say 36
+    assert cache.get(font, "Hello") is cache.get(font, "Hello") and cache.hits == 2
+    cache.get(font, "a")
+    cache.get(font, "b")
+    assert sorted(text for _, text in cache.layouts) == ["Caf\u00e9 \u266b", "a", "b"]
+
+    print("marquee tests ok")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,58 @@
+"""Quick checks for the display state diff (run: python3 displays/test_screen.py)."""
+
+from pathlib import Path
+import sys
+
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+
+from screen import ELEMENTS, Screen
+
+
+def music(artist, song, color=0xFFFFFF):
+    return {
+        "background": 0x400040,
+        "text_color": color,
+        "border_color": 0x800080,
+        "border_mode": "solid",
+        "radio": True,
+        "top": ("line", artist, 8),
+        "bottom": ("line", song, 23),
+    }
+
+
+def main() -> None:
+    s = Screen()
+    # Nothing shown yet: everything is drawn, in drawing order (colors before rows)
+    assert s.changes(music("Queen", "Bohemian Rhapsody")) == list(ELEMENTS)
+    s.applied(music("Queen", "Bohemian Rhapsody"))
+
+    # Re-published track (Spotify poll, or only the preset duration changed): nothing to redraw
+    assert s.changes(music("Queen", "Bohemian Rhapsody")) == []
+    # Next song by the same artist: only the song row
+    assert s.changes(music("Queen", "Somebody to Love")) == ["bottom"]
+    s.applied(music("Queen", "Somebody to Love"))
+    assert s.changes(music("Queen", "Somebody to Love", color=0xFFFF00)) == ["text_color"]
+
+    # Bridge-rendered rows (text, x; None scrolls) compare by content, not identity
+    rendered = dict(music("", ""), top=("render", ("Queen", 17), 8))
+    s.applied(rendered)
+    assert s.changes(dict(rendered, top=("render", ("Queen", 17), 8))) == []
+    assert s.changes(dict(rendered, top=("render", ("Queen", None), 8))) == ["top"]
+
+    # Partial screens (blank screen after a preset) leave the other elements alone
+    idle = {"background": 0, "border_mode": "none", "top": ("text", "", 8), "bottom": ("text", "", 20)}
+    assert s.changes(idle) == ["background", "border_mode", "top", "bottom"]
+    s.applied(idle)
+    assert s.shown["radio"] is True
+
+    # Drawn outside apply (stopwatch title, DONE border): forgotten elements are redrawn next time
+    s.forget("top", "border_mode")
+    assert s.changes(idle) == ["border_mode", "top"]
+    s.forget()
+    assert s.changes(idle) == ["background", "border_mode", "top", "bottom"]
+
+    print("screen tests ok")
+
+
+if __name__ == "__main__":
+    main()
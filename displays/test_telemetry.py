@@ -0,0 +1,59 @@
+"""Quick checks for the board telemetry aggregator (run: python3 displays/test_telemetry.py)."""
+
+from pathlib import Path
+import sys
+
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+
+from telemetry import BASE_INTERVAL_S, DETAIL_CHARS, LAST_ERRORS, MAX_INTERVAL_S, MIN_INTERVAL_S, Telemetry
+
+
+def main() -> None:
+    t = Telemetry(100.0)
+    assert t.due(100.0)
+    t.event("wifi_connected", 100.0)
+
+    # Healthy: 30 s, then doubling up to 5 min
+    intervals = []
+    now = 100.0
+    for _ in range(6):
+        r = t.report(now)
+        intervals.append(r["next"])
+        now = t.next_at
+        assert not t.due(now - 0.1) and t.due(now)
+    assert intervals == [BASE_INTERVAL_S, 60, 120, 240, MAX_INTERVAL_S, MAX_INTERVAL_S]
+    assert r["ev"][0] == "wifi_connected" and r["err"] == [] and r["c"]["events"] == 1
+
+    # An error pulls the next report to within MIN_INTERVAL_S; a burst goes out together
+    now = t.next_at - MAX_INTERVAL_S  # just after the last report
+    t.error("mqtt_error", "connect: [Errno 116] ETIMEDOUT", now + 1)
+    assert t.next_at == now + 1 + MIN_INTERVAL_S
+    t.error("mqtt_disconnected", "", now + 2)
+    t.error("custom_thing", "x" * 100, now + 3)
+    assert t.next_at == now + 1 + MIN_INTERVAL_S
+    r = t.report(t.next_at)
+    assert r["deg"] and r["next"] == MIN_INTERVAL_S
+    assert r["c"]["errors"] == 3 and r["c"]["mqtt_error"] == 1 and r["c"]["mqtt_disconnected"] == 1
+    assert "custom_thing" not in r["c"]
+    # Newest first, with age in seconds and a cut detail
+    assert [e[0] for e in r["err"]] == ["custom_thing", "mqtt_disconnected", "mqtt_error"]
+    assert r["err"][0][1] == MIN_INTERVAL_S - 2 and len(r["err"][0][2]) == DETAIL_CHARS
+
+    # Degraded by the caller (link down) with no new errors: still fast; healthy again: back to 30 s
+    r = t.report(t.next_at, degraded=True)
+    assert r["next"] == MIN_INTERVAL_S
+    r = t.report(t.next_at)
+    assert r["next"] == BASE_INTERVAL_S and not r["deg"]
+
+    # Fixed storage: the ring keeps only the last LAST_ERRORS errors, counters do not grow
+    for k in range(20):
+        t.error(f"kind{k}", k, now + k)
+    r = t.report(t.next_at)
+    assert [e[0] for e in r["err"]] == [f"kind{k}" for k in range(19, 19 - LAST_ERRORS, -1)]
+    assert len(t.counts) == len(r["c"]) and r["c"]["errors"] == 23
+
+    print("telemetry tests ok")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,142 @@
+"""Quick checks for the board countdown / stopwatch timebase (run: python3 displays/test_timebase.py)."""
+
+from pathlib import Path
+import random
+import sys
+
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+
+from timebase import NS_PER_S, Countdown, Deadlines, Poll, Stopwatch
+
+MS = 1000000
+
+
+def jittery_loop(rng, start_ns, end_ns):
+    """Loop wake-ups like the board's: mostly 10-60 ms apart, sometimes blocked 1-3 s (MQTT, Wi-Fi)."""
+    now = start_ns
+    while now < end_ns:
+        if rng.random() < 0.02:
+            now += rng.randint(1000, 3000) * MS
+        else:
+            now += rng.randint(10, 60) * MS + rng.randint(0, MS)
+        yield now
+
+
+def old_countdown_end(rng, start_ns, duration_s):
+    """The previous TimerManager: remaining -= 1 whenever >= 1 s passed since the last decrement."""
+    remaining = duration_s
+    last = start_ns
+    for now in jittery_loop(rng, start_ns, start_ns + 10 * duration_s * NS_PER_S):
+        if now - last >= NS_PER_S:
+            remaining -= 1
+            last = now
+            if remaining <= 0:
+                return now
+    return None
+
+
+def main() -> None:
+    start = 123456789
+    c = Countdown(90, start)
+    assert c.tick(start) == (90, True)
+    assert c.tick(start + 1) == (90, False)
+    assert c.next_change_ns(start) == start + NS_PER_S
+    assert c.remaining_s(start + NS_PER_S) == 89
+    assert c.remaining_s(start + 89 * NS_PER_S + 1) == 1
+    assert c.remaining_s(c.deadline_ns) == 0 and c.next_change_ns(c.deadline_ns) is None
+
+    s = Stopwatch(start)
+    assert s.tick(start) == (0, True)
+    assert s.tick(start + NS_PER_S - 1) == (0, False)
+    assert s.tick(start + NS_PER_S) == (1, True)
+    assert s.next_change_ns(start + NS_PER_S) == start + 2 * NS_PER_S
+
+    # Jittery loop over an hour: every shown value is exact for the time it was drawn at,
+    # values only go down by whole seconds, and 0 is reached at the deadline (zero drift)
+    rng = random.Random(7)
+    duration = 3600
+    c = Countdown(duration, start)
+    c.tick(start)
+    redraws = 0
+    zero_at = None
+    for now in jittery_loop(rng, start, c.deadline_ns + 5 * NS_PER_S):
+        before = c.shown
+        value, changed = c.tick(now)
+        assert value == max(0, -((now - c.deadline_ns) // NS_PER_S))
+        assert value <= before
+        redraws += changed
+        if value == 0 and zero_at is None:
+            zero_at = now
+    assert zero_at is not None and zero_at - c.deadline_ns < 3 * NS_PER_S
+    # One redraw per displayed second change at most, fewer when a blocked loop skipped seconds
+    assert 0 < redraws <= duration
+
+    # Sleeping until next_change_ns() renders every second exactly once, on time
+    c = Countdown(120, start)
+    now = start
+    shown = []
+    while True:
+        value, changed = c.tick(now)
+        assert changed
+        shown.append(value)
+        nxt = c.next_change_ns(now)
+        if nxt is None:
+            break
+        assert nxt > now
+        now = nxt
+    assert shown == list(range(120, -1, -1))
+    assert now == c.deadline_ns
+
+    s = Stopwatch(start)
+    s.tick(start)
+    for now in jittery_loop(random.Random(3), start, start + 600 * NS_PER_S):
+        assert s.tick(now)[0] == (now - start) // NS_PER_S
+
+    # For comparison: counting decrements loses the loop's lateness every second
+    old_end = old_countdown_end(random.Random(7), start, duration)
+    assert old_end is not None and old_end - (start + duration * NS_PER_S) > 10 * NS_PER_S
+
+    # Main-loop deadlines: sleep until the earliest pending one, capped
+    d = Deadlines()
+    assert d.next_ns() is None and d.sleep_s(start, 1.0) == 1.0
+    d.set("mqtt", start + 250 * MS)
+    d.set_s("border", (start + 80 * MS) / NS_PER_S)
+    d.set("timer", None)
+    assert d.next_ns() == start + 80 * MS
+    assert d.next_ns(skip="border") == start + 250 * MS
+    assert abs(d.sleep_s(start, 1.0) - 0.08) < 1e-6
+    assert d.sleep_s(start + 300 * MS, 1.0) == 0
+    assert d.sleep_s(start - 5 * NS_PER_S, 1.0) == 1.0
+    assert d.due("mqtt", start + 250 * MS) and not d.due("mqtt", start) and not d.due("timer", start)
+
+    # Main loop with a 33 ms marquee frame always closer than the 100 ms poll slot: the poll is put
+    # off to its forced time (one period late) and the loop keeps sleeping until the next frame
+    d = Deadlines()
+    poll = Poll(d, "mqtt", 250 * MS, 100 * MS, start)
+    d.set("marquee", start + 33 * MS)
+    now = start
+    polls = iterations = spins = 0
+    while now < start + 2 * NS_PER_S:
+        iterations += 1
+        if poll.should_run(now):
+            polls += 1
+            now += 5 * MS  # loop() returns early when nothing is queued
+            poll.ran(now)
+        if d.due("marquee", now):
+            d.set("marquee", d.at["marquee"] + 33 * MS)
+        wait = d.sleep_s(now, 1.0)
+        spins += wait == 0
+        now += max(int(wait * NS_PER_S), MS // 10)
+    assert polls >= 4 and spins <= polls, (polls, spins)
+    assert iterations < 2 * (2000 // 33 + polls), iterations
+    # A clear gap: polled as soon as it is due
+    d = Deadlines()
+    poll = Poll(d, "mqtt", 250 * MS, 100 * MS, start)
+    d.set("marquee", start + 200 * MS)
+    assert poll.should_run(start) and not poll.should_run(start - 1)
+
+    print("timebase tests ok")
+
+
+if __name__ == "__main__":
+    main()
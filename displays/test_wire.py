@@ -0,0 +1,76 @@
+"""Quick checks for binary display commands (run: python3 displays/test_wire.py)."""
+
+import json
+from pathlib import Path
+import sys
+
+_HERE = Path(__file__).resolve().parent
+sys.path.insert(0, str(_HERE))
+sys.path.insert(0, str(_HERE.parent))
+
+from spotify.board_render import board_message, lyrics_payload, music_payload, profile_for, wire_payload
+from wire import MODE_LYRICS, MODE_PRESET, MODE_TIMER, SCROLL_X, Command, decode, is_wire
+
+
+def main() -> None:
+    cmd = Command()
+
+    # Flask timer (no "mode")
+    decode(wire_payload({"name": "Pizza", "duration": 720, "message_id": "m1"}), cmd)
+    assert cmd.mode == MODE_TIMER and cmd.name == "Pizza" and cmd.duration == 720 and cmd.message_id == "m1"
+
+    # Preset with optional fields missing
+    decode(wire_payload({"mode": "preset", "preset_id": "on_air", "name": "", "duration": None}), cmd)
+    assert cmd.mode == MODE_PRESET and cmd.preset_id == "on_air" and cmd.duration == 0 and cmd.rows == 0
+
+    # Music preset: the render rows (x, or scroll) replace artist / song
+    wc = profile_for("wc")
+    payload = music_payload("Beyoncé", "A much longer song title", wc)
+    decode(wire_payload(payload), cmd)
+    assert cmd.rows == 2 and cmd.artist == "" and cmd.song == ""
+    assert (cmd.top, cmd.top_x) == ("Beyonce", payload["render"]["a"]["x"])
+    assert (cmd.bottom, cmd.bottom_x) == ("A much longer song title", SCROLL_X)
+    # Without a render block artist / song are sent
+    decode(wire_payload({"mode": "preset", "preset_id": "music", "artist": "Café", "song": "Ünï"}), cmd)
+    assert (cmd.artist, cmd.song, cmd.rows) == ("Café", "Ünï", 0)
+
+    # Lyrics window; frames past the board ring are dropped, the rest of the message still parses
+    frames = [(1000 * k, f"top {k}", "" if k % 2 else f"bottom {k}") for k in range(12)]
+    payload = lyrics_payload("spotify:track:abc", frames, 0, 61250, True, True)
+    decode(wire_payload(payload), cmd)
+    assert cmd.mode == MODE_LYRICS and cmd.reset and cmd.playing and cmd.progress_ms == 61250
+    assert cmd.track_uri == "spotify:track:abc" and cmd.count == len(payload["f"])
+    assert [cmd.times[k] for k in range(cmd.count)] == [f[0] for f in payload["f"]]
+    assert cmd.tops[1] == "top 1" and cmd.bottoms[1] == "" and cmd.bottoms[2] == "bottom 2"
+    big = Command(max_frames=2)
+    decode(wire_payload(dict(payload, f=[list(f) for f in frames], r=0, pl=0)), big)
+    assert big.count == 2 and not big.reset and not big.playing
+
+    # Strings are cut to 255 bytes on a character boundary
+    decode(wire_payload({"name": "é" * 200, "duration": 5}), cmd)
+    assert cmd.name == "é" * 127
+
+    # Smaller than the JSON the board parses today
+    assert len(wire_payload(payload)) < len(json.dumps(payload))
+    music = music_payload("Queen", "Bohemian Rhapsody", wc)
+    assert len(wire_payload(music)) * 3 < len(json.dumps(music))
+
+    # Only boards whose profile decodes it get binary; everything else stays JSON
+    assert is_wire(board_message(music, wc))
+    assert json.loads(board_message(music, profile_for("bathroom"))) == music
+    assert not is_wire(b'{"name": "x"}') and not is_wire(b"") and not is_wire('{"a": 1}')
+
+    # Cut short / not a wire message: ValueError (on_message reports and acks the error)
+    body = wire_payload(music)
+    for bad in (body[:-1], body[:3], b'{"mode": "preset"}', bytes((0xB1, 0x51, 0))):
+        try:
+            decode(bad, cmd)
+        except ValueError:
+            continue
+        raise AssertionError(bad)
+
+    print("wire tests ok")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,138 @@
+"""
+Drift-free countdown / stopwatch timebase and main-loop deadlines for the MatrixPortal boards
+(displays/*/code.py).
+
+Remaining and elapsed time are computed from an absolute start / deadline in
+time.monotonic_ns(), never by counting update() calls, so a late update() (for example while
+the MQTT loop blocks) delays one redraw but never loses time. tick() reports whether the
+displayed second changed, and next_change_ns() says when it will change next, so the caller
+can sleep until exactly then. Deadlines collects those wake times for the main loop, and Poll
+keeps a periodic blocking poll (MQTT) in it.
+
+Copy next to code.py on the CIRCUITPY drive. Plain Python on purpose (no typing / __future__
+imports), so the same file runs on CircuitPython and in the host test (test_timebase.py).
+"""
+
+NS_PER_S = 1000000000
+
+
+class Countdown:
+    """Whole seconds left until a deadline (rounded up: shows the full duration at the start)."""
+
+    def __init__(self, duration_s, start_ns):
+        self.duration_s = int(duration_s)
+        self.start_ns = start_ns
+        self.deadline_ns = start_ns + self.duration_s * NS_PER_S
+        self.shown = None
+
+    def remaining_s(self, now_ns):
+        left = self.deadline_ns - now_ns
+        if left <= 0:
+            return 0
+        return (left + NS_PER_S - 1) // NS_PER_S
+
+    def next_change_ns(self, now_ns):
+        """monotonic_ns at which remaining_s() next decreases, or None once it reached 0."""
+        remaining = self.remaining_s(now_ns)
+        if remaining <= 0:
+            return None
+        return self.deadline_ns - (remaining - 1) * NS_PER_S
+
+    def tick(self, now_ns):
+        """(remaining_s, changed): changed only when the value differs from the previous tick."""
+        remaining = self.remaining_s(now_ns)
+        changed = remaining != self.shown
+        self.shown = remaining
+        return remaining, changed
+
+
+class Stopwatch:
+    """Whole seconds elapsed since start_ns."""
+
+    def __init__(self, start_ns):
+        self.start_ns = start_ns
+        self.shown = None
+
+    def elapsed_s(self, now_ns):
+        if now_ns <= self.start_ns:
+            return 0
+        return (now_ns - self.start_ns) // NS_PER_S
+
+    def next_change_ns(self, now_ns):
+        return self.start_ns + (self.elapsed_s(now_ns) + 1) * NS_PER_S
+
+    def tick(self, now_ns):
+        """(elapsed_s, changed): changed only when the value differs from the previous tick."""
+        elapsed = self.elapsed_s(now_ns)
+        changed = elapsed != self.shown
+        self.shown = elapsed
+        return elapsed, changed
+
+
+class Deadlines:
+    """
+    Next-deadline table for the cooperative main loop: each subsystem records when it next
+    needs to run (monotonic_ns, None = nothing pending) and the loop sleeps until the earliest.
+    """
+
+    def __init__(self):
+        self.at = {}
+
+    def set(self, name, at_ns):
+        self.at[name] = at_ns
+
+    def set_s(self, name, at_s):
+        """Same as set() for a time.monotonic() value in seconds."""
+        self.at[name] = None if at_s is None else int(at_s * NS_PER_S)
+
+    def due(self, name, now_ns):
+        at = self.at.get(name)
+        return at is not None and now_ns >= at
+
+    def next_ns(self, skip=None):
+        """Earliest deadline (optionally ignoring one subsystem), or None when nothing is pending."""
+        earliest = None
+        for name, at in self.at.items():
+            if at is not None and name != skip and (earliest is None or at < earliest):
+                earliest = at
+        return earliest
+
+    def sleep_s(self, now_ns, max_s):
+        """Seconds to sleep until the earliest deadline, between 0 and max_s."""
+        earliest = self.next_ns()
+        if earliest is None:
+            return max_s
+        wait = (earliest - now_ns) / NS_PER_S
+        if wait <= 0:
+            return 0
+        return wait if wait < max_s else max_s
+
+
+class Poll:
+    """
+    A periodic poll that blocks for up to slot_ns (mqtt loop()), kept in a Deadlines table under name.
+    It runs when due, preferably in a gap of at least slot_ns before the next other deadline, and at
+    the latest one period late. While put off, its table entry is that forced time (not the past due
+    time), so sleep_s() still sleeps until the next other deadline instead of returning 0.
+    """
+
+    def __init__(self, deadlines, name, period_ns, slot_ns, now_ns):
+        self.deadlines = deadlines
+        self.name = name
+        self.period_ns = period_ns
+        self.slot_ns = slot_ns
+        self.due_ns = now_ns
+        deadlines.set(name, now_ns)
+
+    def should_run(self, now_ns):
+        if now_ns < self.due_ns:
+            return False
+        gap = self.deadlines.next_ns(skip=self.name)
+        if gap is None or gap - now_ns >= self.slot_ns or now_ns - self.due_ns >= self.period_ns:
+            return True
+        self.deadlines.set(self.name, self.due_ns + self.period_ns)
+        return False
+
+    def ran(self, now_ns):
+        self.due_ns = now_ns + self.period_ns
+        self.deadlines.set(self.name, self.due_ns)
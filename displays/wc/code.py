@@ -7,8 +7,15 @@ import displayio
 import os
 import supervisor
 import microcontroller
+from timebase import Countdown, Deadlines, Poll, Stopwatch, NS_PER_S
+from marquee import LayoutCache, Marquee, font_metrics
+from screen import Screen
+from telemetry import Telemetry
+from wire import MODE_PRESET, MODE_TIMER, SCROLL_X, WIRE_VERSION, Command, decode, is_wire
 from adafruit_matrixportal.matrixportal import MatrixPortal
 from adafruit_display_text.label import Label
+from adafruit_bitmap_font import bitmap_font
+from adafruit_ticks import ticks_add, ticks_diff, ticks_ms
 import adafruit_minimqtt.adafruit_minimqtt as MQTT
 from adafruit_esp32spi import adafruit_esp32spi_socketpool
 
@@ -26,24 +33,66 @@ FINAL_COUNTDOWN = 10    # When to start running ants animation
 STOPWATCH_TEXT = "STOPWATCH"  # Text to display during stopwatch mode
 RECONNECT_DELAY = 5     # Seconds to wait between reconnection attempts
 MAX_FAILED_PINGS = 3    # Maximum failed ping attempts before reconnecting
+# MQTT reconnect runs as a state machine, one step per update(); these waits replace time.sleep()
+MQTT_SETTLE_S = 1.0          # after dropping a dead socket, before connecting again
+MQTT_SUBSCRIBE_DELAY_S = 0.5 # after CONNACK, before subscribing
+OUTBOX_SIZE = 16             # status / ack messages kept while offline
+OUTBOX_FLUSH_MAX = 4         # publishes per update() so a backlog never stalls the display
+MQTT_POLL_S = 0.25           # how often the main loop reads MQTT (message latency bound)
+MQTT_POLL_TIMEOUT_S = 0.1    # mqtt loop() / socket timeout: the longest a poll blocks the display
+LOOP_MAX_SLEEP_S = 1.0       # main loop sleep cap when no deadline is pending
+TELEMETRY_DEGRADED_QUALITY = 90  # message success rate (%) below which reports come every 10 s
+FIRMWARE_VERSION = "1.1.0"
+TRIGGER_CHECK_S = 1          # test_trigger.json check interval while idle
+# Main-loop deadlines redrawn by update() (the loop also schedules "mqtt" and "health")
+DISPLAY_TASKS = ("timer", "preset", "border", "marquee", "lyrics", "trigger")
 
 # Colors
 RED = 0xFF0000
 WHITE = 0xFFFFFF
 BLACK = 0x000000
 
+# Blank screen (preset expired, nothing running); radio symbol left as it is
+IDLE_SCREEN = {"background": BLACK, "border_mode": "none", "top": ("text", "", 8), "bottom": ("text", "", 20)}
+
+# Border effects: palette indices 1..BORDER_PHASES repeat around the 188-pixel perimeter
+# (188 % 4 == 0, so patterns wrap without a seam). Presets name an effect as "border_mode".
+BORDER_PHASES = 4
+# name: (seconds per frame, frames); a frame is the level (0-255) of each palette index, or
+# "rainbow" (hue wheel rotating around the border). Level 0 = pixel off.
+BORDER_EFFECTS = {
+    "none": (0, ((0, 0, 0, 0),)),
+    "solid": (0, ((255, 255, 255, 255),)),
+    "animated": (0.2, ((255, 0, 255, 0), (0, 255, 0, 255))),  # running ants
+    "blinking": (0.5, ((255, 0, 255, 0), (0, 0, 0, 0))),  # dashed on / off
+    "chase": (0.08, ((255, 96, 24, 0), (0, 255, 96, 24), (24, 0, 255, 96), (96, 24, 0, 255))),
+    "pulse": (0.08, tuple((v, v, v, v) for v in (40, 80, 130, 190, 255, 190, 130, 80))),
+    "rainbow": (0.1, "rainbow"),
+}
+BORDER_RAINBOW_FRAMES = 16
+
 # Music: terminalio glyphs ~6px wide; scroll only lines wider than the inner band.
 TEXT_PIXELS_PER_CHAR = 6
+# Measured (font, text) layouts kept for centering / scroll decisions (oldest replaced first)
+LAYOUT_CACHE_SIZE = 16
 # Pink margin on left and right of the black text band (symmetric, ~2px each).
 MUSIC_H_MARGIN = 2
 MUSIC_INNER_W = DISPLAY_WIDTH - 2 * MUSIC_H_MARGIN
 # 10 × 6px = 60px fills inner band exactly (no extra internal pad → no wide pink gap on the right).
 MUSIC_SCROLL_MAX_CHARS = MUSIC_INNER_W // TEXT_PIXELS_PER_CHAR
-MUSIC_MARQUEE_CHAR_S = 0.1 # target seconds per marquee step (tune with MAX_STEPS below)
-# Catch-up cap per update(): high = fast scroll after mqtt blocks (can look "jumpy"); lower = smoother.
-MUSIC_MARQUEE_MAX_STEPS = 3
+# Scrolling rows (music lines, long preset names and timer titles), see marquee.py.
+SCROLL_FONT_PATH = "/lib/fonts/font.pcf"  # FreeSans 8 px; terminalio.FONT if it does not load
+SCROLL_MS_PER_PX = 25        # 40 px/s whatever the loop rate (position follows elapsed time)
+SCROLL_FRAME_MS = 33         # at most ~30 redraws per second
+SCROLL_GAP_PX = 3 * TEXT_PIXELS_PER_CHAR  # blank run between the end and the start again
+# Strip: longest bridge line (64 chars) + gap + one band width, as 1-bit pixels (~700 bytes)
+SCROLL_STRIP_W = 64 * TEXT_PIXELS_PER_CHAR + SCROLL_GAP_PX + MUSIC_INNER_W
 # Song row lower than countdown timer row (y=20) for clearer two-line music layout.
 MUSIC_SONG_LINE_Y = 23
+# Lyrics mode: frames (start_ms, top row, bottom row) precomputed by the Spotify bridge
+LYRICS_RING_SIZE = 8
+LYRICS_TOP_Y = 8
+LYRICS_BOTTOM_Y = MUSIC_SONG_LINE_Y
 
 # Enable serial output for debugging
 try:
@@ -64,11 +113,9 @@ class DisplayText:
         self.title_label = None
         self.timer_label = None
         self.text_group = displayio.Group()
-        self.last_lengths = {}  # Cache for text lengths
-        self.last_positions = {}  # Cache for calculated positions
-        # id(Label) -> marquee state for music lines (artist + song)
-        self._marquees = {}
+        self.layouts = LayoutCache(LAYOUT_CACHE_SIZE)  # (font, text) -> measured width / glyph run
         self.setup_text()
+        self.setup_marquees()
         
     def setup_text(self):
         """Initialize and create text labels"""
@@ -107,30 +154,43 @@ class DisplayText:
         label.padding_left = self.LABEL_PAD_DEFAULT
         label.padding_right = self.LABEL_PAD_DEFAULT
 
-    def _layout_music_marquee_label(self, label):
-        """Black band fills MUSIC_INNER_W at x=MUSIC_H_MARGIN; split leftover pad inside label."""
-        gw = MUSIC_SCROLL_MAX_CHARS * TEXT_PIXELS_PER_CHAR
-        extra = MUSIC_INNER_W - gw
-        if extra < 0:
-            extra = 0
-        label.padding_left = extra // 2
-        label.padding_right = extra - label.padding_left
+    def setup_marquees(self):
+        """
+        One preallocated Marquee per text row (title, timer/song), each shown by a hidden TileGrid
+        over the inner band. Text is rendered into it once per message; frames only blit.
+        """
+        try:
+            self.scroll_font = bitmap_font.load_font(SCROLL_FONT_PATH)
+        except Exception as e:
+            print(f"Scroll font {SCROLL_FONT_PATH} not loaded ({e}), using terminalio")
+            self.scroll_font = terminalio.FONT
+        height = font_metrics(self.scroll_font)[1]
+        self._marquee_rows = ()
+        self._marquee_for = {}
+        for label in (self.title_label, self.timer_label):
+            m = Marquee(MUSIC_INNER_W, height, SCROLL_STRIP_W)
+            m.palette = displayio.Palette(2)
+            m.palette[0] = BLACK
+            m.palette[1] = WHITE
+            m.tilegrid = displayio.TileGrid(m.view, pixel_shader=m.palette, x=MUSIC_H_MARGIN, y=0)
+            m.tilegrid.hidden = True
+            self.text_group.append(m.tilegrid)
+            self._marquee_rows += (m,)
+            self._marquee_for[id(label)] = m
+
+    def _stop_marquee(self, label):
+        m = self._marquee_for.get(id(label))
+        if m is not None and m.active:
+            m.active = False
+            m.tilegrid.hidden = True
+
+    def text_width(self, text, font=None):
+        """Measured pixel width of text in font (label font by default), from the layout cache"""
+        return self.layouts.width(font or terminalio.FONT, text)
 
     def center_text_position(self, text):
         """Calculate x position to center text"""
-        # Use cached position if text length hasn't changed
-        text_len = len(text)
-        if text_len in self.last_positions:
-            return self.last_positions[text_len]
-            
-        # Calculate new position
-        text_width = text_len * 6
-        center_pos = (DISPLAY_WIDTH - text_width) // 2
-        print(f"Calculating new position for text: '{text}' width={text_width} pos={center_pos}")
-        
-        # Cache the result
-        self.last_positions[text_len] = center_pos
-        return center_pos
+        return (DISPLAY_WIDTH - self.text_width(text)) // 2
     
     def _remove_scrolling_attachment(self, label):
         """Detach ScrollingLabel from this row if present."""
@@ -144,12 +204,16 @@ class DisplayText:
     def clear_scrolling_state(self):
         self._remove_scrolling_attachment(self.title_label)
         self._remove_scrolling_attachment(self.timer_label)
-        self._marquees.clear()
+        self._stop_marquee(self.title_label)
+        self._stop_marquee(self.timer_label)
 
     def update_text(self, text, label, y_position):
-        """Static centered text; removes any ScrollingLabel on this row."""
+        """Centered text; wider than the band (long preset names, timer titles) goes to the scroller."""
         self._remove_scrolling_attachment(label)
-        self._marquees.pop(id(label), None)
+        self._stop_marquee(label)
+        if self.text_width(text) > MUSIC_INNER_W:
+            self._start_marquee(label, text, y_position)
+            return
         self._reset_label_padding(label)
         if text != label.text:
             label.x = self.center_text_position(text)
@@ -157,13 +221,19 @@ class DisplayText:
         label.text = text
         label.y = y_position
 
+    def set_text_color(self, color):
+        """Both rows, including a marquee already showing (its palette took the label color)"""
+        self.title_label.color = color
+        self.timer_label.color = color
+        for m in self._marquee_rows:
+            m.palette[1] = color
+
     def set_marquee_line(self, text, label, y_position):
-        """Music row: center if it fits; else Label-only character marquee (no BitmapLabel)."""
+        """Music row: center if it fits; else the pixel scroller (glyphs rendered once, see marquee.py)."""
         self._remove_scrolling_attachment(label)
-        lid = id(label)
-        self._marquees.pop(lid, None)
+        self._stop_marquee(label)
 
-        tw = len(text) * TEXT_PIXELS_PER_CHAR
+        tw = self.text_width(text)
         if tw <= MUSIC_INNER_W:
             self._reset_label_padding(label)
             label.text = text
@@ -171,71 +241,119 @@ class DisplayText:
             label.x = MUSIC_H_MARGIN + (MUSIC_INNER_W - tw) // 2
             return
 
-        sep = "   "
-        loop = text + sep
-        max_ch = MUSIC_SCROLL_MAX_CHARS
-        dbl = loop + loop
-        self._layout_music_marquee_label(label)
-        self._marquees[lid] = {
-            "label": label,
-            "loop": loop,
-            "idx": 0,
-            # Slightly in the past so the first tick_music_marquees() always advances.
-            "next_t": time.monotonic() - MUSIC_MARQUEE_CHAR_S,
-        }
-        label.text = dbl[0:max_ch]
-        label.x = MUSIC_H_MARGIN
+        self._start_marquee(label, text, y_position)
+
+    def set_rendered_line(self, text, x, label, y_position):
+        """Music row precomputed by the bridge / Flask (spotify/board_render.py): no string work here."""
+        self._remove_scrolling_attachment(label)
+        self._stop_marquee(label)
+        if x is None:
+            # Too wide for the band: scroll it
+            self._start_marquee(label, text, y_position)
+            return
+        self._reset_label_padding(label)
+        label.text = text
         label.y = y_position
+        label.x = x
 
-    def tick_music_marquees(self, now):
-        """Advance marquee; multiple steps per call when update() is late (e.g. mqtt loop blocks)."""
-        max_ch = MUSIC_SCROLL_MAX_CHARS
-        dt = MUSIC_MARQUEE_CHAR_S
-        if dt < 0.001:
-            dt = 0.001
-        for lid in list(self._marquees.keys()):
+    def set_lyric_row(self, text, label, y_position):
+        """Lyrics row (already wrapped to MUSIC_SCROLL_MAX_CHARS by the bridge): center, no logging."""
+        self._stop_marquee(label)
+        label.text = text
+        label.y = y_position
+        label.x = MUSIC_H_MARGIN + (MUSIC_INNER_W - self.text_width(text)) // 2
+
+    def _start_marquee(self, label, text, y_position):
+        """
+        Show text on the row's Marquee in the scroll font instead of the label: centered if it
+        fits the band in that font, otherwise scrolling from now on.
+        """
+        m = self._marquee_for[id(label)]
+        label.text = ""
+        m.palette[1] = label.color
+        if hasattr(self.scroll_font, "load_glyphs"):
+            # One pass over the font file instead of one lookup per glyph
+            self.scroll_font.load_glyphs(text)
+        m.render(self.scroll_font, self.layouts.get(self.scroll_font, text), SCROLL_GAP_PX, SCROLL_MS_PER_PX)
+        # Label y is the vertical center of the text
+        m.tilegrid.y = y_position - m.height // 2
+        m.tilegrid.hidden = False
+        m.active = True
+        m.start_ms = ticks_ms()
+
+    def next_marquee_time(self):
+        """monotonic() of the next scroll pixel (at most one frame per SCROLL_FRAME_MS), or None"""
+        now_ms = ticks_ms()
+        wait = None
+        for m in self._marquee_rows:
+            if m.active and m.loop_w:
+                w = m.ms_to_next_px(ticks_diff(now_ms, m.start_ms))
+                if w < SCROLL_FRAME_MS:
+                    w = SCROLL_FRAME_MS
+                if wait is None or w < wait:
+                    wait = w
+        if wait is None:
+            return None
+        return time.monotonic() + wait / 1000
+
+    def tick_marquees(self, now_ms):
+        """
+        Scroll each row to where elapsed time says it should be (pixel-smooth, same speed however
+        late update() is). Allocation-free: a blit from the prerendered strip per moved frame.
+        """
+        for m in self._marquee_rows:
+            if not m.active or not m.loop_w:
+                continue
             try:
-                st = self._marquees[lid]
-                loop = st["loop"]
-                if not loop or len(loop) < 1:
-                    continue
-                overdue = now - st["next_t"]
-                if overdue < 0:
-                    continue
-                wanted = int(overdue / dt) + 1
-                steps = wanted
-                if steps > MUSIC_MARQUEE_MAX_STEPS:
-                    steps = MUSIC_MARQUEE_MAX_STEPS
-                st["next_t"] += steps * dt
-                if st["next_t"] < now:
-                    st["next_t"] = now + dt
-                label = st["label"]
-                st["idx"] = (st["idx"] + steps) % len(loop)
-                dbl = loop + loop
-                i = st["idx"]
-                chunk = dbl[i : i + max_ch]
-                if len(chunk) < max_ch:
-                    chunk = chunk + dbl[: max_ch - len(chunk)]
-                label.text = chunk[:max_ch]
+                elapsed = ticks_diff(now_ms, m.start_ms)
+                if elapsed >= m.loop_ms:
+                    # Restart the clock every loop so elapsed stays a small int
+                    elapsed %= m.loop_ms
+                    m.start_ms = ticks_add(now_ms, -elapsed)
+                m.scroll_to(elapsed)
             except Exception as e:
-                print(f"tick_music_marquees: {e}")
-                self._marquees.pop(lid, None)
+                print(f"tick_marquees: {e}")
+                m.active = False
+                m.tilegrid.hidden = True
 
 class BorderManager:
+    """
+    Palette-cycling border: the perimeter is drawn once with palette indices 1..BORDER_PHASES
+    repeating along it, everything else is index 0. An effect (BORDER_EFFECTS) is a list of
+    frames precomputed into palette colors when the effect or color changes, so each animation
+    frame is BORDER_PHASES palette writes and no bitmap pixel is ever rewritten.
+    """
     def __init__(self, matrixportal):
         self.matrixportal = matrixportal
         self.animation_step = 0
-        self.current_mode = "none"  # none, solid, animated, blinking
+        self.current_mode = "none"  # a BORDER_EFFECTS name
+        self.color = RED
+        self.frames = ((None,) * BORDER_PHASES,)
+        self.frame_interval = 0
         self.last_animation_update = time.monotonic()
         self.setup_border()
         
     def setup_border(self):
-        """Initialize border display elements"""
-        self.border_bitmap = displayio.Bitmap(DISPLAY_WIDTH, DISPLAY_HEIGHT, 2)
-        self.border_palette = displayio.Palette(2)
-        self.border_palette.make_transparent(0)  # Make index 0 transparent
-        self.border_palette[0] = 0x000000  # Black (will be transparent)
-        self.border_palette[1] = RED   # Initial border color
+        """Initialize border display elements (the only place border pixels are written)"""
+        self.border_bitmap = displayio.Bitmap(DISPLAY_WIDTH, DISPLAY_HEIGHT, BORDER_PHASES + 1)
+        self.border_palette = displayio.Palette(BORDER_PHASES + 1)
+        self.border_palette[0] = BLACK
+        self.border_palette.make_transparent(0)  # Index 0 is see-through (background shows)
+        i = 0
+        # Clockwise from the top-left corner, so effects run around the border
+        for x in range(DISPLAY_WIDTH):
+            self.border_bitmap[x, 0] = 1 + i % BORDER_PHASES
+            i += 1
+        for y in range(1, DISPLAY_HEIGHT):
+            self.border_bitmap[DISPLAY_WIDTH-1, y] = 1 + i % BORDER_PHASES
+            i += 1
+        for x in range(DISPLAY_WIDTH-2, -1, -1):
+            self.border_bitmap[x, DISPLAY_HEIGHT-1] = 1 + i % BORDER_PHASES
+            i += 1
+        for y in range(DISPLAY_HEIGHT-2, 0, -1):
+            self.border_bitmap[0, y] = 1 + i % BORDER_PHASES
+            i += 1
+        self.clear_pixels()
         
         self.border_grid = displayio.TileGrid(
             self.border_bitmap,
@@ -244,180 +362,199 @@ class BorderManager:
         
         self.border_group = displayio.Group()
         self.border_group.append(self.border_grid)
-        
-    def draw_pixel(self, x, y, on=True):
-        """Draw a single border pixel"""
-        if 0 <= x < DISPLAY_WIDTH and 0 <= y < DISPLAY_HEIGHT:
-            self.border_bitmap[x, y] = 1 if on else 0
+
+    def _set_entry(self, index, color):
+        """Palette index to color; None = off (same as index 0)"""
+        if color is None:
+            self.border_palette.make_transparent(index)
+        else:
+            self.border_palette[index] = color
+            self.border_palette.make_opaque(index)
+
+    def _apply(self, frame):
+        for k in range(BORDER_PHASES):
+            self._set_entry(k + 1, frame[k])
+
+    def _scale(self, level):
+        if level <= 0:
+            return None
+        if level >= 255:
+            return self.color
+        c = self.color
+        r = ((c >> 16) & 0xFF) * level // 255
+        g = ((c >> 8) & 0xFF) * level // 255
+        return (r << 16) | (g << 8) | ((c & 0xFF) * level // 255)
+
+    def _wheel(self, pos):
+        """Hue wheel 0-255 -> 0xRRGGBB (full saturation)"""
+        pos &= 0xFF
+        if pos < 85:
+            return ((255 - pos * 3) << 16) | ((pos * 3) << 8)
+        if pos < 170:
+            pos -= 85
+            return ((255 - pos * 3) << 8) | (pos * 3)
+        pos -= 170
+        return ((pos * 3) << 16) | (255 - pos * 3)
+
+    def _build_frames(self):
+        """Precompute the current effect's frames as palette colors (on effect / color change only)"""
+        interval, levels = BORDER_EFFECTS[self.current_mode]
+        self.frame_interval = interval
+        if levels == "rainbow":
+            step = 256 // BORDER_RAINBOW_FRAMES
+            self.frames = tuple(
+                tuple(self._wheel(k * 256 // BORDER_PHASES + f * step) for k in range(BORDER_PHASES))
+                for f in range(BORDER_RAINBOW_FRAMES)
+            )
+        else:
+            self.frames = tuple(tuple(self._scale(v) for v in frame) for frame in levels)
+
+    def set_effect(self, name):
+        """Start a named border effect (BORDER_EFFECTS); False if the name is unknown"""
+        if name not in BORDER_EFFECTS:
+            print(f"Unknown border effect: {name}")
+            return False
+        if name == self.current_mode and self.frame_interval:
+            return True  # Already animating: keep the phase (countdown re-sends "animated" every second)
+        self.current_mode = name
+        self.animation_step = 0
+        self.last_animation_update = time.monotonic()
+        self._build_frames()
+        self._apply(self.frames[0])
+        return True
+
+    def set_color(self, color):
+        """Border color for all effects (except rainbow); applied to the frame showing now"""
+        self.color = color
+        self._build_frames()
+        self._apply(self.frames[self.animation_step % len(self.frames)])
             
     def clear_pixels(self):
-        """Clear all border pixels without changing mode"""
-        for i in range(DISPLAY_WIDTH):
-            for j in range(DISPLAY_HEIGHT):
-                self.border_bitmap[i, j] = 0
+        """Hide all border pixels without changing mode"""
+        self._apply((None,) * BORDER_PHASES)
                 
     def clear_border(self):
         """Clear border and reset mode"""
-        self.current_mode = "none"
-        self.clear_pixels()
+        self.set_effect("none")
                 
     def set_dashed(self):
-        """Set dashed border"""
-        self.clear_pixels()
-        for x in range(DISPLAY_WIDTH):
-            if x % 2 == 0:  # Only draw every other pixel for dashed effect
-                self.draw_pixel(x, 0)
-                self.draw_pixel(x, DISPLAY_HEIGHT-1)
-        for y in range(DISPLAY_HEIGHT):
-            if y % 2 == 0:  # Only draw every other pixel for dashed effect
-                self.draw_pixel(0, y)
-                self.draw_pixel(DISPLAY_WIDTH-1, y)
+        """Set dashed border (every other perimeter pixel), without changing mode"""
+        self._apply((self.color, None) * (BORDER_PHASES // 2))
 
     def set_solid_border(self):
         """Set solid continuous border"""
-        self.current_mode = "solid"
-        self.clear_pixels()
-        # Draw continuous lines for all border pixels
-        for x in range(DISPLAY_WIDTH):
-            self.draw_pixel(x, 0)  # Top border
-            self.draw_pixel(x, DISPLAY_HEIGHT-1)  # Bottom border
-        for y in range(DISPLAY_HEIGHT):
-            self.draw_pixel(0, y)  # Left border
-            self.draw_pixel(DISPLAY_WIDTH-1, y)  # Right border
+        self.set_effect("solid")
             
     def set_animated(self):
-        """Switch to animated border mode"""
-        self.current_mode = "animated"
-        self.animation_step = 0
+        """Switch to animated border mode (running ants)"""
+        self.set_effect("animated")
             
     def set_blinking(self):
         """Switch to blinking border mode"""
-        self.current_mode = "blinking"
-        self.animation_step = 0
+        self.set_effect("blinking")
+
+    def next_frame_time(self):
+        """monotonic() of the next animation frame, or None for a static effect"""
+        if not self.frame_interval or len(self.frames) < 2:
+            return None
+        return self.last_animation_update + self.frame_interval
 
     def update_animation(self, current_time):
-        """Update border animation based on current mode"""
-        if self.current_mode == "none" or self.current_mode == "solid":
+        """Advance the current effect by one frame when due: BORDER_PHASES palette writes"""
+        if not self.frame_interval or len(self.frames) < 2:
             return
-            
-        # Only update animations every 0.2 seconds for animated, 0.5 for blinking
-        animation_interval = 0.2 if self.current_mode == "animated" else 0.5
-        if (current_time - self.last_animation_update) < animation_interval:
+        if (current_time - self.last_animation_update) < self.frame_interval:
             return
             
         self.last_animation_update = current_time
-        
-        if self.current_mode == "animated":
-            self.animation_step = (self.animation_step + 1) % 2
-            self.clear_pixels()  # Don't change mode when clearing for animation
-            for i in range(DISPLAY_WIDTH + DISPLAY_HEIGHT * 2):
-                if (i + self.animation_step) % 2 == 0:
-                    if i < DISPLAY_WIDTH:
-                        self.draw_pixel(i, 0)
-                        self.draw_pixel(i, DISPLAY_HEIGHT-1)
-                    else:
-                        pos = i - DISPLAY_WIDTH
-                        if pos < DISPLAY_HEIGHT:
-                            self.draw_pixel(DISPLAY_WIDTH-1, pos)
-                        else:
-                            self.draw_pixel(0, pos - DISPLAY_HEIGHT)
-        elif self.current_mode == "blinking":
-            self.animation_step = (self.animation_step + 1) % 2
-            if self.animation_step == 0:
-                self.set_dashed()
-            else:
-                self.clear_pixels()  # Don't change mode when clearing for animation
+        self.animation_step = (self.animation_step + 1) % len(self.frames)
+        self._apply(self.frames[self.animation_step])
 
 class TimerManager:
+    """Countdown -> DONE -> stopwatch, computed from absolute monotonic_ns times (timebase.py)"""
     def __init__(self):
         self.current_countdown = None
         self.stopwatch_start = None
         self.done_start = None
-        self.last_second = None
+        self.countdown_clock = None
+        self.stopwatch_clock = None
         
     def start_countdown(self, name, duration):
         """Start a new countdown"""
         if not isinstance(duration, (int, float)) or duration <= 0:
             return False
             
+        self.countdown_clock = Countdown(duration, time.monotonic_ns())
         self.current_countdown = {
             "name": name,
             "duration": int(duration),
             "remaining": int(duration)
         }
-        self.last_second = time.monotonic()
+        self.stopwatch_clock = None
         self.stopwatch_start = None
         self.done_start = None
         return True
+
+    def clear(self):
+        """Stop the countdown / stopwatch (no more timer deadlines until the next start_countdown)"""
+        self.current_countdown = None
+        self.countdown_clock = None
+        self.stopwatch_start = None
+        self.stopwatch_clock = None
+        self.done_start = None
+
+    def next_change_ns(self):
+        """monotonic_ns of the next displayed-second change (None: nothing running)"""
+        now = time.monotonic_ns()
+        if self.current_countdown:
+            if self.done_start:
+                return self.done_start + DONE_DISPLAY_TIME * NS_PER_S
+            return self.countdown_clock.next_change_ns(now) or now
+        if self.stopwatch_clock:
+            return self.stopwatch_clock.next_change_ns(now)
+        return None
         
     def update_countdown(self, current_time):
-        """Update countdown state"""
+        """Update countdown state (current_time is unused: time comes from monotonic_ns)"""
         if not self.current_countdown:
             return None
-            
-        # Only update when a full second has passed
-        if current_time - self.last_second >= 1.0:
-            # Decrement remaining time
-            self.current_countdown["remaining"] -= 1
-            self.last_second = current_time
-            
-            if self.current_countdown["remaining"] > 0:
-                return {
-                    "type": "countdown",
-                    "name": self.current_countdown["name"],
-                    "minutes": self.current_countdown["remaining"] // 60,
-                    "seconds": self.current_countdown["remaining"] % 60,
-                    "remaining": self.current_countdown["remaining"],
-                    "update": True
-                }
-            else:
-                if not self.done_start:  # Only set done_start once when first entering DONE state
-                    self.done_start = current_time
-                    self.last_second = current_time
-                    return {"type": "done", "first": True}
-                elif current_time - self.done_start >= DONE_DISPLAY_TIME:
-                    self.stopwatch_start = current_time
-                    self.last_second = current_time
-                    self.current_countdown = None
-                    self.done_start = None
-                    return {"type": "stopwatch_start"}
-                return {"type": "done", "first": False}
-                
-        elif self.current_countdown["remaining"] > 0:
+
+        now = time.monotonic_ns()
+        remaining, changed = self.countdown_clock.tick(now)
+        self.current_countdown["remaining"] = remaining
+        if remaining > 0:
             return {
                 "type": "countdown",
                 "name": self.current_countdown["name"],
-                "minutes": self.current_countdown["remaining"] // 60,
-                "seconds": self.current_countdown["remaining"] % 60,
-                "remaining": self.current_countdown["remaining"],
-                "update": False
+                "minutes": remaining // 60,
+                "seconds": remaining % 60,
+                "remaining": remaining,
+                "update": changed
             }
-            
+
+        # DONE for DONE_DISPLAY_TIME from the deadline itself (not from when update() noticed)
+        if not self.done_start:
+            self.done_start = self.countdown_clock.deadline_ns
+            return {"type": "done", "first": True}
+        if now - self.done_start >= DONE_DISPLAY_TIME * NS_PER_S:
+            self.stopwatch_clock = Stopwatch(self.done_start + DONE_DISPLAY_TIME * NS_PER_S)
+            self.stopwatch_start = self.stopwatch_clock.start_ns
+            self.current_countdown = None
+            self.done_start = None
+            return {"type": "stopwatch_start"}
         return {"type": "done", "first": False}
             
     def update_stopwatch(self, current_time):
-        """Update stopwatch state"""
-        if self.stopwatch_start is None:
+        """Update stopwatch state (current_time is unused: time comes from monotonic_ns)"""
+        if self.stopwatch_start is None or self.stopwatch_clock is None:
             return None
             
-        elapsed_time = current_time - self.stopwatch_start
-        elapsed_seconds = int(elapsed_time)
-        
-        # Only trigger update when a full second has passed
-        if current_time - self.last_second >= 1.0:
-            self.last_second = current_time
-            return {
-                "type": "stopwatch",
-                "minutes": elapsed_seconds // 60,
-                "seconds": elapsed_seconds % 60,
-                "update": True
-            }
-            
+        elapsed_seconds, changed = self.stopwatch_clock.tick(time.monotonic_ns())
         return {
             "type": "stopwatch",
             "minutes": elapsed_seconds // 60,
             "seconds": elapsed_seconds % 60,
-            "update": False
+            "update": changed
         }
 
 class PresetManager:
@@ -537,17 +674,143 @@ class PresetManager:
             "config": self.presets[self.current_preset]
         }
         
+    def end_time(self):
+        """monotonic() when the current preset expires, or None"""
+        if not self.current_preset or not self.preset_duration:
+            return None
+        return self.preset_start + self.preset_duration
+
     def clear_preset(self):
         """Clear current preset"""
         self.current_preset = None
         self.preset_start = None
         self.preset_duration = None
 
+class LyricsManager:
+    """
+    Timed lyric frames in a fixed ring (no per-message list growth). The bridge sends a few frames
+    at a time with the playback position; the board keeps time itself with monotonic_ns.
+    """
+    def __init__(self, size=LYRICS_RING_SIZE):
+        self.size = size
+        self.times = [0] * size
+        self.tops = [""] * size
+        self.bottoms = [""] * size
+        self.clear()
+
+    def clear(self):
+        self.active = False
+        self.track_uri = None
+        self.start = 0
+        self.count = 0
+        self.playing = False
+        self.anchor_ms = 0
+        self.anchor_ns = 0
+        self.shown = -1
+
+    def load(self, data, now_ns):
+        """Apply one JSON lyrics message: "r" replaces the frames, otherwise newer frames are appended."""
+        self.begin(data.get("u"), data.get("r"), int(data.get("p") or 0), bool(data.get("pl")), now_ns)
+        for frame in data.get("f") or ():
+            try:
+                t = int(frame[0])
+                top = str(frame[1])
+                bottom = str(frame[2]) if len(frame) > 2 else ""
+            except (TypeError, ValueError, IndexError):
+                continue
+            self.add(t, top, bottom)
+
+    def begin(self, uri, reset, progress_ms, playing, now_ns):
+        """Start applying a lyrics message: re-anchor the clock; reset or another track empties the ring."""
+        if reset or uri != self.track_uri:
+            self.start = 0
+            self.count = 0
+            self.shown = -1
+        self.active = True
+        self.track_uri = uri
+        self.anchor_ms = progress_ms
+        self.anchor_ns = now_ns
+        self.playing = playing
+
+    def add(self, t, top, bottom):
+        """Queue one frame (ignored unless newer than the last one queued)."""
+        if self.count and t <= self.times[(self.start + self.count - 1) % self.size]:
+            return
+        if self.count == self.size:
+            # Full: drop the oldest frame (already shown)
+            self.start = (self.start + 1) % self.size
+            self.count -= 1
+            self.shown -= 1
+        slot = (self.start + self.count) % self.size
+        self.times[slot] = t
+        self.tops[slot] = top
+        self.bottoms[slot] = bottom
+        self.count += 1
+
+    def progress_ms(self, now_ns):
+        if not self.playing:
+            return self.anchor_ms
+        return self.anchor_ms + (now_ns - self.anchor_ns) // 1000000
+
+    def current(self, now_ns):
+        """Index (0..count-1, oldest first) of the frame playing now, or -1 before the first one."""
+        progress = self.progress_ms(now_ns)
+        i = self.count - 1
+        while i >= 0 and self.times[(self.start + i) % self.size] > progress:
+            i -= 1
+        return i
+
+    def next_change_ns(self, now_ns):
+        """monotonic_ns when the frame after the current one starts (None: paused or no frame queued)"""
+        if not self.active or not self.playing:
+            return None
+        i = self.current(now_ns) + 1
+        if i >= self.count:
+            return None
+        return self.anchor_ns + (self.times[(self.start + i) % self.size] - self.anchor_ms) * 1000000
+
+    def rows(self, i):
+        slot = (self.start + i) % self.size
+        return self.tops[slot], self.bottoms[slot]
+
+class OutboxRing:
+    """Fixed-size FIFO of (topic, payload) waiting for the broker; the oldest entry is dropped when full."""
+    def __init__(self, size=OUTBOX_SIZE):
+        self.size = size
+        self.topics = [None] * size
+        self.payloads = [None] * size
+        self.start = 0
+        self.count = 0
+        self.dropped = 0
+
+    def push(self, topic, payload, coalesce=False):
+        """coalesce: overwrite the newest entry if it is for the same topic (periodic status)."""
+        if coalesce and self.count:
+            last = (self.start + self.count - 1) % self.size
+            if self.topics[last] == topic:
+                self.payloads[last] = payload
+                return
+        if self.count == self.size:
+            self.pop()
+            self.dropped += 1
+        slot = (self.start + self.count) % self.size
+        self.topics[slot] = topic
+        self.payloads[slot] = payload
+        self.count += 1
+
+    def peek(self):
+        return self.topics[self.start], self.payloads[self.start]
+
+    def pop(self):
+        self.topics[self.start] = None
+        self.payloads[self.start] = None
+        self.start = (self.start + 1) % self.size
+        self.count -= 1
+
 class CountdownDisplay:
     def __init__(self):
         # Initialize connection management variables first
         self.last_wifi_check = 0
-        self.last_mqtt_check = 0
         self.wifi_retry_count = 0
         self.mqtt_retry_count = 0
         self.max_retry_interval = 300  # Maximum retry interval in seconds
@@ -558,14 +821,25 @@ class CountdownDisplay:
         self.startup_time = time.monotonic()
         
         # Add connection quality monitoring
-        self.last_heartbeat = 0
-        self.heartbeat_interval = 30  # Send heartbeat every 30 seconds
+        # Errors / health events are recorded here and sent as one combined status report
+        # (telemetry.py: every 10 s while degraded, backing off to 5 min while healthy)
+        self.telemetry = Telemetry(time.monotonic())
         self.last_message_received = 0
         self.connection_quality = 100  # Track connection quality (percentage)
         self.message_counter = 0  # Track total messages
         self.failed_message_counter = 0  # Track failed messages
         # Never mqtt.publish from on_message — can deadlock / block loop() on ESP32SPI.
-        self._mqtt_ack_queue = []
+        # Everything outbound goes through this ring and is flushed after loop() while connected.
+        self.outbox = OutboxRing()
+        # Reused for every binary (wire.py) message
+        self.command = Command(LYRICS_RING_SIZE)
+        # Reconnect state machine: "connected", "teardown", "connecting", "subscribing"
+        self.mqtt_state = "connecting"
+        self.mqtt_next_step = 0
+        # Next wake time per subsystem; run() sleeps until the earliest one
+        self.deadlines = Deadlines()
+        # What is on screen, so a message only redraws the elements it changes
+        self.screen = Screen()
 
         print("Initializing display...")
         try:
@@ -593,7 +867,7 @@ class CountdownDisplay:
                 "ip": self.matrixportal.network.ip_address,
                 "ssid": secrets['ssid'],
                 "reset_cause": str(microcontroller.cpu.reset_reason),
-                "firmware_version": "1.1.0"
+                "firmware_version": FIRMWARE_VERSION
             })
             
             # Create main display group
@@ -617,6 +891,7 @@ class CountdownDisplay:
             
             # Initialize preset manager
             self.preset_manager = PresetManager(self.matrixportal)
+            self.lyrics_manager = LyricsManager()
             
             # Add layers in correct order (bottom to top)
             self.main_group.append(self.background)        # Bottom layer
@@ -650,57 +925,42 @@ class CountdownDisplay:
         delay = min(base_delay * (2 ** retry_count), max_delay)
         return delay
 
-    def report_health_event(self, event_type, data=None):
-        """Report health events to MQTT"""
-        if not self.mqtt_client or not self.mqtt_client.is_connected():
-            print(f"Cannot publish health event: {event_type}")
-            return
-            
+    def _enqueue(self, suffix, data, coalesce=False):
+        """Queue a JSON message for <mqtt_topic>/<suffix>; sent by _flush_outbox() once connected."""
         try:
-            # Initialize data dict if None
-            if data is None:
-                data = {}
-                
-            health_data = {
-                "event": event_type,
-                "timestamp": time.monotonic(),
-                "uptime": time.monotonic() - self.startup_time,
-                "data": data
-            }
-            
-            # Publish to health topic
-            self.mqtt_client.publish(
-                f"{secrets['mqtt_topic']}/health",
-                json.dumps(health_data)
-            )
-            print(f"Published health event: {event_type}")
+            self.outbox.push(f"{secrets['mqtt_topic']}/{suffix}", json.dumps(data), coalesce)
         except Exception as e:
-            print(f"Error publishing health event: {e}")
+            print(f"Error queueing {suffix} message: {e}")
+
+    def _flush_outbox(self):
+        """Publish a few queued messages (call after mqtt loop(), never from on_message)."""
+        sent = 0
+        while self.outbox.count and sent < OUTBOX_FLUSH_MAX:
+            if not self.mqtt_client or not self.mqtt_client.is_connected():
+                return
+            topic, payload = self.outbox.peek()
+            try:
+                self.mqtt_client.publish(topic, payload)
+            except Exception as e:
+                # Keep the message; the next loop() notices the dead socket and the link reconnects
+                print(f"Outbox publish failed: {e}")
+                self.connection_quality = max(0, self.connection_quality - 10)
+                return
+            self.outbox.pop()
+            sent += 1
+
+    def report_health_event(self, event_type, data=None):
+        """Record a health event for the next status report (nothing is published here)"""
+        self.telemetry.event(event_type, time.monotonic())
+        print(f"Health event: {event_type} {data or ''}")
 
     def report_error(self, error_type, details):
-        """Report errors to MQTT"""
-        if not self.mqtt_client or not self.mqtt_client.is_connected():
-            print(f"Cannot publish error: {error_type}")
-            return
-            
-        try:
-            error_data = {
-                "type": error_type,
-                "timestamp": time.monotonic(),
-                "uptime": time.monotonic() - self.startup_time,
-                "details": details,
-                "system_state": {
-                    "wifi_connected": self.matrixportal.network.is_connected,
-                    "mqtt_connected": self.mqtt_client.is_connected() if self.mqtt_client else False,
-                    "retry_count": self.mqtt_retry_count
-                }
-            }
-            self.mqtt_client.publish(
-                f"{secrets['mqtt_topic']}/errors",
-                json.dumps(error_data)
-            )
-        except Exception as e:
-            print(f"Error publishing error: {e}")
+        """Record an error for the next status report, which it brings forward (nothing is published here)"""
+        detail = details.get("error", "") if details else ""
+        if details and "step" in details:
+            detail = f"{details['step']}: {detail}"
+        self.telemetry.error(error_type, detail, time.monotonic())
+        print(f"Error recorded: {error_type} {detail}")
 
     def check_wifi_connection(self):
         """Check and maintain WiFi connection with exponential backoff"""
@@ -751,87 +1011,93 @@ class CountdownDisplay:
             print(f"Retrying in {retry_interval} seconds...")
             return False
 
+    def _mqtt_link_down(self, reason):
+        """Connection lost: report it (queued) and restart the state machine at teardown."""
+        if self.mqtt_state == "connected":
+            self.report_error(reason, {
+                "retry_count": self.mqtt_retry_count,
+                "last_success": self.last_successful_connection
+            })
+        self.mqtt_state = "teardown"
+        self.mqtt_next_step = time.monotonic()
+
+    def _mqtt_retry_later(self, step, error):
+        self.mqtt_retry_count += 1
+        retry_interval = self.get_retry_interval(self.mqtt_retry_count)
+        print(f"MQTT {step} failed ({error}). Retrying in {retry_interval} seconds...")
+        self.report_error("mqtt_error", {
+            "step": step,
+            "error": str(error),
+            "retry_count": self.mqtt_retry_count
+        })
+        self.mqtt_state = "teardown"
+        self.mqtt_next_step = time.monotonic() + retry_interval
+
     def check_mqtt_connection(self):
-        """Check and maintain MQTT connection with exponential backoff"""
+        """
+        Advance the MQTT reconnect state machine by at most one step; True while connected.
+        Never sleeps: waits between steps are deadlines checked on the next update().
+        """
         current_time = time.monotonic()
-        
-        # Only check periodically — throttled must not abort the whole update() (MQTT + UI).
-        if current_time - self.last_mqtt_check < self.get_retry_interval(self.mqtt_retry_count):
-            return True
+        state = self.mqtt_state
 
-        self.last_mqtt_check = current_time
-        
-        if not self.mqtt_client:
-            print("MQTT client not initialized, attempting setup...")
-            return self.setup_mqtt()
+        if state == "connected":
+            if self.mqtt_client and self.mqtt_client.is_connected():
+                return True
+            print("MQTT connection lost")
+            self._mqtt_link_down("mqtt_disconnected")
+            return False
 
-        try:
+        if current_time < self.mqtt_next_step:
+            return False
+
+        if state == "teardown":
+            # Drop the dead socket, then give the ESP32 time to free it before connecting
+            if self.mqtt_client:
+                try:
+                    self.mqtt_client.disconnect()
+                    print("MQTT client disconnected cleanly")
+                except Exception as e:
+                    print(f"Error during disconnect: {e}")
+            self.mqtt_state = "connecting"
+            self.mqtt_next_step = current_time + MQTT_SETTLE_S
+            return False
+
+        if state == "connecting":
+            if not self.matrixportal.network.is_connected:
+                return False
+            print(f"MQTT connect attempt (retry count {self.mqtt_retry_count})")
+            if not self.mqtt_client and not self.setup_mqtt():
+                self._mqtt_retry_later("setup", "no client")
+                return False
+            try:
+                self.mqtt_client.connect()
+            except Exception as e:
+                self._mqtt_retry_later("connect", e)
+                return False
             if not self.mqtt_client.is_connected():
-                print("\n=== MQTT Reconnection Attempt ===")
-                self.report_error("mqtt_disconnected", {
-                    "retry_count": self.mqtt_retry_count,
-                    "last_success": self.last_successful_connection
-                })
-                
-                print(f"Last successful connection: {time.monotonic() - self.last_successful_connection:.2f}s ago")
-                print(f"Current retry count: {self.mqtt_retry_count}")
-                print(f"WiFi status: {'Connected' if self.matrixportal.network.is_connected else 'Disconnected'}")
-                print("Attempting to reconnect...")
-                
-                # Add delay before reconnection to allow socket cleanup
-                time.sleep(1.0)
-                self.mqtt_client.reconnect()
-                
-                if self.mqtt_client.is_connected():
-                    print("MQTT reconnected successfully")
-                    self.mqtt_retry_count = 0
-                    self.last_successful_connection = current_time
-                    
-                    # Report successful reconnection
-                    self.report_health_event("mqtt_connected", {
-                        "uptime": time.monotonic() - self.startup_time
-                    })
-                    
-                    # Resubscribe with delay
-                    time.sleep(0.5)  # Wait for connection to stabilize
-                    try:
-                        self.mqtt_client.subscribe(secrets['mqtt_topic'])
-                        print(f"Resubscribed to {secrets['mqtt_topic']}")
-                        print("==============================\n")
-                        return True
-                    except Exception as e:
-                        error_msg = str(e)
-                        print(f"Resubscription failed: {error_msg}")
-                        self.report_error("mqtt_subscription_failed", {
-                            "error": error_msg
-                        })
-                        print("==============================\n")
-                        return False
-                else:
-                    self.mqtt_retry_count += 1
-                    retry_interval = self.get_retry_interval(self.mqtt_retry_count)
-                    print(f"Could not reconnect to MQTT. Retrying in {retry_interval} seconds...")
-                    print("==============================\n")
-                    return False
-            else:
-                self.mqtt_retry_count = 0
-                return True
+                self._mqtt_retry_later("connect", "not connected")
+                return False
+            self.mqtt_state = "subscribing"
+            self.mqtt_next_step = current_time + MQTT_SUBSCRIBE_DELAY_S
+            return False
+
+        # state == "subscribing"
+        try:
+            self.mqtt_client.subscribe(secrets['mqtt_topic'])
         except Exception as e:
-            error_msg = str(e)
-            print("\n=== MQTT Connection Error ===")
-            self.report_error("mqtt_error", {
-                "error": error_msg,
-                "retry_count": self.mqtt_retry_count
-            })
-            print(f"Error details: {error_msg}")
-            print(f"WiFi status: {'Connected' if self.matrixportal.network.is_connected else 'Disconnected'}")
-            print(f"Time since last success: {time.monotonic() - self.last_successful_connection:.2f}s")
-            print(f"Current retry count: {self.mqtt_retry_count}")
-            self.mqtt_retry_count += 1
-            retry_interval = self.get_retry_interval(self.mqtt_retry_count)
-            print(f"Retrying in {retry_interval} seconds...")
-            print("===========================\n")
+            self._mqtt_retry_later("subscribe", e)
             return False
+        print(f"MQTT connected, subscribed to {secrets['mqtt_topic']}")
+        self.mqtt_state = "connected"
+        self.mqtt_retry_count = 0
+        self.last_successful_connection = current_time
+        self.report_health_event("mqtt_connected", {
+            "uptime": current_time - self.startup_time,
+            "outbox": self.outbox.count,
+            "outbox_dropped": self.outbox.dropped
+        })
+        return True
 
     def on_connect(self, client, userdata, flags, rc):
         """Minimal connect callback"""
@@ -850,33 +1116,29 @@ class CountdownDisplay:
         """Callback when message is published"""
         print(f"Message published to {topic}")
 
-    def publish_status(self, status):
-        """Publish device status with connection check"""
-        if not self.mqtt_client or not self.mqtt_client.is_connected():
-            print("Cannot publish status: MQTT not connected")
-            return
-            
-        try:
-            status_data = {
-                "status": status,
-                "uptime": time.monotonic() - self.startup_time,
-                "wifi": {
-                    "connected": self.matrixportal.network.is_connected,
-                    "ip": self.matrixportal.network.ip_address if self.matrixportal.network.is_connected else None,
-                    "ssid": secrets['ssid']
-                },
-                "connection_quality": self.connection_quality,
-                "message_success_rate": self.get_message_success_rate()
-            }
-            self.mqtt_client.publish(
-                f"{secrets['mqtt_topic']}/status",
-                json.dumps(status_data)
-            )
-            print(f"Published status: {status}")
-        except Exception as e:
-            print(f"Error publishing status: {e}")
-            # Reset connection quality on publish failure
-            self.connection_quality = max(0, self.connection_quality - 10)
+    def publish_telemetry(self):
+        """
+        Queue the combined status report (telemetry counters, last errors and events, link state);
+        called from run(), never from on_message. A report still waiting in the outbox is replaced.
+        """
+        now = time.monotonic()
+        wifi = self.matrixportal.network.is_connected
+        mqtt_ok = self.mqtt_state == "connected"
+        report = self.telemetry.report(
+            now, degraded=not (wifi and mqtt_ok) or self.connection_quality < TELEMETRY_DEGRADED_QUALITY
+        )
+        report["status"] = "online"
+        report["up"] = int(now - self.startup_time)
+        report["ip"] = self.matrixportal.network.ip_address if wifi else None
+        report["mqtt"] = mqtt_ok
+        report["retry"] = self.mqtt_retry_count
+        report["q"] = int(self.connection_quality)
+        report["msgs"] = self.message_counter
+        report["failed"] = self.failed_message_counter
+        report["outbox_dropped"] = self.outbox.dropped
+        report["fw"] = FIRMWARE_VERSION
+        report["wire"] = WIRE_VERSION  # binary display commands this firmware decodes (wire.py)
+        self._enqueue("status", report, coalesce=True)
 
     def get_wifi_signal_strength(self):
         """Get WiFi signal strength (RSSI) - currently not supported"""
@@ -889,63 +1151,42 @@ class CountdownDisplay:
         return ((self.message_counter - self.failed_message_counter) / self.message_counter) * 100
 
     def check_connection_quality(self):
-        """Monitor connection quality"""
-        current_time = time.monotonic()
-
-        # Send heartbeat periodically
-        if current_time - self.last_heartbeat >= self.heartbeat_interval:
-            self.last_heartbeat = current_time
-            self.publish_status("online")
-
+        """Monitor connection quality and queue the status report when telemetry says it is due"""
         # Update connection quality based on message success rate
         self.connection_quality = self.get_message_success_rate()
 
+        if self.telemetry.due(time.monotonic()):
+            self.publish_telemetry()
+
     def _queue_mqtt_ack(self, message_id, status, error=None):
         """Queue ack for publish after mqtt.loop() — publishing inside on_message can hang the client."""
-        if len(self._mqtt_ack_queue) > 16:
-            self._mqtt_ack_queue.pop(0)
-        self._mqtt_ack_queue.append(
-            {"message_id": message_id, "status": status, "error": error}
-        )
-
-    def _flush_mqtt_ack_queue(self):
-        if not self._mqtt_ack_queue:
-            return
-        if not self.mqtt_client or not self.mqtt_client.is_connected():
-            return
-        pending = self._mqtt_ack_queue
-        self._mqtt_ack_queue = []
-        for item in pending:
-            try:
-                payload = {
-                    "message_id": item["message_id"],
-                    "status": item["status"],
-                    "timestamp": time.monotonic(),
-                }
-                if item.get("error"):
-                    payload["error"] = item["error"]
-                self.mqtt_client.publish(
-                    f"{secrets['mqtt_topic']}/ack",
-                    json.dumps(payload),
-                )
-            except Exception as e:
-                print(f"Ack publish failed: {e}")
+        payload = {"message_id": message_id, "status": status, "timestamp": time.monotonic()}
+        if error:
+            payload["error"] = error
+        self._enqueue("ack", payload)
 
     def on_message(self, client, topic, message):
-        """Handle incoming MQTT messages with acknowledgment"""
+        """Handle incoming MQTT messages (binary wire command or JSON) with acknowledgment"""
         print("\n=== New Message Received ===")
         print(f"Topic: {topic}")
-        print(f"Message: {message}")
         
         self.message_counter += 1
         self.last_message_received = time.monotonic()
+        wire = is_wire(message)
         
         try:
-            if isinstance(message, bytes):
-                message = message.decode("utf-8")
-            data = json.loads(message)
-            success = self.process_message(data)
-            message_id = data.get("message_id")
+            if wire:
+                print(f"Message: {len(message)} byte wire command")
+                decode(message, self.command)
+                success = self.process_command(self.command)
+                message_id = self.command.message_id
+            else:
+                if not isinstance(message, str):
+                    message = str(message, "utf-8")
+                print(f"Message: {message}")
+                data = json.loads(message)
+                success = self.process_message(data)
+                message_id = data.get("message_id")
             if message_id:
                 if success:
                     self._queue_mqtt_ack(message_id, "success")
@@ -957,8 +1198,11 @@ class CountdownDisplay:
             print(f"Error processing message: {e}")
             self.failed_message_counter += 1
             try:
-                raw = message.decode("utf-8") if isinstance(message, bytes) else str(message)
-                mid = json.loads(raw).get("message_id")
+                if wire:
+                    mid = self.command.message_id
+                else:
+                    raw = message if isinstance(message, str) else str(message, "utf-8")
+                    mid = json.loads(raw).get("message_id")
             except Exception:
                 mid = None
             if mid:
@@ -1035,131 +1279,183 @@ class CountdownDisplay:
                     return False
                 data = dict(data)
                 data["preset_id"] = pid
+            elif mode == "lyrics":
+                if not isinstance(data.get("f"), list):
+                    print("Ignoring MQTT lyrics: missing frames")
+                    return False
+                if self.lyrics_continues(data.get("u"), data.get("r")):
+                    # Next window for the track on screen: no UI reset
+                    self.lyrics_manager.load(data, time.monotonic_ns())
+                    return True
             else:
                 print(f"Ignoring MQTT: unknown mode {raw_mode!r}")
                 return False
 
-            # Safe to reset — message is actionable
-            self.timer_manager.current_countdown = None
-            self.timer_manager.stopwatch_start = None
-            self.timer_manager.done_start = None
-            self.preset_manager.clear_preset()
-
-            self.text_manager.clear_scrolling_state()
-            self.text_manager.update_text("", self.text_manager.title_label, 8)
-            self.text_manager.update_text("", self.text_manager.timer_label, 20)
-            self.border_manager.clear_border()
-
-            self.preset_manager.radio_group.hidden = True
+            self.reset_modes()
 
             if mode == "timer":
-                self.set_background(BLACK)
-                self.text_manager.title_label.color = WHITE
-                self.text_manager.timer_label.color = WHITE
-                self.border_manager.border_palette[1] = RED
-
-                if self.timer_manager.start_countdown(data["name"], int(data["duration"])):
-                    self.text_manager.update_text(data["name"], self.text_manager.title_label, 8)
-                    self.border_manager.set_solid_border()
-                    print("Countdown started successfully")
+                return self.start_timer(data["name"], tdur)
+
+            if mode == "lyrics":
+                self.start_lyrics_screen()
+                self.lyrics_manager.load(data, time.monotonic_ns())
+                self.show_lyrics()
                 return True
 
-            # mode == preset
-            name = data.get("name", "")
-            duration = data.get("duration")
-            artist = (data.get("artist") or "").strip()
-            song = (data.get("song") or data.get("title") or "").strip()
+            # mode == preset: labels, or the rows the bridge / Flask rendered
             pid = data["preset_id"]
+            rows = None
+            render = data.get("render")
+            if (
+                pid == "music"
+                and isinstance(render, dict)
+                and render.get("v") == 2
+                and isinstance(render.get("a"), dict)
+                and isinstance(render.get("s"), dict)
+            ):
+                rows = (self.rendered_row(render["a"]), self.rendered_row(render["s"]))
+            return self.start_preset_screen(
+                pid,
+                data.get("name", ""),
+                data.get("duration"),
+                (data.get("artist") or "").strip(),
+                (data.get("song") or data.get("title") or "").strip(),
+                rows,
+            )
 
-            if not self.preset_manager.start_preset(pid, name, duration):
-                print(f"start_preset failed for {pid!r}")
-                return False
+        except Exception as e:
+            print(f"Error processing message: {e}")
+            return False
 
-            preset_config = self.preset_manager.presets[pid]
-            self.set_background(preset_config["background"])
-
-            if pid == "music":
-                display_artist = artist if artist else "Unknown Artist"
-                display_song = song if song else "Unknown Song"
-                self.text_manager.title_label.color = preset_config["text_color"]
-                self.text_manager.timer_label.color = preset_config["text_color"]
-                # Label + char marquees only (BitmapLabel scrollers OOM / fail after set_background).
-                self.text_manager.set_marquee_line(
-                    display_artist, self.text_manager.title_label, 8
-                )
-                self.text_manager.set_marquee_line(
-                    display_song, self.text_manager.timer_label, MUSIC_SONG_LINE_Y
+    def process_command(self, cmd):
+        """Binary message (wire.Command): the same checks and actions as process_message(), no dicts"""
+        try:
+            if cmd.mode == MODE_TIMER:
+                if cmd.duration <= 0:
+                    print("Ignoring wire timer: duration must be positive")
+                    return False
+                self.reset_modes()
+                return self.start_timer(cmd.name, cmd.duration)
+
+            if cmd.mode == MODE_PRESET:
+                pid = cmd.preset_id.lower().strip()
+                if pid not in self.preset_manager.presets:
+                    print(f"Ignoring wire preset: unknown preset_id {cmd.preset_id!r}")
+                    return False
+                rows = None
+                if cmd.rows and pid == "music":
+                    rows = (
+                        (cmd.top, None if cmd.top_x == SCROLL_X else cmd.top_x),
+                        (cmd.bottom, None if cmd.bottom_x == SCROLL_X else cmd.bottom_x),
+                    )
+                self.reset_modes()
+                return self.start_preset_screen(
+                    pid, cmd.name, cmd.duration or None, cmd.artist.strip(), cmd.song.strip(), rows
                 )
-            else:
-                display_text = name if name else preset_config["text"]
-                self.text_manager.title_label.color = preset_config["text_color"]
-                self.text_manager.update_text(display_text, self.text_manager.title_label, 8)
-                self.text_manager.timer_label.color = preset_config["text_color"]
-                self.text_manager.update_text("", self.text_manager.timer_label, 20)
-
-            self.border_manager.border_palette[1] = preset_config["border_color"]
-            if preset_config["border_mode"] == "solid":
-                self.border_manager.set_solid_border()
-            elif preset_config["border_mode"] == "animated":
-                self.border_manager.set_animated()
-            elif preset_config["border_mode"] == "blinking":
-                self.border_manager.set_blinking()
-
-            self.preset_manager.radio_group.hidden = not preset_config.get("show_radio", False)
-            print(f"Preset {pid} started successfully")
+
+            # MODE_LYRICS (decode() rejects anything else)
+            continues = self.lyrics_continues(cmd.track_uri, cmd.reset)
+            if not continues:
+                self.reset_modes()
+                self.start_lyrics_screen()
+            lm = self.lyrics_manager
+            lm.begin(cmd.track_uri, cmd.reset, cmd.progress_ms, cmd.playing, time.monotonic_ns())
+            for k in range(cmd.count):
+                lm.add(cmd.times[k], cmd.tops[k], cmd.bottoms[k])
+            if not continues:
+                self.show_lyrics()
             return True
 
         except Exception as e:
-            print(f"Error processing message: {e}")
+            print(f"Error processing wire command: {e}")
             return False
 
-    def update(self):
-        """Main update loop with improved connection handling"""
-        current_time = time.monotonic()
+    def lyrics_continues(self, uri, reset):
+        """Next window for the track already on screen (appended without touching the display)"""
+        return self.lyrics_manager.active and not reset and uri == self.lyrics_manager.track_uri
+
+    def reset_modes(self):
+        """Actionable message: reset the timer / preset / lyrics state; the screen is diffed, not cleared"""
+        self.timer_manager.clear()
+        self.preset_manager.clear_preset()
+        self.lyrics_manager.clear()
+
+    def start_timer(self, name, duration):
+        """Countdown of duration seconds titled name (validated by the caller)"""
+        if self.timer_manager.start_countdown(name, duration):
+            self.apply_screen(self.timer_screen(name))
+            print("Countdown started successfully")
+        return True
 
-        # Check connection quality first
-        self.check_connection_quality()
+    def start_lyrics_screen(self):
+        """Music preset look (colors) with a solid border and the lyric rows instead of artist / song"""
+        self.preset_manager.start_preset("music")
+        want = self.preset_screen("music")
+        want["border_mode"] = "solid"
+        want["radio"] = False
+        want["top"] = ("lyrics", "", LYRICS_TOP_Y)
+        want["bottom"] = ("lyrics", "", LYRICS_BOTTOM_Y)
+        self.apply_screen(want)
+
+    def start_preset_screen(self, pid, name, duration, artist, song, rows=None):
+        """
+        Start preset pid; music shows rows ((text, x or None to scroll) top and bottom, as
+        rendered by spotify/board_render.py) or else artist / song through the label / marquee.
+        """
+        if not self.preset_manager.start_preset(pid, name, duration):
+            print(f"start_preset failed for {pid!r}")
+            return False
 
-        # Handle network checks independently from timer updates
-        need_network_check = (current_time - self.last_wifi_check >= self.get_retry_interval(self.wifi_retry_count)) or \
-                           (current_time - self.last_mqtt_check >= self.get_retry_interval(self.mqtt_retry_count))
+        # Same preset re-sent (e.g. only the duration changed): start_preset restarted the
+        # timer above and apply_screen() below finds nothing to redraw
+        want = self.preset_screen(pid, name)
+        if pid == "music":
+            # Labels, or the prerendered marquee strip (BitmapLabel scrollers OOM / fail after set_background).
+            if rows:
+                want["top"] = ("render", rows[0], 8)
+                want["bottom"] = ("render", rows[1], MUSIC_SONG_LINE_Y)
+            else:
+                want["top"] = ("line", artist if artist else "Unknown Artist", 8)
+                want["bottom"] = ("line", song if song else "Unknown Song", MUSIC_SONG_LINE_Y)
+        self.apply_screen(want)
+        print(f"Preset {pid} started successfully")
+        return True
 
-        if need_network_check:
-            # Check WiFi connection first
-            if not self.check_wifi_connection():
-                return  # Don't proceed with MQTT check if WiFi is down
+    def rendered_row(self, line):
+        """JSON "render" row -> (text, x), x None when the bridge marked it to scroll ("s")"""
+        if line.get("s"):
+            return line.get("t", ""), None
+        return line.get("t", ""), int(line.get("x", MUSIC_H_MARGIN))
 
-            # Check MQTT connection
-            if not self.check_mqtt_connection():
-                return  # Don't proceed with MQTT operations if connection is down
+    def poll_mqtt(self):
+        """One step of WiFi / MQTT upkeep and one short mqtt loop(); True if messages were handled"""
+        received = self.message_counter
+
+        # One non-blocking step of WiFi / MQTT upkeep; the display keeps running either way
+        mqtt_ok = self.check_wifi_connection() and self.check_mqtt_connection()
 
         # Process MQTT messages with improved error handling
-        if self.mqtt_client and self.mqtt_client.is_connected():
+        if mqtt_ok:
             try:
-                self.mqtt_client.loop(timeout=1.0)
+                self.mqtt_client.loop(timeout=MQTT_POLL_TIMEOUT_S)
             except OSError as e:
                 if "Failed to send" in str(e):
-                    # Enhanced logging for socket failures
                     print("\n=== Socket Send Failure Detected ===")
                     print(f"Error details: {e}")
                     print(f"Current WiFi status: {'Connected' if self.matrixportal.network.is_connected else 'Disconnected'}")
-                    print(f"Current MQTT status: {'Connected' if self.mqtt_client.is_connected() else 'Disconnected'}")
                     print(f"Time since last successful connection: {time.monotonic() - self.last_successful_connection:.2f}s")
-                    print(f"WiFi retry count: {self.wifi_retry_count}")
                     print(f"MQTT retry count: {self.mqtt_retry_count}")
-                    print("Triggering reconnection sequence...")
                     print("================================\n")
-                    
-                    # Socket send failure - trigger reconnection
-                    self.mqtt_retry_count += 1
-                    try:
-                        self.mqtt_client.disconnect()
-                        print("MQTT client disconnected cleanly")
-                    except Exception as disc_error:
-                        print(f"Error during disconnect: {disc_error}")
+                    # Reconnect through the state machine (teardown → connect → subscribe)
+                    self._mqtt_link_down("mqtt_send_failed")
                 elif "pystack" not in str(e):  # Only log non-pystack errors
                     print(f"Error in MQTT loop: {e}")
-            self._flush_mqtt_ack_queue()
+            self._flush_outbox()
+        return self.message_counter != received
+
+    def update(self):
+        """Display step: timer, preset, border, marquee, lyrics and test trigger (each acts only when due)"""
+        current_time = time.monotonic()
 
         # Update display state regardless of network status
         try:
@@ -1170,39 +1466,11 @@ class CountdownDisplay:
                 if trigger:
                     mode = trigger.get("mode", "timer")
                     if mode == "timer":
-                        # Set default colors for timer mode
-                        self.set_background(BLACK)
-                        self.text_manager.title_label.color = WHITE
-                        self.text_manager.timer_label.color = WHITE
-                        self.border_manager.border_palette[1] = RED  # Reset border to default red
-                        
                         if self.timer_manager.start_countdown(trigger["name"], trigger["duration"]):
-                            self.text_manager.update_text(trigger["name"], self.text_manager.title_label, 8)
-                            self.border_manager.set_solid_border()
+                            self.apply_screen(self.timer_screen(trigger["name"]))
                     elif mode == "preset" and "preset_id" in trigger:
                         if self.preset_manager.start_preset(trigger["preset_id"], trigger.get("name"), trigger.get("duration")):
-                            preset_config = self.preset_manager.presets[trigger["preset_id"]]
-                            
-                            # First set the background color
-                            self.set_background(preset_config["background"])
-                            
-                            # Update text and its color
-                            display_text = trigger.get("name", "") if trigger.get("name") else preset_config["text"]
-                            self.text_manager.title_label.color = preset_config["text_color"]
-                            self.text_manager.update_text(display_text, self.text_manager.title_label, 8)
-                            
-                            # Clear timer text
-                            self.text_manager.timer_label.color = preset_config["text_color"]
-                            self.text_manager.update_text("", self.text_manager.timer_label, 20)
-                            
-                            # Set border color and mode
-                            self.border_manager.border_palette[1] = preset_config["border_color"]
-                            if preset_config["border_mode"] == "solid":
-                                self.border_manager.set_solid_border()
-                            elif preset_config["border_mode"] == "animated":
-                                self.border_manager.set_animated()
-                            elif preset_config["border_mode"] == "blinking":
-                                self.border_manager.set_blinking()
+                            self.apply_screen(self.preset_screen(trigger["preset_id"], trigger.get("name")))
                 return
             
             # Update preset state if active
@@ -1211,15 +1479,12 @@ class CountdownDisplay:
                 if state:
                     if state["type"] == "preset_end":
                         # Clear display when preset expires
-                        self.border_manager.clear_border()
-                        self.text_manager.clear_scrolling_state()
-                        self.text_manager.update_text("", self.text_manager.title_label, 8)
-                        self.text_manager.update_text("", self.text_manager.timer_label, 20)
-                        self.set_background(BLACK)
+                        self.apply_screen(IDLE_SCREEN)
                 self.border_manager.update_animation(current_time)
-                # Use fresh monotonic() — current_time was taken before mqtt loop, so next_t from
-                # process_message can be ahead of current_time and stall the first many ticks.
-                self.text_manager.tick_music_marquees(time.monotonic())
+                if self.lyrics_manager.active:
+                    self.show_lyrics()
+                # Fresh ticks: lyrics / layout work above can take a while on the M4
+                self.text_manager.tick_marquees(ticks_ms())
                 return
             
             # Update timer state
@@ -1235,22 +1500,26 @@ class CountdownDisplay:
                             # Set border mode based on remaining time
                             if state["remaining"] <= FINAL_COUNTDOWN:
                                 self.border_manager.set_animated()
+                                self.screen.forget("border_mode")
                             
                     elif state["type"] == "done":
                         # Only update text and border when first entering DONE state
                         if state.get("first", False):
                             self.text_manager.update_text("DONE", self.text_manager.timer_label, 20)
                             self.border_manager.set_solid_border()
+                            self.screen.forget("border_mode")
                     elif state["type"] == "stopwatch_start":
                         self.text_manager.update_text(STOPWATCH_TEXT, self.text_manager.title_label, 8)
                         self.text_manager.update_text("00:00", self.text_manager.timer_label, 20)
                         self.border_manager.set_blinking()
+                        self.screen.forget("top", "border_mode")
             else:
                 state = self.timer_manager.update_stopwatch(current_time)
                 if state:
                     # Ensure blinking border is maintained
                     if self.border_manager.current_mode != "blinking":
                         self.border_manager.set_blinking()
+                        self.screen.forget("border_mode")
                     
                     # Only update display when we've moved to a new second
                     if state.get("update", False):
@@ -1258,30 +1527,138 @@ class CountdownDisplay:
                         self.text_manager.update_text(timer_text, self.text_manager.timer_label, 20)
                 elif not state:
                     # Clear everything if no active countdown or stopwatch
-                    self.border_manager.clear_border()
-                    self.text_manager.clear_scrolling_state()
-                    self.text_manager.update_text("", self.text_manager.title_label, 8)
-                    self.text_manager.update_text("", self.text_manager.timer_label, 20)
+                    self.apply_screen(IDLE_SCREEN)
             
             # Update border animation independently (only if not in DONE state)
             if not (state and state["type"] == "done"):
                 self.border_manager.update_animation(current_time)
-            self.text_manager.tick_music_marquees(time.monotonic())
+            self.text_manager.tick_marquees(ticks_ms())
                 
         except Exception as e:
             print(f"Error in display update: {e}")
 
+    def schedule_display(self):
+        """Record when each display subsystem next needs update() (None: nothing pending)"""
+        d = self.deadlines
+        tm = self.timer_manager
+        idle = not tm.current_countdown and not tm.stopwatch_start and not tm.done_start and \
+            not self.preset_manager.current_preset
+        d.set("timer", tm.next_change_ns())
+        d.set_s("preset", self.preset_manager.end_time())
+        d.set_s("border", self.border_manager.next_frame_time())
+        d.set_s("marquee", self.text_manager.next_marquee_time())
+        if self.preset_manager.current_preset:
+            d.set("lyrics", self.lyrics_manager.next_change_ns(time.monotonic_ns()))
+        else:
+            d.set("lyrics", None)
+        d.set_s("trigger", self.last_check + TRIGGER_CHECK_S if idle else None)
+
     def run(self):
-        """Main run loop"""
+        """
+        Cooperative main loop: run whatever is due, then sleep until the earliest deadline.
+        MQTT is read every MQTT_POLL_S, preferably in a gap of at least MQTT_POLL_TIMEOUT_S
+        before the next display deadline so a poll never delays a marquee / border frame.
+        """
         print("Starting main loop...")
+        d = self.deadlines
+        now = time.monotonic_ns()
+        d.set("health", now)
+        mqtt_poll = Poll(d, "mqtt", int(MQTT_POLL_S * NS_PER_S), int(MQTT_POLL_TIMEOUT_S * NS_PER_S), now)
+        dirty = True
         while True:
             try:
-                self.update()
-                time.sleep(0.01)  # Small sleep to prevent CPU overload
+                now = time.monotonic_ns()
+                if d.due("health", now):
+                    self.check_connection_quality()
+                # Errors recorded since (MQTT / WiFi upkeep) can bring the next report forward
+                d.set_s("health", self.telemetry.next_at)
+
+                if mqtt_poll.should_run(now):
+                    if self.poll_mqtt():
+                        dirty = True
+                    mqtt_poll.ran(time.monotonic_ns())
+
+                now = time.monotonic_ns()
+                if dirty or any(d.due(name, now) for name in DISPLAY_TASKS):
+                    self.update()
+                    self.schedule_display()
+                    dirty = False
+
+                time.sleep(d.sleep_s(time.monotonic_ns(), LOOP_MAX_SLEEP_S))
             except Exception as e:
                 print("Error in main loop:", str(e))
+                dirty = True
                 time.sleep(0.1)  # Slightly longer sleep on error
 
+    def show_lyrics(self):
+        """Redraw the lyric rows only when the frame playing now changes."""
+        lm = self.lyrics_manager
+        i = lm.current(time.monotonic_ns())
+        if i == lm.shown:
+            return
+        lm.shown = i
+        top, bottom = lm.rows(i) if i >= 0 else ("", "")
+        self.text_manager.set_lyric_row(top, self.text_manager.title_label, LYRICS_TOP_Y)
+        self.text_manager.set_lyric_row(bottom, self.text_manager.timer_label, LYRICS_BOTTOM_Y)
+
+    def timer_screen(self, name):
+        """Countdown look: name on top, the bottom row is drawn by update() every second"""
+        return {
+            "background": BLACK,
+            "text_color": WHITE,
+            "border_color": RED,
+            "border_mode": "solid",
+            "radio": False,
+            "top": ("text", name, 8),
+            "bottom": ("timer", "", 20),
+        }
+
+    def preset_screen(self, pid, name=None):
+        """Preset look with name (or the preset text) centered on top and an empty bottom row"""
+        preset_config = self.preset_manager.presets[pid]
+        return {
+            "background": preset_config["background"],
+            "text_color": preset_config["text_color"],
+            "border_color": preset_config["border_color"],
+            "border_mode": preset_config["border_mode"],
+            "radio": preset_config.get("show_radio", False),
+            "top": ("text", name if name else preset_config["text"], 8),
+            "bottom": ("text", "", 20),
+        }
+
+    def apply_screen(self, want):
+        """Bring the display to want (see screen.py), redrawing only the elements that differ"""
+        changed = self.screen.changes(want)
+        for element in changed:
+            value = want[element]
+            if element == "background":
+                self.set_background(value)
+            elif element == "text_color":
+                self.text_manager.set_text_color(value)
+            elif element == "border_color":
+                self.border_manager.set_color(value)
+            elif element == "border_mode":
+                self.border_manager.set_effect(value)
+            elif element == "radio":
+                self.preset_manager.radio_group.hidden = not value
+            elif element == "top":
+                self.draw_row(value, self.text_manager.title_label)
+            else:
+                self.draw_row(value, self.text_manager.timer_label)
+        self.screen.applied(want)
+        print(f"Screen: {', '.join(changed) if changed else 'unchanged'}")
+
+    def draw_row(self, row, label):
+        kind, text, y = row
+        if kind == "line":
+            self.text_manager.set_marquee_line(text, label, y)
+        elif kind == "render":
+            self.text_manager.set_rendered_line(text[0], text[1], label, y)
+        else:
+            # "text"; "timer" / "lyrics" rows start empty and update() / show_lyrics() fill them
+            self.text_manager.update_text(text, label, y)
+
+
     def set_background(self, color):
         """Set the background color"""
         self.background_palette[0] = color
@@ -1309,10 +1686,8 @@ class CountdownDisplay:
         return None
 
     def setup_mqtt(self):
-        """Set up MQTT connection with proper error handling"""
+        """Create the MQTT client; check_mqtt_connection() connects and subscribes it step by step"""
         try:
-            print("Connecting to MQTT broker...")
-            
             # Create socket pool with buffer management
             pool = adafruit_esp32spi_socketpool.SocketPool(self.matrixportal.network._wifi.esp)
             
@@ -1325,40 +1700,22 @@ class CountdownDisplay:
                 socket_pool=pool,
                 is_ssl=False,
                 keep_alive=30,  # More frequent keepalive
-                socket_timeout=1.0,  # Base timeout
-                recv_timeout=2.0     # Must be > socket_timeout
+                socket_timeout=MQTT_POLL_TIMEOUT_S,  # loop() timeout must be >= this
+                recv_timeout=2.0,    # Must be > socket_timeout
+                use_binary_mode=True  # payloads as bytes: wire commands, JSON decoded in on_message
             )
 
             # Set up minimal callbacks to save memory
             self.mqtt_client.on_message = self.on_message
             self.mqtt_client.on_connect = self.on_connect
-
-            # Connect to MQTT broker
-            print(f"Attempting to connect to {secrets['mqtt_broker']} as {secrets['mqtt_user']}")
-            self.mqtt_client.connect()
-            
-            if self.mqtt_client.is_connected():
-                print("Connected to MQTT broker!")
-                self.mqtt_retry_count = 0
-                self.last_successful_connection = time.monotonic()
-                
-                # Subscribe only to main topic
-                try:
-                    self.mqtt_client.subscribe(secrets['mqtt_topic'])
-                    print(f"Subscribed to {secrets['mqtt_topic']}")
-                    return True
-                except Exception as e:
-                    print(f"Initial subscription failed: {e}")
-                    return False
-            else:
-                print("Failed to connect to MQTT broker")
-                return False
+            print(f"MQTT client for {secrets['mqtt_broker']} as {secrets['mqtt_user']}")
+            self.mqtt_state = "connecting"
+            self.mqtt_next_step = 0
+            return True
 
         except Exception as e:
             print(f"Error setting up MQTT: {e}")
-            self.mqtt_retry_count += 1
-            retry_interval = self.get_retry_interval(self.mqtt_retry_count)
-            print(f"Retrying in {retry_interval} seconds...")
+            self.mqtt_client = None
             return False
 
 # Main program
@@ -0,0 +1,122 @@
+"""
+Compact binary display commands for the MatrixPortal boards (displays/wc/code.py).
+
+The Flask app and the Spotify bridge send this instead of JSON to displays whose profile says
+the firmware decodes it (spotify/board_render.py wire_payload; the board reports "wire": 1 in
+its status). decode() fills one preallocated Command in place: no json.loads, no dicts, no
+flatten pass; only the text fields become new strings. Anything else on the topic is JSON.
+
+Layout (integers big-endian, str = 1 length byte + that many UTF-8 bytes):
+
+  0xB1 (version 1; never the first byte of JSON)   mode "T" / "P" / "L"   str message_id
+  T  u32 duration_s, str name
+  P  str preset_id, u32 duration_s (0 = until the next message), str name, str artist,
+     str song, u8 row count (0 or 2), rows: u8 x (255 = too wide, scroll) + str text
+  L  u8 flags (1 replace frames, 2 playing), u32 progress_ms, str track_uri, u8 frame count,
+     frames: u32 start_ms + str top + str bottom
+
+Copy next to code.py on the CIRCUITPY drive. Plain Python (test_wire.py, bench_wire.py).
+"""
+
+WIRE_VERSION = 1
+WIRE_MARK = 0xB0 | WIRE_VERSION
+MODE_TIMER = 0x54   # "T"
+MODE_PRESET = 0x50  # "P"
+MODE_LYRICS = 0x4C  # "L"
+SCROLL_X = 255
+MAX_FRAMES = 8      # lyric frames kept per message (the board ring holds 8)
+
+
+def is_wire(message):
+    return len(message) > 0 and message[0] == WIRE_MARK
+
+
+class Command:
+    """One decoded message; fields not used by its mode are left at their empty values."""
+
+    def __init__(self, max_frames=MAX_FRAMES):
+        self.times = [0] * max_frames
+        self.tops = [""] * max_frames
+        self.bottoms = [""] * max_frames
+        self.clear()
+
+    def clear(self):
+        self.mode = 0
+        self.message_id = ""
+        self.name = ""
+        self.duration = 0
+        self.preset_id = ""
+        self.artist = ""
+        self.song = ""
+        self.rows = 0
+        self.top_x = SCROLL_X
+        self.top = ""
+        self.bottom_x = SCROLL_X
+        self.bottom = ""
+        self.reset = False
+        self.playing = False
+        self.progress_ms = 0
+        self.track_uri = ""
+        self.count = 0
+
+
+def _u32(buf, i):
+    return (buf[i] << 24) | (buf[i + 1] << 16) | (buf[i + 2] << 8) | buf[i + 3]
+
+
+def _str(view, i):
+    """(text, next index); the bytes are decoded straight from the message buffer"""
+    n = view[i]
+    i += 1
+    if i + n > len(view):
+        raise ValueError("wire: string runs past the end")
+    return (str(view[i:i + n], "utf-8") if n else ""), i + n
+
+
+def decode(message, cmd):
+    """Fill cmd from a wire message (bytes / bytearray); ValueError if it is not one or is cut short."""
+    cmd.clear()
+    if not is_wire(message):
+        raise ValueError("wire: not a version 1 message")
+    view = memoryview(message)
+    try:
+        cmd.mode = view[1]
+        cmd.message_id, i = _str(view, 2)
+        if cmd.mode == MODE_TIMER:
+            cmd.duration = _u32(view, i)
+            cmd.name, i = _str(view, i + 4)
+        elif cmd.mode == MODE_PRESET:
+            cmd.preset_id, i = _str(view, i)
+            cmd.duration = _u32(view, i)
+            cmd.name, i = _str(view, i + 4)
+            cmd.artist, i = _str(view, i)
+            cmd.song, i = _str(view, i)
+            cmd.rows = view[i]
+            i += 1
+            if cmd.rows:
+                cmd.top_x = view[i]
+                cmd.top, i = _str(view, i + 1)
+                cmd.bottom_x = view[i]
+                cmd.bottom, i = _str(view, i + 1)
+        elif cmd.mode == MODE_LYRICS:
+            flags = view[i]
+            cmd.reset = bool(flags & 1)
+            cmd.playing = bool(flags & 2)
+            cmd.progress_ms = _u32(view, i + 1)
+            cmd.track_uri, i = _str(view, i + 5)
+            n = view[i]
+            i += 1
+            for k in range(n):
+                t = _u32(view, i)
+                top, i = _str(view, i + 4)
+                bottom, i = _str(view, i)
+                if k < len(cmd.times):
+                    cmd.times[k] = t
+                    cmd.tops[k] = top
+                    cmd.bottoms[k] = bottom
+                    cmd.count = k + 1
+        else:
+            raise ValueError("wire: unknown mode")
+    except IndexError:
+        raise ValueError("wire: message cut short")
+    return cmd
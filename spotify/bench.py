@@ -0,0 +1,203 @@
+#!/usr/bin/env python3
+"""
+Offline bridge benchmark: runs AccountPoller against FakeSpotify / FakeLrclibSession and an
+in-process MQTT sink on a virtual clock (spotify/fakes.py), then reports:
+
+  - Spotify API calls per hour and LRCLIB requests
+  - publishes per topic (and bytes)
+  - lyric-line accuracy: share of 100 ms samples (while playing a track with lyrics) where a
+    subscriber extrapolating the retained anchor shows the line that is really playing
+  - time-to-lyrics: delay from a real track change until lyrics/lines + anchor for it are published
+
+  python3 -m spotify.bench --minutes 60
+  python3 -m spotify.bench --spotify-latency 0.3 --spotify-errors 0.05 --lrclib-latency 1.5
+"""
+
+from __future__ import annotations
+
+import argparse
+import contextlib
+import json
+import sys
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+_ROOT = Path(__file__).resolve().parent.parent
+if str(_ROOT) not in sys.path:
+    sys.path.insert(0, str(_ROOT))
+
+from spotify import topics
+from spotify.bridge import AccountPoller
+from spotify.fakes import (
+    FakeClock,
+    FakeLrclibSession,
+    FakeMqttClient,
+    FakeSpotify,
+    FakeTrack,
+    ScriptEvent,
+    repeat_script,
+    synthetic_lrc,
+)
+from spotify.lrc import parse_synced_lrc
+from spotify.lyrics_sources import LrclibSource, LyricsCache
+from spotify.metrics import METRICS
+from spotify.timing import extrapolate_progress, index_at
+
+# Subscriber sampling step (virtual time)
+TICK_S = 0.1
+
+
+def default_scenario() -> Tuple[List[FakeTrack], List[ScriptEvent], float]:
+    """Six tracks (one without lyrics, one "- Remastered" title), seeks, a pause, a skip and a stop; 20 min."""
+    durations = [214_000, 187_000, 243_000, 176_000, 201_000, 232_000]
+    tracks = [
+        FakeTrack(f"spotify:track:bench{i}", f"Artist {i}", f"Song {i}", f"Album {i}", d, synthetic_lrc(d))
+        for i, d in enumerate(durations)
+    ]
+    tracks[2] = tracks[2]._replace(lrc=None)
+    tracks[4] = tracks[4]._replace(title="Song 4 - Remastered 2011", lrclib_title="Song 4")
+    script: List[ScriptEvent] = [
+        (0, "play", 0),
+        (60, "seek", 150_000),
+        (250, "pause", None),
+        (280, "resume", None),
+        (520, "play", 3),
+        (600, "seek", 20_000),
+        (1000, "stop", None),
+        (1060, "play", 4),
+    ]
+    return tracks, script, 1200.0
+
+
+def _subscriber_line(sink: FakeMqttClient, topic_set: topics.TopicSet, uri: str, now_ms: int) -> Optional[int]:
+    """Line index a subscriber would show from the anchor + lyrics/lines it received (None: not synced to uri)."""
+    anchor = sink.last.get(topic_set.lyrics_anchor)
+    track = sink.last.get(topic_set.lyrics_lines)
+    if not anchor or not track or anchor.get("u") != uri or track.get("track_uri") != uri:
+        return None
+    times = [row["t"] for row in track.get("lines") or []]
+    return index_at(times, extrapolate_progress(anchor, now_ms, int(track.get("duration_ms") or 0)))
+
+
+def run_bench(
+    minutes: float = 60.0,
+    poll_interval: float = 1.0,
+    paused_interval: float = 5.0,
+    idle_interval: float = 10.0,
+    spotify_latency: float = 0.15,
+    spotify_errors: float = 0.0,
+    lrclib_latency: float = 0.8,
+    lrclib_errors: float = 0.0,
+    seed: int = 1,
+) -> Dict[str, Any]:
+    tracks, scenario, period_s = default_scenario()
+    total_s = minutes * 60.0
+    clock = FakeClock()
+    sp = FakeSpotify(tracks, repeat_script(scenario, period_s, total_s), clock, spotify_latency, spotify_errors, seed)
+    lrclib = FakeLrclibSession(tracks, clock, lrclib_latency, lrclib_errors, seed)
+    sink = FakeMqttClient(clock)
+    topic_set = topics.for_prefix()
+
+    poller = AccountPoller(
+        name="bench",
+        sp=sp,
+        client=sink,  # type: ignore[arg-type]
+        topic_set=topic_set,
+        sources=[LrclibSource(lrclib)],  # type: ignore[arg-type]
+        lyrics_cache=LyricsCache(),
+        library=None,
+        lyrics_save=False,
+        dry_run=False,
+        poll_interval=poll_interval,
+        paused_interval=max(poll_interval, paused_interval),
+        idle_interval=max(poll_interval, idle_interval),
+        clock=clock.time,
+    )
+
+    start = clock.time()
+    end = start + total_s
+    next_poll = start
+    samples = correct = 0
+    prev_uri: Optional[str] = None
+    pending: Optional[Tuple[str, float]] = None
+    time_to_lyrics: List[float] = []
+    truth_times: Dict[str, List[int]] = {}
+
+    while clock.time() < end:
+        if clock.time() >= next_poll:
+            next_poll = clock.time() + poller.poll_once()
+
+        now = clock.time()
+        now_ms = int(now * 1000)
+        track, progress, playing = sp.state_at(now)
+        uri = track.uri if track else None
+        if uri != prev_uri:
+            prev_uri = uri
+            pending = (uri, now) if track and track.lrc else None
+        if pending and _subscriber_line(sink, topic_set, pending[0], now_ms) is not None:
+            time_to_lyrics.append(now - pending[1])
+            pending = None
+
+        if track and track.lrc and playing:
+            samples += 1
+            if track.uri not in truth_times:
+                truth_times[track.uri] = [t for t, _ in parse_synced_lrc(track.lrc)]
+            if _subscriber_line(sink, topic_set, track.uri, now_ms) == index_at(truth_times[track.uri], progress):
+                correct += 1
+
+        clock.advance(TICK_S)
+
+    hours = total_s / 3600.0
+    publishes = sink.counts()
+    poll_stats = METRICS.snapshot()["stages"].get("poll", {})
+    return {
+        "simulated_minutes": minutes,
+        "spotify_api_calls": sp.calls,
+        "spotify_api_calls_per_hour": round(sp.calls / hours),
+        "spotify_api_errors": sp.errors,
+        "lrclib_requests": lrclib.requests,
+        "lrclib_errors": lrclib.errors,
+        "publishes": publishes,
+        "publishes_per_hour": round(sum(publishes.values()) / hours),
+        "publish_bytes": sum(m[2] for m in sink.messages),
+        "line_accuracy": round(correct / samples, 4) if samples else None,
+        "time_to_lyrics_s": {
+            "count": len(time_to_lyrics),
+            "avg": round(sum(time_to_lyrics) / len(time_to_lyrics), 2) if time_to_lyrics else None,
+            "max": round(max(time_to_lyrics), 2) if time_to_lyrics else None,
+        },
+        "poll_cpu_ms_avg": poll_stats.get("avg_ms"),
+    }
+
+
+def main() -> None:
+    p = argparse.ArgumentParser(description="Offline Spotify bridge benchmark (fake Spotify / LRCLIB / MQTT)")
+    p.add_argument("--minutes", type=float, default=60.0, help="Simulated playback time (default: 60)")
+    p.add_argument("--interval", type=float, default=1.0, help="Bridge poll interval while playing")
+    p.add_argument("--paused-interval", type=float, default=5.0)
+    p.add_argument("--idle-interval", type=float, default=10.0)
+    p.add_argument("--spotify-latency", type=float, default=0.15, help="Simulated API round trip (s)")
+    p.add_argument("--spotify-errors", type=float, default=0.0, help="Share of API calls that fail (0..1)")
+    p.add_argument("--lrclib-latency", type=float, default=0.8, help="Simulated LRCLIB request time (s)")
+    p.add_argument("--lrclib-errors", type=float, default=0.0, help="Share of LRCLIB requests that fail (0..1)")
+    p.add_argument("--seed", type=int, default=1)
+    args = p.parse_args()
+
+    # Bridge log lines (injected errors) go to stderr so stdout stays JSON
+    with contextlib.redirect_stdout(sys.stderr):
+        report = run_bench(
+            minutes=args.minutes,
+            poll_interval=max(0.3, args.interval),
+            paused_interval=args.paused_interval,
+            idle_interval=args.idle_interval,
+            spotify_latency=args.spotify_latency,
+            spotify_errors=args.spotify_errors,
+            lrclib_latency=args.lrclib_latency,
+            lrclib_errors=args.lrclib_errors,
+            seed=args.seed,
+        )
+    print(json.dumps(report, indent=2))
+
+
+if __name__ == "__main__":
+    main()
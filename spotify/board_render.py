@@ -0,0 +1,284 @@
+"""
+Board-ready music payloads for the MatrixPortal displays (home/displays/<target>).
+
+The boards draw with terminalio.FONT (printable ASCII, ~6 px per glyph) on a 64 px wide matrix.
+Everything that only depends on the text is done here instead of on the M4: ASCII folding,
+truncation, pixel width and centered x; lines wider than the text band are only flagged, the
+firmware scrolls them with its pixel scroller (displays/marquee.py).
+
+Payload (music preset, same top-level fields as the Flask app sends):
+
+  {"mode": "preset", "preset_id": "music", "artist": "...", "song": "...",
+   "render": {"v": 2, "p": "wc",
+              "a": {"t": "Beyonce", "x": 11},
+              "s": {"t": "A much longer song title", "s": 1}}}
+
+"t" text, "x" label x when it fits; otherwise "s": 1 (scroll). Boards without "render" support
+use artist / song as before.
+
+Lyrics mode (wc firmware): the current lyrics as pre-wrapped, pre-timed two-row frames, a few
+at a time (lyric_frames / lyrics_payload):
+
+  {"mode": "lyrics", "u": "spotify:track:...", "r": 1, "p": 61250, "pl": 1,
+   "f": [[60500, "Is this", "the real"], [62300, "life?", ""], ...]}
+
+"r" 1 replaces the board's frames (new track / seek), 0 appends; "p" / "pl" re-anchor its clock.
+
+Boards whose profile has wire=1 (firmware with displays/wire.py) get the same payloads as the
+compact binary layout documented there (wire_payload / board_message) instead of JSON: no
+json.loads or dict walking on the M4, and the render rows shrink to x + text.
+"""
+
+from __future__ import annotations
+
+import json
+import unicodedata
+from typing import Any, Dict, List, NamedTuple, Optional, Sequence, Tuple, Union
+
+# 2: rows are {"t", "x"} or {"t", "s": 1}; version 1 also sent the width and a marquee loop string
+RENDER_VERSION = 2
+# Lyrics mode: two text rows per frame, frames sent a few at a time (board ring buffer holds 8)
+LYRIC_ROWS = 2
+LYRICS_WINDOW = 4
+# Display time for the last page of the last line (no next line start to split against)
+LAST_PAGE_MS = 4000
+# Longest line sent to a board (scroller strip memory on the M4)
+MAX_LINE_CHARS = 64
+# Binary display commands (displays/wire.py): first byte 0xB0 | version, never "{" like JSON
+WIRE_VERSION = 1
+WIRE_MARK = 0xB0 | WIRE_VERSION
+WIRE_SCROLL_X = 255
+WIRE_MODES = {"timer": b"T", "preset": b"P", "lyrics": b"L"}
+
+# Typographic characters Spotify metadata uses that NFKD does not reduce to ASCII
+_ASCII_MAP = {
+    "‘": "'",
+    "’": "'",
+    "“": '"',
+    "”": '"',
+    "–": "-",
+    "—": "-",
+    "…": "...",
+    "ß": "ss",
+    "æ": "ae",
+    "Æ": "AE",
+    "ø": "o",
+    "Ø": "O",
+    "ł": "l",
+    "Ł": "L",
+    " ": " ",
+}
+
+
+class DisplayProfile(NamedTuple):
+    """Text geometry of one board (matches the constants at the top of displays/<name>/code.py)."""
+
+    name: str
+    width: int = 64
+    char_px: int = 6
+    h_margin: int = 2
+    # Binary command version the firmware decodes (displays/wire.py); 0: JSON only
+    wire: int = 0
+
+    @property
+    def inner_w(self) -> int:
+        return self.width - 2 * self.h_margin
+
+    @property
+    def max_chars(self) -> int:
+        return self.inner_w // self.char_px
+
+
+PROFILES: Dict[str, DisplayProfile] = {
+    "wc": DisplayProfile("wc", wire=WIRE_VERSION),
+    "bathroom": DisplayProfile("bathroom"),
+    "eva": DisplayProfile("eva"),
+}
+
+
+def ascii_fold(text: str) -> str:
+    """Printable ASCII only: strip accents, map typographic punctuation, "?" for anything else."""
+    out = []
+    for ch in unicodedata.normalize("NFKD", "".join(_ASCII_MAP.get(c, c) for c in text)):
+        if unicodedata.combining(ch):
+            continue
+        out.append(ch if " " <= ch <= "~" else (" " if ch.isspace() else "?"))
+    return " ".join("".join(out).split())
+
+
+def render_line(text: str, profile: DisplayProfile) -> Dict[str, Any]:
+    """One music row: centered if it fits the text band, else flagged to scroll."""
+    t = ascii_fold(text)
+    if len(t) > MAX_LINE_CHARS:
+        t = t[: MAX_LINE_CHARS - 3].rstrip() + "..."
+    w = len(t) * profile.char_px
+    if w <= profile.inner_w:
+        return {"t": t, "x": profile.h_margin + (profile.inner_w - w) // 2}
+    return {"t": t, "s": 1}
+
+
+def music_payload(artist: str, song: str, profile: DisplayProfile) -> Dict[str, Any]:
+    """home/displays/<target> music preset with folded artist / song and the "render" block."""
+    artist = (artist or "").strip() or "Unknown Artist"
+    song = (song or "").strip() or "Unknown Song"
+    a = render_line(artist, profile)
+    s = render_line(song, profile)
+    return {
+        "mode": "preset",
+        "preset_id": "music",
+        "artist": a["t"],
+        "song": s["t"],
+        "render": {"v": RENDER_VERSION, "p": profile.name, "a": a, "s": s},
+    }
+
+
+def profile_for(target: str) -> DisplayProfile:
+    """Profile for a display target (unknown targets get the default 64 px geometry)."""
+    return PROFILES.get(target.lower(), DisplayProfile(target.lower()))
+
+
+def wrap_rows(text: str, width: int) -> List[str]:
+    """Greedy word wrap to rows of at most width chars (longer words are split)."""
+    rows: List[str] = []
+    cur = ""
+    for word in ascii_fold(text).split():
+        while len(word) > width:
+            if cur:
+                rows.append(cur)
+                cur = ""
+            rows.append(word[:width])
+            word = word[width:]
+        if not word:
+            continue
+        if cur and len(cur) + 1 + len(word) <= width:
+            cur += " " + word
+        elif cur:
+            rows.append(cur)
+            cur = word
+        else:
+            cur = word
+    if cur:
+        rows.append(cur)
+    return rows
+
+
+def lyric_frames(
+    lines: Sequence[Tuple[int, str]],
+    profile: DisplayProfile,
+    duration_ms: int = 0,
+) -> List[Tuple[int, str, str]]:
+    """
+    Timed lyric lines -> board frames (start_ms, top_row, bottom_row). A line that needs more than
+    two rows becomes several pages, splitting the time until the next line by characters per page.
+    """
+    frames: List[Tuple[int, str, str]] = []
+    for i, (t, text) in enumerate(lines):
+        rows = wrap_rows(text, profile.max_chars) or [""]
+        pages = [rows[j : j + LYRIC_ROWS] for j in range(0, len(rows), LYRIC_ROWS)]
+        if i + 1 < len(lines):
+            end = lines[i + 1][0]
+        elif duration_ms > t:
+            end = min(duration_ms, t + LAST_PAGE_MS * len(pages))
+        else:
+            end = t + LAST_PAGE_MS * len(pages)
+        span = max(0, end - t)
+        total_chars = sum(len("".join(p)) for p in pages) or 1
+        start = t
+        for page in pages:
+            frames.append((start, page[0], page[1] if len(page) > 1 else ""))
+            start += span * max(1, len("".join(page))) // total_chars
+    return frames
+
+
+def lyrics_payload(
+    track_uri: Optional[str],
+    frames: Sequence[Tuple[int, str, str]],
+    first: int,
+    progress_ms: int,
+    is_playing: bool,
+    reset: bool,
+) -> Dict[str, Any]:
+    """
+    home/displays/<target> lyrics mode: frames[first:first + LYRICS_WINDOW] plus the playback
+    position at publish time (the board anchors it to its own clock on receipt).
+    """
+    window = frames[first : first + LYRICS_WINDOW]
+    return {
+        "mode": "lyrics",
+        "u": track_uri,
+        "r": 1 if reset else 0,
+        "p": int(progress_ms),
+        "pl": 1 if is_playing else 0,
+        "f": [[t, top, bottom] for t, top, bottom in window],
+    }
+
+
+def _wire_str(out: bytearray, value: Any) -> None:
+    """1 length byte + UTF-8, cut to 255 bytes on a character boundary."""
+    raw = ("" if value is None else str(value)).encode("utf-8")
+    if len(raw) > 255:
+        raw = raw[:255].decode("utf-8", "ignore").encode("utf-8")
+    out.append(len(raw))
+    out += raw
+
+
+def _wire_u32(out: bytearray, value: Any) -> None:
+    out += min(max(int(value or 0), 0), 0xFFFFFFFF).to_bytes(4, "big")
+
+
+def _wire_row(out: bytearray, line: Dict[str, Any]) -> None:
+    x = WIRE_SCROLL_X if line.get("s") or "x" not in line else min(int(line["x"]), WIRE_SCROLL_X - 1)
+    out.append(x)
+    _wire_str(out, line.get("t", ""))
+
+
+def wire_payload(payload: Dict[str, Any]) -> bytes:
+    """
+    home/displays/<target> payload (timer, preset, lyrics; the dicts the Flask app, music_payload
+    and lyrics_payload build) in the binary layout of displays/wire.py. With a "render" block
+    the rows replace artist / song, which the board only uses without one.
+    """
+    mode = payload.get("mode") or "timer"
+    if mode not in WIRE_MODES:
+        raise ValueError(f"no wire encoding for mode {mode!r}")
+    out = bytearray((WIRE_MARK,))
+    out += WIRE_MODES[mode]
+    _wire_str(out, payload.get("message_id"))
+    if mode == "timer":
+        _wire_u32(out, payload.get("duration"))
+        _wire_str(out, payload.get("name"))
+    elif mode == "preset":
+        _wire_str(out, payload.get("preset_id"))
+        _wire_u32(out, payload.get("duration"))
+        _wire_str(out, payload.get("name"))
+        render = payload.get("render")
+        rows = (
+            isinstance(render, dict)
+            and render.get("v") == RENDER_VERSION
+            and isinstance(render.get("a"), dict)
+            and isinstance(render.get("s"), dict)
+        )
+        _wire_str(out, "" if rows else payload.get("artist"))
+        _wire_str(out, "" if rows else payload.get("song") or payload.get("title"))
+        out.append(2 if rows else 0)
+        if rows:
+            _wire_row(out, render["a"])
+            _wire_row(out, render["s"])
+    else:
+        out.append((1 if payload.get("r") else 0) | (2 if payload.get("pl") else 0))
+        _wire_u32(out, payload.get("p"))
+        _wire_str(out, payload.get("u"))
+        frames = payload.get("f") or []
+        out.append(min(len(frames), 255))
+        for frame in frames[:255]:
+            _wire_u32(out, frame[0])
+            _wire_str(out, frame[1])
+            _wire_str(out, frame[2] if len(frame) > 2 else "")
+    return bytes(out)
+
+
+def board_message(payload: Dict[str, Any], profile: DisplayProfile) -> Union[bytes, str]:
+    """MQTT body for a display: the wire format when its firmware decodes it, JSON otherwise."""
+    if profile.wire == WIRE_VERSION:
+        return wire_payload(payload)
+    return json.dumps(payload)
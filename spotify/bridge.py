@@ -11,18 +11,28 @@ Requires: spotipy, paho-mqtt, requests
 OAuth: complete once via the Flask app at /spotify/auth (same .spotify_cache), or run
   python3 -c "..." — token file must exist at repo root: .spotify_cache
 
-Broker ACL: allow the MQTT user to publish to home/spotify/#
+Multi-account (one process, one MQTT connection, shared lyrics cache):
+
+  python3 -m spotify.bridge --account alice=.spotify_cache_alice --account bob=.spotify_cache_bob
+
+Broker ACL: allow the MQTT user to publish to home/spotify/# and read .../lyrics/request
 """
 
 from __future__ import annotations
 
 import argparse
+import cProfile
+import heapq
 import json
 import os
+import pstats
 import sys
+import threading
 import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from functools import partial
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Tuple
+from typing import Any, Callable, Dict, List, Optional, Tuple, Union
 
 _ROOT = Path(__file__).resolve().parent.parent
 if str(_ROOT) not in sys.path:
@@ -30,10 +40,29 @@ if str(_ROOT) not in sys.path:
 
 import paho.mqtt.client as mqtt
 import requests
-
-from spotify.lrc import line_at_progress, parse_synced_lrc
-from spotify.lrclib_client import fetch_synced_lyrics
+from paho.mqtt.packettypes import PacketTypes
+from paho.mqtt.properties import Properties
+
+from spotify.lrc import (
+    WordTimings,
+    encode_word_timings,
+    line_at_progress,
+    parse_synced_lrc_words,
+    word_at_progress,
+)
+from spotify.board_render import (
+    LYRICS_WINDOW,
+    board_message,
+    lyric_frames,
+    lyrics_payload,
+    music_payload,
+    profile_for,
+)
+from spotify.local_library import LocalLibrary, LocalLibrarySource
+from spotify.lyrics_sources import LrclibSource, LyricsCache, LyricsSource, fetch_from_sources
+from spotify.metrics import METRICS, serve_metrics
 from spotify import topics
+from spotify.timing import anchor_changed, extrapolate_progress, index_at, make_anchor
 
 try:
     from mqtt_credentials import MQTT_BROKER, MQTT_PORT, MQTT_USER, MQTT_PASSWORD
@@ -50,23 +79,31 @@ try:
         SPOTIFY_REDIRECT_URI,
     )
 except ImportError:
-    print("Missing spotify_credentials.py in repo root (copy from spotify_credentials.py.template).")
-    sys.exit(1)
+    # Checked in _spotify_client, so the bridge module can be imported (bench, tests) without credentials.
+    SPOTIFY_CLIENT_ID = SPOTIFY_CLIENT_SECRET = SPOTIFY_REDIRECT_URI = None
+
+# Cap on word timestamps per lyrics/lines payload (karaoke data can be larger than the lines).
+MAX_PUBLISHED_WORDS = 1500
+# lyrics/request sooner than this after the last lines send: one resend once it has passed
+LINES_RESEND_MIN_S = 2.0
+# Lyrics on a board: send the next window once the current frame is this close to the last one sent
+BOARD_LYRICS_LOW_WATER = 2
 
 
 def _spotify_client(cache_path: Path) -> Any:
+    if SPOTIFY_CLIENT_ID is None:
+        print("Missing spotify_credentials.py in repo root (copy from spotify_credentials.py.template).")
+        sys.exit(1)
+
     import spotipy
-    from spotipy.oauth2 import SpotifyOAuth
-
-    return spotipy.Spotify(
-        auth_manager=SpotifyOAuth(
-            client_id=SPOTIFY_CLIENT_ID,
-            client_secret=SPOTIFY_CLIENT_SECRET,
-            redirect_uri=SPOTIFY_REDIRECT_URI,
-            scope="user-read-currently-playing user-read-playback-state",
-            cache_path=str(cache_path),
-        )
+
+    from spotify.token_manager import make_token_manager
+
+    tokens = make_token_manager(
+        SPOTIFY_CLIENT_ID, SPOTIFY_CLIENT_SECRET, SPOTIFY_REDIRECT_URI, cache_path
     )
+    tokens.start()
+    return spotipy.Spotify(auth_manager=tokens)
 
 
 def _default_spotify_cache_path() -> Path:
@@ -114,14 +151,16 @@ def _extract_track_state(
     }
 
 
-def _make_mqtt_client() -> mqtt.Client:
+def _make_mqtt_client(mqtt_v5: bool = False) -> mqtt.Client:
+    protocol = mqtt.MQTTv5 if mqtt_v5 else mqtt.MQTTv311
     try:
         return mqtt.Client(
             callback_api_version=mqtt.CallbackAPIVersion.VERSION1,
             client_id="spotify_mqtt_bridge",
+            protocol=protocol,
         )
     except (AttributeError, TypeError):
-        return mqtt.Client("spotify_mqtt_bridge")
+        return mqtt.Client("spotify_mqtt_bridge", protocol=protocol)
 
 
 def _mqtt_connect(
@@ -137,16 +176,444 @@ def _mqtt_connect(
     client.loop_start()
 
 
-def _publish(client: mqtt.Client, topic: str, payload: Dict[str, Any], retain: bool) -> None:
-    client.publish(topic, json.dumps(payload), qos=0, retain=retain)
+def _publish(
+    client: mqtt.Client,
+    topic: str,
+    payload: Union[Dict[str, Any], bytes, str],
+    policy: topics.TopicPolicy,
+    mqtt_v5: bool = False,
+) -> None:
+    """
+    Publish a dict as JSON, or a body already encoded (board_message). mqtt_v5: the client was made
+    with _make_mqtt_client(mqtt_v5=True), so policy.expiry_s is sent as the message expiry.
+    """
+    if isinstance(payload, (bytes, str)):
+        data = payload
+    else:
+        with METRICS.time("json_encode"):
+            data = json.dumps(payload)
+    properties = None
+    if policy.expiry_s and mqtt_v5:
+        properties = Properties(PacketTypes.PUBLISH)
+        properties.MessageExpiryInterval = policy.expiry_s
+    with METRICS.time("mqtt_publish"):
+        client.publish(topic, data, qos=policy.qos, retain=policy.retain, properties=properties)
+    METRICS.inc("mqtt_publishes")
+    METRICS.inc("mqtt_publish_bytes", len(data))
+
+
+def _lines_payload(
+    lines: List[Tuple[int, str]], words: List[Optional[WordTimings]]
+) -> Tuple[List[Dict[str, Any]], bool]:
+    """Timed lines for lyrics/lines; word timings ("w") only while within MAX_PUBLISHED_WORDS."""
+    out: List[Dict[str, Any]] = []
+    budget = MAX_PUBLISHED_WORDS
+    has_words = False
+    for (t, tx), w in zip(lines, words):
+        row: Dict[str, Any] = {"t": t, "text": tx}
+        if w is not None and len(w.times) <= budget:
+            row["w"] = encode_word_timings(w, t)
+            budget -= len(w.times)
+            has_words = True
+        out.append(row)
+    return out, has_words
+
+
+class AccountPoller:
+    """
+    One Spotify account: poll playback, fetch lyrics on track change and publish under its topic set.
+    poll_once() returns the delay until the next poll (adaptive: fast while playing, slower when idle).
+    """
+
+    def __init__(
+        self,
+        name: str,
+        sp: Any,
+        client: mqtt.Client,
+        topic_set: topics.TopicSet,
+        sources: List[LyricsSource],
+        lyrics_cache: LyricsCache,
+        library: Optional[LocalLibrary],
+        lyrics_save: bool,
+        dry_run: bool,
+        poll_interval: float,
+        paused_interval: float,
+        idle_interval: float,
+        clock: Callable[[], float] = time.time,
+        policies: Optional[Dict[str, topics.TopicPolicy]] = None,
+        mqtt_v5: bool = False,
+        board_targets: Optional[List[str]] = None,
+        lyrics_targets: Optional[List[str]] = None,
+    ) -> None:
+        self.name = name
+        self.sp = sp
+        self.client = client
+        self.topics = topic_set
+        self.sources = sources
+        self.lyrics_cache = lyrics_cache
+        self.library = library
+        self.lyrics_save = lyrics_save
+        self.dry_run = dry_run
+        self.poll_interval = poll_interval
+        self.paused_interval = paused_interval
+        self.idle_interval = idle_interval
+        # Wall clock in seconds; replaced by a virtual clock in spotify/bench.py
+        self.clock = clock
+        self.policies = dict(topics.DEFAULT_POLICIES, **(policies or {}))
+        # MQTT v5 client (_make_mqtt_client): publish with message expiry, and re-publish
+        # now_playing / anchor before it while still valid
+        self.mqtt_v5 = mqtt_v5
+        self.last_retained_at = 0.0
+        # Displays that get a board-ready music preset (spotify/board_render.py) on track change
+        self.board_targets = list(board_targets or [])
+        # Displays in lyrics mode: timed two-row frames per target, and how far they were sent
+        self.lyrics_targets = list(lyrics_targets or [])
+        self.board_frames: Dict[str, List[Tuple[int, str, str]]] = {}
+        self.board_sent_upto: Dict[str, int] = {}
+
+        self.last_track_uri: Optional[str] = None
+        self.lyric_lines: List[Tuple[int, str]] = []
+        self.lyric_words: List[Optional[WordTimings]] = []
+        self.first_poll = True
+        # Last published timing anchor / lyrics/current key: publish on change only, subscribers
+        # extrapolate progress locally (spotify/timing.py).
+        self.last_anchor: Optional[Dict[str, Any]] = None
+        self.last_current_key: Optional[Tuple[Any, ...]] = None
+        # Current lyrics/lines payload, re-sent on lyrics/request (from the MQTT network thread)
+        self._lines_lock = threading.Lock()
+        self.lines_payload: Optional[Dict[str, Any]] = None
+        self.lines_sent_at = 0.0
+        # One pending resend for requests that came in within LINES_RESEND_MIN_S of the last send
+        self._resend_timer: Optional[threading.Timer] = None
+
+    def _send(self, role: str, payload: Dict[str, Any]) -> None:
+        """Publish payload on this account's topic for role (TopicSet field) with the role's policy."""
+        if not self.dry_run:
+            _publish(self.client, getattr(self.topics, role), payload, self.policies[role], self.mqtt_v5)
+
+    def _send_lines(self) -> None:
+        with self._lines_lock:
+            payload = self.lines_payload
+            self.lines_sent_at = self.clock()
+        if payload is not None:
+            self._send("lyrics_lines", payload)
+
+    def handle_lyrics_request(self, request: Dict[str, Any]) -> None:
+        """
+        lyrics/request: re-send the current lines (unless another track was asked for). Requests
+        within LINES_RESEND_MIN_S of the last send are coalesced into one resend when it has passed.
+        """
+        METRICS.inc("lyrics_requests")
+        with self._lines_lock:
+            payload = self.lines_payload
+            if payload is None:
+                return
+            wanted = request.get("track_uri")
+            if wanted and wanted != payload.get("track_uri"):
+                return
+            wait_s = self.lines_sent_at + LINES_RESEND_MIN_S - self.clock()
+            if wait_s > 0:
+                if self._resend_timer is None:
+                    self._resend_timer = threading.Timer(wait_s, self._resend_lines, args=(self.lines_sent_at,))
+                    self._resend_timer.daemon = True
+                    self._resend_timer.start()
+                return
+        self._send_lines()
+
+    def _resend_lines(self, sent_at: float) -> None:
+        with self._lines_lock:
+            self._resend_timer = None
+            if self.lines_sent_at != sent_at:
+                return  # lines went out again meanwhile (new track, or a later request)
+        self._send_lines()
+
+    def _send_display(self, target: str, payload: Dict[str, Any]) -> None:
+        if not self.dry_run:
+            # JSON, or the binary command for boards that decode it (board_render.wire_payload)
+            with METRICS.time("board_encode"):
+                body = board_message(payload, profile_for(target))
+            _publish(self.client, topics.display_topic(target), body, self.policies["display"], self.mqtt_v5)
+
+    def _music_payload(self, np: Dict[str, Any], target: str) -> Dict[str, Any]:
+        return music_payload(np.get("artist") or "", np.get("title") or "", profile_for(target))
+
+    def _send_board_frames(self, np: Dict[str, Any]) -> None:
+        for target in self.board_targets:
+            if target not in self.lyrics_targets:
+                self._send_display(target, self._music_payload(np, target))
+
+    def _prepare_board_lyrics(self, np: Dict[str, Any]) -> None:
+        """New track: wrap / time the lyrics once per lyrics target (music preset when there are none)."""
+        self.board_frames = {}
+        self.board_sent_upto = {}
+        for target in self.lyrics_targets:
+            frames = lyric_frames(self.lyric_lines, profile_for(target), int(np.get("duration_ms") or 0))
+            if frames:
+                self.board_frames[target] = frames
+            elif np.get("track_uri"):
+                self._send_display(target, self._music_payload(np, target))
+
+    def _send_board_lyrics(self, anchor: Dict[str, Any], progress_ms: int, moved: bool) -> None:
+        """
+        Keep each lyrics board a few frames ahead: a replacing window (r=1) on track change / seek /
+        pause, then the next window when playback gets within BOARD_LYRICS_LOW_WATER of its end.
+        """
+        for target, frames in self.board_frames.items():
+            cur = max(0, index_at([f[0] for f in frames], progress_ms))
+            sent = self.board_sent_upto.get(target)
+            if sent is None or moved:
+                first, reset = cur, True
+            elif sent < len(frames) and cur >= sent - BOARD_LYRICS_LOW_WATER:
+                first, reset = sent, False
+            else:
+                continue
+            self.board_sent_upto[target] = min(len(frames), first + LYRICS_WINDOW)
+            self._send_display(
+                target,
+                lyrics_payload(anchor.get("u"), frames, first, progress_ms, bool(anchor.get("pl")), reset),
+            )
+
+    def _load_lyrics(self, np: Dict[str, Any]) -> Tuple[Dict[str, Any], Dict[str, Any]]:
+        """Fetch and parse lyrics for a new track; returns the (lyrics/track summary, lyrics/lines) payloads."""
+        self.lyric_lines = []
+        self.lyric_words = []
+        track_payload: Dict[str, Any] = {
+            "track_uri": np.get("track_uri"),
+            "artist": np.get("artist"),
+            "title": np.get("title"),
+            "album": np.get("album"),
+            "duration_ms": np.get("duration_ms"),
+            "has_lyrics": False,
+            "has_words": False,
+            "line_count": 0,
+            "source": None,
+        }
+        lines_payload: Dict[str, Any] = {
+            "track_uri": np.get("track_uri"),
+            "duration_ms": np.get("duration_ms"),
+            "lines": [],
+            "has_words": False,
+        }
+        if not (
+            np.get("track_uri")
+            and np.get("artist")
+            and np.get("title")
+            and int(np.get("duration_ms") or 0) > 0
+        ):
+            return track_payload, lines_payload
+
+        dur_s = int(np["duration_ms"]) // 1000
+        album = np.get("album") or ""
+        with METRICS.time("lyrics_fetch"):
+            lrc, source = fetch_from_sources(
+                self.sources,
+                np["artist"],
+                np["title"],
+                album,
+                dur_s,
+                cache=self.lyrics_cache,
+            )
+        METRICS.inc(f"lyrics_{source}" if source else "lyrics_missing")
+        if lrc and self.library is not None and self.lyrics_save and source != "local":
+            try:
+                self.library.save(np["artist"], np["title"], album, dur_s, lrc)
+            except OSError as e:
+                print(f"[{self.name}] Could not save lyrics to {self.library.root}: {e}")
+        if lrc:
+            with METRICS.time("lrc_parse"):
+                self.lyric_lines, self.lyric_words = parse_synced_lrc_words(lrc)
+            lines_payload["lines"], lines_payload["has_words"] = _lines_payload(
+                self.lyric_lines, self.lyric_words
+            )
+            track_payload["has_lyrics"] = True
+            track_payload["has_words"] = lines_payload["has_words"]
+            track_payload["line_count"] = len(self.lyric_lines)
+            track_payload["source"] = source
+        return track_payload, lines_payload
+
+    def _next_interval(self, np: Dict[str, Any], progress_ms: int) -> float:
+        if not np.get("track_uri"):
+            return self.idle_interval
+        if not np.get("is_playing"):
+            return self.paused_interval
+        # Poll right after the track should end so the next track shows up without a full interval.
+        remaining_s = (int(np.get("duration_ms") or 0) - progress_ms) / 1000.0
+        if 0 < remaining_s < self.poll_interval:
+            return max(0.3, remaining_s + 0.2)
+        return self.poll_interval
+
+    def poll_once(self) -> float:
+        with METRICS.time("poll"):
+            return self._poll()
+
+    def _poll(self) -> float:
+        ts_ms = int(self.clock() * 1000)
+        METRICS.inc("spotify_api_calls")
+        try:
+            with METRICS.time("spotify_api"):
+                current = self.sp.current_user_playing_track()
+        except Exception as e:
+            METRICS.inc("spotify_api_errors")
+            print(f"[{self.name}] Spotify API error: {e}")
+            return self.poll_interval
+
+        np = _extract_track_state(current, ts_ms)
+        uri = np.get("track_uri")
+        anchor = make_anchor(uri, np["progress_ms"], ts_ms, bool(np.get("is_playing")))
+
+        expiry = self.policies["now_playing"].expiry_s
+        stale = (
+            self.mqtt_v5
+            and expiry is not None
+            and self.clock() - self.last_retained_at > expiry / 2
+        )
+        moved = anchor_changed(self.last_anchor, anchor)
+        if stale or moved:
+            self.last_anchor = anchor
+            self.last_retained_at = self.clock()
+            self._send("now_playing", np)
+            self._send("lyrics_anchor", anchor)
+
+        if self.first_poll or uri != self.last_track_uri:
+            self.first_poll = False
+            self.last_track_uri = uri
+            track_payload, lines_payload = self._load_lyrics(np)
+            with self._lines_lock:
+                self.lines_payload = lines_payload
+            # Small retained summary first; full lines once, not retained (re-sent on lyrics/request)
+            self._send("lyrics_track", track_payload)
+            self._send_lines()
+            if uri:
+                self._send_board_frames(np)
+            self._prepare_board_lyrics(np)
+
+        lyric_lines = self.lyric_lines
+        prog = extrapolate_progress(anchor, int(self.clock() * 1000), int(np["duration_ms"]))
+        idx, prev_t, cur_t, next_t = line_at_progress(lyric_lines, prog)
+        if self.board_frames:
+            self._send_board_lyrics(anchor, prog, moved)
+        cur_payload = {
+            "track_uri": uri,
+            "is_playing": np.get("is_playing"),
+            "progress_ms": np.get("progress_ms"),
+            "duration_ms": np.get("duration_ms"),
+            "timestamp_ms": np.get("timestamp_ms"),
+            "has_lyrics": bool(lyric_lines),
+            "line_index": idx,
+            "previous": prev_t,
+            "current": cur_t,
+            "next": next_t,
+        }
+        if idx >= 0 and self.lyric_words[idx] is not None:
+            cur_payload["word_index"] = word_at_progress(self.lyric_words[idx], prog)
+        if not lyric_lines and uri and np.get("is_playing"):
+            cur_payload["message"] = (
+                "No synced lyrics (local / LRCLIB)" if self.library else "No synced lyrics (LRCLIB)"
+            )
+
+        current_key = (uri, idx, bool(np.get("is_playing")), bool(lyric_lines))
+        if current_key != self.last_current_key:
+            self.last_current_key = current_key
+            self._send("lyrics_current", cur_payload)
+
+        if self.dry_run:
+            print(
+                json.dumps(
+                    {"account": self.name, "now": np, "lyrics_hint": cur_payload.get("current")},
+                    indent=2,
+                )
+            )
+
+        return self._next_interval(np, prog)
+
+
+def _run_pollers(pollers: List[AccountPoller], workers: int) -> None:
+    """
+    Shared scheduler: a heap of (due time, poller) feeding a thread pool, so slow Spotify or
+    lyrics calls for one account never delay the others. Each poller is queued at most once,
+    so its own polls never overlap.
+    """
+    pool = ThreadPoolExecutor(max_workers=max(1, workers), thread_name_prefix="spotify-poll")
+    due: List[Tuple[float, int]] = [(time.monotonic(), i) for i in range(len(pollers))]
+    heapq.heapify(due)
+    cond = threading.Condition()
+
+    def reschedule(i: int, fut: Future) -> None:
+        try:
+            delay = fut.result()
+        except Exception as e:
+            print(f"[{pollers[i].name}] Poll failed: {e}")
+            delay = pollers[i].idle_interval
+        with cond:
+            heapq.heappush(due, (time.monotonic() + delay, i))
+            cond.notify()
+
+    try:
+        while True:
+            with cond:
+                while not due or due[0][0] > time.monotonic():
+                    cond.wait(timeout=due[0][0] - time.monotonic() if due else None)
+                _, i = heapq.heappop(due)
+            pool.submit(pollers[i].poll_once).add_done_callback(partial(reschedule, i))
+    finally:
+        pool.shutdown(wait=False, cancel_futures=True)
+
+
+def _profile_pollers(pollers: List[AccountPoller], iterations: int, out: Optional[Path]) -> None:
+    """
+    --profile N: run N polls sequentially in this thread under cProfile (sleeps between polls
+    are not profiled), then print the top functions by cumulative time.
+    """
+    prof = cProfile.Profile()
+    due = [0.0] * len(pollers)
+    for _ in range(iterations):
+        i = min(range(len(pollers)), key=due.__getitem__)
+        time.sleep(max(0.0, due[i] - time.monotonic()))
+        prof.enable()
+        try:
+            delay = pollers[i].poll_once()
+        finally:
+            prof.disable()
+        due[i] = time.monotonic() + delay
+
+    stats = pstats.Stats(prof).sort_stats("cumulative")
+    stats.print_stats(30)
+    if out:
+        stats.dump_stats(str(out))
+        print(f"Profile written to {out} (open with: python3 -m pstats {out})")
+    print(json.dumps(METRICS.snapshot(), indent=2))
+
+
+def _publish_metrics_forever(
+    client: mqtt.Client, interval: float, policy: topics.TopicPolicy, mqtt_v5: bool
+) -> None:
+    while True:
+        time.sleep(interval)
+        try:
+            _publish(client, topics.BRIDGE_METRICS, METRICS.snapshot(), policy, mqtt_v5)
+        except Exception as e:
+            print(f"Metrics publish error: {e}")
+
+
+def _attach_lyrics_requests(client: mqtt.Client, pollers: List[AccountPoller]) -> None:
+    """Subscribe to each account's lyrics/request (again on every reconnect) and dispatch to its poller."""
+    by_topic = {p.topics.lyrics_request: p for p in pollers}
+
+    def on_connect(c: mqtt.Client, *_args: Any) -> None:
+        c.subscribe([(topic, 1) for topic in by_topic])
 
+    def on_message(_c: mqtt.Client, _userdata: Any, msg: mqtt.MQTTMessage) -> None:
+        poller = by_topic.get(msg.topic)
+        if poller is None:
+            return
+        try:
+            request = json.loads(msg.payload.decode("utf-8")) if msg.payload else {}
+        except (ValueError, UnicodeDecodeError):
+            request = {}
+        poller.handle_lyrics_request(request if isinstance(request, dict) else {})
 
-def _estimate_progress(now_playing: Dict[str, Any], now_ms: int) -> int:
-    base = int(now_playing.get("progress_ms") or 0)
-    ts = int(now_playing.get("timestamp_ms") or now_ms)
-    if not now_playing.get("is_playing"):
-        return max(0, base)
-    return max(0, base + (now_ms - ts))
+    client.on_connect = on_connect
+    client.on_message = on_message
 
 
 def run_loop(
@@ -157,12 +624,81 @@ def run_loop(
     mqtt_user: str,
     mqtt_password: str,
     spotify_cache: Path,
+    lyrics_race: bool = False,
+    lyrics_dir: Optional[Path] = None,
+    lyrics_save: bool = False,
+    accounts: Optional[List[Tuple[str, Path]]] = None,
+    paused_interval: float = 5.0,
+    idle_interval: float = 10.0,
+    workers: int = 4,
+    metrics_port: Optional[int] = None,
+    metrics_interval: float = 0.0,
+    profile_iterations: int = 0,
+    profile_out: Optional[Path] = None,
+    mqtt_v5: bool = False,
+    topic_policies: Optional[Dict[str, topics.TopicPolicy]] = None,
+    board_targets: Optional[List[Tuple[Optional[str], str]]] = None,
+    lyrics_targets: Optional[List[Tuple[Optional[str], str]]] = None,
 ) -> None:
-    sp = _spotify_client(spotify_cache)
-    http = requests.Session()
-
-    client = _make_mqtt_client()
+    """
+    Run the bridge. Without accounts: one account (spotify_cache) publishing under home/spotify.
+    With accounts [(name, cache_path), ...]: one poller per account under home/spotify/<name>,
+    sharing one MQTT connection, the lyrics sources and the lyrics cache.
+    board_targets [(account or None, target), ...]: displays that get music presets from that
+    account (None: the first account); lyrics_targets the same for boards in lyrics mode.
+    """
+    # Local .lrc library (if configured) is queried before LRCLIB.
+    library: Optional[LocalLibrary] = None
+    sources: List[LyricsSource] = []
+    if lyrics_dir:
+        library = LocalLibrary(lyrics_dir)
+        sources.append(LocalLibrarySource(library))
+    sources.append(LrclibSource(race=lyrics_race))
+    lyrics_cache = LyricsCache()
+
+    client = _make_mqtt_client(mqtt_v5)
+    policies = dict(topics.DEFAULT_POLICIES, **(topic_policies or {}))
+
+    if accounts:
+        plan = [(name, cache, topics.for_prefix(topics.account_prefix(name))) for name, cache in accounts]
+    else:
+        plan = [("default", spotify_cache, topics.for_prefix())]
+
+    pollers = [
+        AccountPoller(
+            name=name,
+            sp=_spotify_client(cache),
+            client=client,
+            topic_set=topic_set,
+            sources=sources,
+            lyrics_cache=lyrics_cache,
+            library=library,
+            lyrics_save=lyrics_save,
+            dry_run=dry_run,
+            poll_interval=poll_interval,
+            paused_interval=max(poll_interval, paused_interval),
+            idle_interval=max(poll_interval, idle_interval),
+            policies=policies,
+            mqtt_v5=mqtt_v5,
+            board_targets=[
+                target
+                for account, target in board_targets or []
+                if account == name or (account is None and name == plan[0][0])
+            ],
+            lyrics_targets=[
+                target
+                for account, target in lyrics_targets or []
+                if account == name or (account is None and name == plan[0][0])
+            ],
+        )
+        for name, cache, topic_set in plan
+    ]
+    for flag, targets in (("--board-target", board_targets), ("--board-lyrics", lyrics_targets)):
+        unknown = {a for a, _ in targets or [] if a is not None} - {p.name for p in pollers}
+        if unknown:
+            print(f"{flag}: unknown account(s) {', '.join(sorted(unknown))}")
     if not dry_run:
+        _attach_lyrics_requests(client, pollers)
         _mqtt_connect(
             client,
             mqtt_broker,
@@ -170,106 +706,169 @@ def run_loop(
             mqtt_user or None,
             mqtt_password or None,
         )
-
-    last_track_uri: Optional[str] = None
-    lyric_lines: List[Tuple[int, str]] = []
-    first_poll = True
+    for poller in pollers:
+        print(f"[{poller.name}] publishing under {poller.topics.now_playing.rsplit('/', 1)[0]}")
+
+    if metrics_port:
+        serve_metrics(metrics_port)
+        print(f"Metrics on http://127.0.0.1:{metrics_port}/metrics")
+    if metrics_interval > 0 and not dry_run:
+        threading.Thread(
+            target=_publish_metrics_forever,
+            args=(client, metrics_interval, policies["bridge_metrics"], mqtt_v5),
+            name="bridge-metrics-publish",
+            daemon=True,
+        ).start()
 
     try:
-        while True:
-            ts_ms = int(time.time() * 1000)
-            try:
-                current = sp.current_user_playing_track()
-            except Exception as e:
-                print(f"Spotify API error: {e}")
-                time.sleep(poll_interval)
-                continue
-
-            np = _extract_track_state(current, ts_ms)
-            uri = np.get("track_uri")
-
-            if not dry_run:
-                _publish(client, topics.NOW_PLAYING, np, retain=True)
-
-            if first_poll or uri != last_track_uri:
-                first_poll = False
-                last_track_uri = uri
-                lyric_lines = []
-                track_payload: Dict[str, Any] = {
-                    "track_uri": uri,
-                    "artist": np.get("artist"),
-                    "title": np.get("title"),
-                    "album": np.get("album"),
-                    "duration_ms": np.get("duration_ms"),
-                    "lines": [],
-                    "has_lyrics": False,
-                    "source": None,
-                }
-                if (
-                    uri
-                    and np.get("artist")
-                    and np.get("title")
-                    and int(np.get("duration_ms") or 0) > 0
-                ):
-                    dur_s = int(np["duration_ms"]) // 1000
-                    lrc = fetch_synced_lyrics(
-                        np["artist"],
-                        np["title"],
-                        np.get("album") or "",
-                        dur_s,
-                        session=http,
-                    )
-                    if lrc:
-                        lyric_lines = parse_synced_lrc(lrc)
-                        track_payload["lines"] = [{"t": t, "text": tx} for t, tx in lyric_lines]
-                        track_payload["has_lyrics"] = True
-                        track_payload["source"] = "lrclib"
-                if not dry_run:
-                    _publish(client, topics.LYRICS_TRACK, track_payload, retain=True)
-
-            prog = _estimate_progress(np, int(time.time() * 1000))
-            idx, prev_t, cur_t, next_t = line_at_progress(lyric_lines, prog)
-            cur_payload = {
-                "track_uri": uri,
-                "is_playing": np.get("is_playing"),
-                "progress_ms": np.get("progress_ms"),
-                "duration_ms": np.get("duration_ms"),
-                "timestamp_ms": np.get("timestamp_ms"),
-                "has_lyrics": bool(lyric_lines),
-                "line_index": idx,
-                "previous": prev_t,
-                "current": cur_t,
-                "next": next_t,
-            }
-            if not lyric_lines and uri and np.get("is_playing"):
-                cur_payload["message"] = "No synced lyrics (LRCLIB)"
-
-            if not dry_run:
-                _publish(client, topics.LYRICS_CURRENT, cur_payload, retain=False)
-
-            if dry_run:
-                print(json.dumps({"now": np, "lyrics_hint": cur_payload.get("current")}, indent=2))
-
-            time.sleep(poll_interval)
+        if profile_iterations > 0:
+            _profile_pollers(pollers, profile_iterations, profile_out)
+        else:
+            _run_pollers(pollers, workers)
     finally:
         if not dry_run:
             client.loop_stop()
             client.disconnect()
 
 
+def _parse_account(value: str) -> Tuple[str, Path]:
+    """--account NAME=CACHE_PATH"""
+    name, sep, cache = value.partition("=")
+    name = name.strip()
+    if not sep or not name or not cache.strip() or "/" in name or "#" in name or "+" in name:
+        raise argparse.ArgumentTypeError("expected NAME=CACHE_PATH (NAME without / # +)")
+    return name, Path(cache.strip()).expanduser()
+
+
+def _parse_board_target(value: str) -> Tuple[Optional[str], str]:
+    """--board-target [ACCOUNT:]TARGET"""
+    account, sep, target = value.rpartition(":")
+    target = target.strip().lower()
+    if not target or "/" in target or "#" in target or "+" in target:
+        raise argparse.ArgumentTypeError("expected [ACCOUNT:]TARGET, e.g. wc or alice:wc")
+    return (account.strip() or None) if sep else None, target
+
+
+def _parse_topic_policy(value: str) -> Tuple[str, topics.TopicPolicy]:
+    try:
+        return topics.parse_policy(value)
+    except ValueError as e:
+        raise argparse.ArgumentTypeError(str(e))
+
+
 def main() -> None:
     p = argparse.ArgumentParser(description="Spotify → MQTT bridge (now playing + LRCLIB lyrics)")
     p.add_argument(
         "--interval",
         type=float,
         default=1.0,
-        help="Poll Spotify / publish interval in seconds (default: 1.0)",
+        help="Poll Spotify / publish interval in seconds while playing (default: 1.0)",
+    )
+    p.add_argument(
+        "--paused-interval",
+        type=float,
+        default=5.0,
+        help="Poll interval while paused (default: 5.0)",
+    )
+    p.add_argument(
+        "--idle-interval",
+        type=float,
+        default=10.0,
+        help="Poll interval when nothing is playing (default: 10.0)",
+    )
+    p.add_argument(
+        "--account",
+        dest="accounts",
+        action="append",
+        type=_parse_account,
+        default=None,
+        metavar="NAME=CACHE_PATH",
+        help="Multi-account mode: repeat per Spotify account; publishes under home/spotify/NAME/...",
+    )
+    p.add_argument(
+        "--workers",
+        type=int,
+        default=4,
+        help="Threads shared by all account polls (default: 4)",
     )
     p.add_argument(
         "--dry-run",
         action="store_true",
         help="Do not use MQTT; print JSON to stdout",
     )
+    p.add_argument(
+        "--lyrics-race",
+        action="store_true",
+        help="Query LRCLIB exact-match and search concurrently; first synced hit wins",
+    )
+    p.add_argument(
+        "--lyrics-dir",
+        type=Path,
+        default=None,
+        help="Directory of .lrc files (indexed in <dir>/.lyrics_index.sqlite), queried before LRCLIB",
+    )
+    p.add_argument(
+        "--lyrics-save",
+        action="store_true",
+        help="Save lyrics fetched from LRCLIB into --lyrics-dir for offline use",
+    )
+    p.add_argument(
+        "--metrics-port",
+        type=int,
+        default=None,
+        help="Serve stage latency histograms / counters on http://127.0.0.1:PORT/metrics",
+    )
+    p.add_argument(
+        "--metrics-interval",
+        type=float,
+        default=0.0,
+        help=f"Also publish metrics JSON on {topics.BRIDGE_METRICS} every N seconds (default: off)",
+    )
+    p.add_argument(
+        "--profile",
+        type=int,
+        default=0,
+        metavar="N",
+        help="Run N polls under cProfile (sequentially), print stats and exit",
+    )
+    p.add_argument(
+        "--profile-out",
+        type=Path,
+        default=None,
+        help="With --profile: also write raw pstats data to this file",
+    )
+    p.add_argument(
+        "--mqtt-v5",
+        action="store_true",
+        help="Connect with MQTT v5 so retained now_playing / anchor carry a message expiry",
+    )
+    p.add_argument(
+        "--topic-policy",
+        dest="topic_policies",
+        action="append",
+        type=_parse_topic_policy,
+        default=None,
+        metavar="ROLE=QOS[,retain|noretain][,expiry=S]",
+        help=f"Override QoS / retain / expiry per topic role ({', '.join(topics.DEFAULT_POLICIES)})",
+    )
+    p.add_argument(
+        "--board-target",
+        dest="board_targets",
+        action="append",
+        type=_parse_board_target,
+        default=None,
+        metavar="[ACCOUNT:]TARGET",
+        help="Publish a board-ready music preset to home/displays/TARGET on each track change (repeatable)",
+    )
+    p.add_argument(
+        "--board-lyrics",
+        dest="lyrics_targets",
+        action="append",
+        type=_parse_board_target,
+        default=None,
+        metavar="[ACCOUNT:]TARGET",
+        help="Show synced lyrics on home/displays/TARGET (wc firmware lyrics mode; repeatable)",
+    )
     p.add_argument("--broker", default=None, help="Override MQTT broker host")
     p.add_argument("--port", type=int, default=None, help="Override MQTT port")
     p.add_argument("--mqtt-user", default=None, help="Override MQTT username")
@@ -297,6 +896,21 @@ def main() -> None:
         mqtt_user=str(muser or ""),
         mqtt_password=str(mpass or ""),
         spotify_cache=scache,
+        lyrics_race=args.lyrics_race,
+        lyrics_dir=args.lyrics_dir.expanduser() if args.lyrics_dir else None,
+        lyrics_save=args.lyrics_save,
+        accounts=args.accounts,
+        paused_interval=args.paused_interval,
+        idle_interval=args.idle_interval,
+        workers=args.workers,
+        metrics_port=args.metrics_port,
+        metrics_interval=args.metrics_interval,
+        profile_iterations=max(0, args.profile),
+        profile_out=args.profile_out,
+        mqtt_v5=args.mqtt_v5,
+        topic_policies=dict(args.topic_policies or []),
+        board_targets=args.board_targets,
+        lyrics_targets=args.lyrics_targets,
     )
 
 
@@ -0,0 +1,276 @@
+"""
+Deterministic stand-ins for Spotify, LRCLIB and the MQTT broker, for running the bridge offline
+(spotify/bench.py, tests). Everything runs on a FakeClock: injected latency advances virtual
+time instead of sleeping, so an hour of playback simulates in a second or two.
+
+  clock = FakeClock()
+  tracks = [FakeTrack("spotify:track:a", "Artist", "Song", "Album", 200_000, synthetic_lrc(200_000))]
+  sp = FakeSpotify(tracks, [(0, "play", 0), (60, "seek", 150_000), (90, "pause", None)], clock)
+  sp.current_user_playing_track()   # same shape as spotipy's result
+"""
+
+from __future__ import annotations
+
+import json
+import random
+import threading
+from typing import Any, Dict, List, NamedTuple, Optional, Sequence, Tuple
+from urllib.parse import urlparse
+
+import requests
+
+from spotify.matching import normalize_artist, normalize_title
+
+# Script actions: (at_s, action, arg)
+#   ("play", track_index)  start a track from 0 (later tracks follow when it ends)
+#   ("seek", ms)  ("pause", None)  ("resume", None)  ("stop", None)
+ScriptEvent = Tuple[float, str, Any]
+
+
+class FakeClock:
+    """Virtual wall clock (seconds since the epoch); thread-safe."""
+
+    def __init__(self, start: float = 1_700_000_000.0) -> None:
+        self._now = start
+        self._lock = threading.Lock()
+
+    def time(self) -> float:
+        with self._lock:
+            return self._now
+
+    def advance(self, seconds: float) -> None:
+        with self._lock:
+            self._now += max(0.0, seconds)
+
+    sleep = advance
+
+
+class FakeTrack(NamedTuple):
+    uri: str
+    artist: str
+    title: str
+    album: str
+    duration_ms: int
+    # Synced LRC served by FakeLrclibSession (None: LRCLIB has no lyrics for it)
+    lrc: Optional[str] = None
+    # LRCLIB's title when it differs from Spotify's (e.g. without " - Remastered 2011")
+    lrclib_title: Optional[str] = None
+
+
+def synthetic_lrc(duration_ms: int, line_ms: int = 4000) -> str:
+    """One "Line n" every line_ms from 1 s until the end of the track."""
+    rows = []
+    for n, t in enumerate(range(1000, duration_ms, line_ms), start=1):
+        rows.append(f"[{t // 60000:02d}:{t // 1000 % 60:02d}.{t % 1000 // 10:02d}]Line {n}")
+    return "\n".join(rows) + "\n"
+
+
+def repeat_script(script: Sequence[ScriptEvent], period_s: float, total_s: float) -> List[ScriptEvent]:
+    """Script repeated every period_s until total_s (for benchmarks longer than one scenario)."""
+    out: List[ScriptEvent] = []
+    offset = 0.0
+    while offset < total_s:
+        out.extend((offset + at, action, arg) for at, action, arg in script if offset + at < total_s)
+        offset += period_s
+    return out
+
+
+class FakeSpotify:
+    """
+    Scripted playback with spotipy's current_user_playing_track() shape.
+    latency_s advances the clock per call; error_rate raises ConnectionError (seeded, reproducible).
+    """
+
+    def __init__(
+        self,
+        tracks: Sequence[FakeTrack],
+        script: Sequence[ScriptEvent],
+        clock: FakeClock,
+        latency_s: float = 0.0,
+        error_rate: float = 0.0,
+        seed: int = 0,
+    ) -> None:
+        self.tracks = list(tracks)
+        self.script = sorted(script, key=lambda e: e[0])
+        self.clock = clock
+        self.latency_s = latency_s
+        self.error_rate = error_rate
+        self._rng = random.Random(seed)
+        self.t0 = clock.time()
+        self.calls = 0
+        self.errors = 0
+
+    def _run_until(self, idx: Optional[int], pos: float, playing: bool, dt_ms: float) -> Tuple[Optional[int], float]:
+        """Advance playback by dt_ms, moving on to the next track(s) at the end of each."""
+        if idx is None or not playing:
+            return idx, pos
+        pos += dt_ms
+        while idx is not None and pos >= self.tracks[idx].duration_ms:
+            pos -= self.tracks[idx].duration_ms
+            idx = idx + 1 if idx + 1 < len(self.tracks) else None
+        return idx, (pos if idx is not None else 0.0)
+
+    def state_at(self, t: float) -> Tuple[Optional[FakeTrack], int, bool]:
+        """Ground truth at wall time t: (track or None, progress_ms, is_playing)."""
+        idx: Optional[int] = None
+        pos = 0.0
+        playing = False
+        last = self.t0
+        for at, action, arg in self.script:
+            at_abs = self.t0 + at
+            if at_abs > t:
+                break
+            idx, pos = self._run_until(idx, pos, playing, (at_abs - last) * 1000.0)
+            last = at_abs
+            if action == "play":
+                idx, pos, playing = int(arg), 0.0, True
+            elif action == "seek" and idx is not None:
+                pos = float(min(int(arg), self.tracks[idx].duration_ms - 1))
+            elif action == "pause":
+                playing = False
+            elif action == "resume":
+                playing = idx is not None
+            elif action == "stop":
+                idx, pos, playing = None, 0.0, False
+        idx, pos = self._run_until(idx, pos, playing, (t - last) * 1000.0)
+        if idx is None:
+            return None, 0, False
+        return self.tracks[idx], int(pos), playing
+
+    def current_user_playing_track(self) -> Optional[Dict[str, Any]]:
+        self.calls += 1
+        # Progress is sampled half-way through the simulated round trip
+        self.clock.advance(self.latency_s / 2)
+        track, progress, playing = self.state_at(self.clock.time())
+        self.clock.advance(self.latency_s / 2)
+        if self.error_rate and self._rng.random() < self.error_rate:
+            self.errors += 1
+            raise ConnectionError("injected Spotify API error")
+        if track is None:
+            return None
+        return {
+            "is_playing": playing,
+            "progress_ms": progress,
+            "item": {
+                "uri": track.uri,
+                "name": track.title,
+                "duration_ms": track.duration_ms,
+                "artists": [{"name": a.strip()} for a in track.artist.split(",")],
+                "album": {"name": track.album},
+            },
+        }
+
+
+class FakeResponse:
+    def __init__(self, status_code: int, data: Any) -> None:
+        self.status_code = status_code
+        self._data = data
+
+    def json(self) -> Any:
+        return self._data
+
+
+class FakeLrclibSession:
+    """requests.Session stand-in answering LRCLIB /api/get and /api/search from FakeTracks."""
+
+    def __init__(
+        self,
+        tracks: Sequence[FakeTrack],
+        clock: Optional[FakeClock] = None,
+        latency_s: float = 0.0,
+        error_rate: float = 0.0,
+        seed: int = 0,
+    ) -> None:
+        self.tracks = [t for t in tracks if t.lrc]
+        self.clock = clock
+        self.latency_s = latency_s
+        self.error_rate = error_rate
+        self._rng = random.Random(seed)
+        self._lock = threading.Lock()
+        self.requests = 0
+        self.errors = 0
+
+    def _record(self, t: FakeTrack) -> Dict[str, Any]:
+        return {
+            "trackName": t.lrclib_title or t.title,
+            "artistName": t.artist,
+            "albumName": t.album,
+            "duration": t.duration_ms / 1000.0,
+            "syncedLyrics": t.lrc,
+        }
+
+    def get(self, url: str, params: Optional[Dict[str, Any]] = None, **_kwargs: Any) -> FakeResponse:
+        with self._lock:
+            self.requests += 1
+            fail = bool(self.error_rate) and self._rng.random() < self.error_rate
+            if fail:
+                self.errors += 1
+        if self.clock is not None:
+            self.clock.advance(self.latency_s)
+        if fail:
+            raise requests.ConnectionError("injected LRCLIB error")
+
+        params = params or {}
+        path = urlparse(url).path
+        artist = str(params.get("artist_name", ""))
+        title = str(params.get("track_name", ""))
+        if path.endswith("/get"):
+            # Exact lookup: names must match as given (so "Song - Remastered" falls through to search)
+            for t in self.tracks:
+                if (
+                    t.artist.casefold() == artist.casefold()
+                    and (t.lrclib_title or t.title).casefold() == title.casefold()
+                    and abs(t.duration_ms / 1000.0 - float(params.get("duration", 0))) <= 2
+                ):
+                    return FakeResponse(200, self._record(t))
+            return FakeResponse(404, {"message": "Not found"})
+        if path.endswith("/search"):
+            key = normalize_artist(artist)
+            title_key = normalize_title(title)
+            return FakeResponse(
+                200,
+                [
+                    self._record(t)
+                    for t in self.tracks
+                    if normalize_artist(t.artist) == key or normalize_title(t.lrclib_title or t.title) == title_key
+                ],
+            )
+        return FakeResponse(404, {})
+
+
+class FakeMqttClient:
+    """In-process MQTT sink: records publishes and keeps the last (decoded) payload per topic."""
+
+    def __init__(self, clock: Optional[FakeClock] = None) -> None:
+        self.clock = clock
+        self._lock = threading.Lock()
+        self.messages: List[Tuple[float, str, int, bool]] = []
+        self.last: Dict[str, Any] = {}
+        # Last MQTT v5 message expiry per topic (None: published without one)
+        self.expiry: Dict[str, Optional[int]] = {}
+
+    def publish(
+        self,
+        topic: str,
+        payload: Any = None,
+        qos: int = 0,
+        retain: bool = False,
+        properties: Any = None,
+        **_kwargs: Any,
+    ) -> None:
+        data = payload if isinstance(payload, (str, bytes)) else json.dumps(payload)
+        t = self.clock.time() if self.clock is not None else 0.0
+        with self._lock:
+            self.messages.append((t, topic, len(data), retain))
+            self.expiry[topic] = getattr(properties, "MessageExpiryInterval", None)
+            try:
+                self.last[topic] = json.loads(data)
+            except ValueError:
+                self.last[topic] = data
+
+    def counts(self) -> Dict[str, int]:
+        out: Dict[str, int] = {}
+        with self._lock:
+            for _, topic, _, _ in self.messages:
+                out[topic] = out.get(topic, 0) + 1
+        return out
@@ -0,0 +1,190 @@
+"""
+Local library of .lrc files, indexed in SQLite by normalized artist / title / duration
+(same keys as the LRCLIB search matching, see spotify/matching.py).
+
+The index is built on first use and refreshed incrementally: only files whose mtime changed are
+re-read, removed files are dropped. Lookups are a single indexed query (no network).
+
+  library = LocalLibrary(Path("~/lyrics").expanduser())
+  lrc = library.lookup("Artist", "Title", 215)
+"""
+
+from __future__ import annotations
+
+import os
+import re
+import sqlite3
+import threading
+from pathlib import Path
+from typing import Dict, Optional, Tuple
+
+from spotify.matching import MAX_DURATION_DIFF_S, normalize_artist, normalize_title
+
+INDEX_FILENAME = ".lyrics_index.sqlite"
+# Bump when the key normalization changes; older indexes are rebuilt.
+INDEX_VERSION = 2
+
+_TAG_RE = re.compile(r"^\[(ar|ti|al|length):(.*)\]\s*$", re.IGNORECASE)
+_LENGTH_RE = re.compile(r"^\s*(?:(\d+):)?(\d+)(?:\.\d+)?\s*$")
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS lrc_files (
+    path TEXT PRIMARY KEY,
+    mtime_ns INTEGER NOT NULL,
+    artist_key TEXT NOT NULL,
+    title_key TEXT NOT NULL,
+    duration_s INTEGER,
+    synced TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS lrc_files_match ON lrc_files (artist_key, title_key);
+"""
+
+
+def _parse_length(value: str) -> Optional[int]:
+    """[length: 3:45] / [length:225] -> seconds."""
+    m = _LENGTH_RE.match(value)
+    if not m:
+        return None
+    return int(m.group(1) or 0) * 60 + int(m.group(2))
+
+
+def read_lrc_metadata(path: Path, synced: str) -> Tuple[str, str, Optional[int]]:
+    """(artist, title, duration_s) from [ar:]/[ti:]/[length:] tags, else from "Artist - Title.lrc"."""
+    tags: Dict[str, str] = {}
+    for raw in synced.splitlines()[:20]:
+        m = _TAG_RE.match(raw.strip())
+        if m:
+            tags[m.group(1).lower()] = m.group(2).strip()
+
+    artist = tags.get("ar", "")
+    title = tags.get("ti", "")
+    if not artist or not title:
+        stem = path.stem
+        if " - " in stem:
+            a, t = stem.split(" - ", 1)
+            artist = artist or a
+            title = title or t
+        else:
+            title = title or stem
+    duration = _parse_length(tags["length"]) if "length" in tags else None
+    return artist.strip(), title.strip(), duration
+
+
+class LocalLibrary:
+    """SQLite-backed index over a directory of .lrc files (thread-safe)."""
+
+    def __init__(self, root: Path, index_path: Optional[Path] = None) -> None:
+        self.root = root
+        self.index_path = index_path or (root / INDEX_FILENAME)
+        self._lock = threading.Lock()
+        self._db = sqlite3.connect(str(self.index_path), check_same_thread=False)
+        (version,) = self._db.execute("PRAGMA user_version").fetchone()
+        if version != INDEX_VERSION:
+            self._db.execute("DROP TABLE IF EXISTS lrc_files")
+            self._db.execute(f"PRAGMA user_version = {INDEX_VERSION}")
+        self._db.executescript(_SCHEMA)
+
+    def refresh(self) -> Tuple[int, int]:
+        """Re-index new/changed files by mtime and drop deleted ones. Returns (updated, removed)."""
+        seen: Dict[str, int] = {}
+        for dirpath, _dirs, files in os.walk(self.root):
+            for fn in files:
+                if fn.lower().endswith(".lrc"):
+                    p = os.path.join(dirpath, fn)
+                    try:
+                        seen[p] = os.stat(p).st_mtime_ns
+                    except OSError:
+                        continue
+
+        with self._lock:
+            known = dict(self._db.execute("SELECT path, mtime_ns FROM lrc_files"))
+            updated = 0
+            with self._db:
+                for p, mtime_ns in seen.items():
+                    if known.get(p) == mtime_ns:
+                        continue
+                    try:
+                        synced = Path(p).read_text(encoding="utf-8", errors="replace")
+                    except OSError:
+                        continue
+                    self._upsert(Path(p), mtime_ns, synced)
+                    updated += 1
+                removed = [(p,) for p in known if p not in seen]
+                self._db.executemany("DELETE FROM lrc_files WHERE path = ?", removed)
+        return updated, len(removed)
+
+    def _upsert(self, path: Path, mtime_ns: int, synced: str) -> None:
+        artist, title, duration = read_lrc_metadata(path, synced)
+        self._db.execute(
+            "INSERT OR REPLACE INTO lrc_files (path, mtime_ns, artist_key, title_key, duration_s, synced)"
+            " VALUES (?, ?, ?, ?, ?, ?)",
+            (str(path), mtime_ns, normalize_artist(artist), normalize_title(title), duration, synced),
+        )
+
+    def lookup(self, artist: str, title: str, duration_sec: int) -> Optional[str]:
+        """Closest-duration match for artist/title (files without [length:] match any duration)."""
+        best: Optional[str] = None
+        best_diff = MAX_DURATION_DIFF_S + 1
+        with self._lock:
+            rows = self._db.execute(
+                "SELECT synced, duration_s FROM lrc_files WHERE artist_key = ? AND title_key = ?",
+                (normalize_artist(artist), normalize_title(title)),
+            ).fetchall()
+        for synced, duration_s in rows:
+            diff = MAX_DURATION_DIFF_S if duration_s is None else abs(duration_s - int(duration_sec))
+            if diff < best_diff:
+                best_diff = diff
+                best = synced
+        return best
+
+    def save(self, artist: str, title: str, album: str, duration_sec: int, synced: str) -> Path:
+        """Write lyrics fetched elsewhere as "<Artist> - <Title>.lrc" (with tags) and index it."""
+        safe = re.sub(r'[\\/:*?"<>|]+', "_", f"{artist.split(',')[0].strip()} - {title}").strip(" .")
+        path = self.root / f"{safe or 'untitled'}.lrc"
+        header = f"[ar:{artist}]\n[ti:{title}]\n"
+        if album:
+            header += f"[al:{album}]\n"
+        header += f"[length:{duration_sec // 60}:{duration_sec % 60:02d}]\n"
+        try:
+            if path.read_text(encoding="utf-8") == header + synced:
+                return path
+        except OSError:
+            pass
+        path.write_text(header + synced, encoding="utf-8")
+        with self._lock, self._db:
+            self._upsert(path, path.stat().st_mtime_ns, header + synced)
+        return path
+
+    def close(self) -> None:
+        with self._lock:
+            self._db.close()
+
+
+class LocalLibrarySource:
+    """LyricsSource over a LocalLibrary; re-scans the directory at most every refresh_interval seconds."""
+
+    name = "local"
+
+    def __init__(self, library: LocalLibrary, refresh_interval: float = 300.0) -> None:
+        self.library = library
+        self.refresh_interval = refresh_interval
+        updated, _ = library.refresh()
+        print(f"Local lyrics library: {library.root} ({updated} file(s) indexed)")
+        self._stop = threading.Event()
+        threading.Thread(target=self._refresh_loop, name="lyrics-library", daemon=True).start()
+
+    def _refresh_loop(self) -> None:
+        # Scans run off the lookup path so queries never wait on the filesystem walk.
+        while not self._stop.wait(self.refresh_interval):
+            try:
+                updated, removed = self.library.refresh()
+                if updated or removed:
+                    print(f"Local lyrics library: {updated} updated, {removed} removed")
+            except Exception as e:
+                print(f"Local lyrics library refresh error: {e}")
+
+    def lookup(self, artist: str, title: str, album: str, duration_sec: int) -> Optional[str]:
+        return self.library.lookup(artist, title, duration_sec)
+
+    def stop(self) -> None:
+        self._stop.set()
@@ -3,12 +3,29 @@
 from __future__ import annotations
 
 import re
-from typing import List, Tuple
+from array import array
+from bisect import bisect_right
+from operator import itemgetter
+from typing import List, NamedTuple, Optional, Tuple
 
 # [mm:ss.xx] or [m:ss.xx] optional .xx or .x; optional word-level tags after ]
 _LINE_RE = re.compile(
     r"^\[(\d{1,2}):(\d{2})(?:\.(\d{1,3}))?\](.*)$"
 )
+# Enhanced LRC inline word tags: <mm:ss.xx> (trailing whitespace belongs to the tag)
+_WORD_TAG_RE = re.compile(r"<([\d:.]+)>\s*")
+_WORD_TIME_RE = re.compile(r"^(\d{1,2}):(\d{2})(?:\.(\d{1,3}))?$")
+
+
+class WordTimings(NamedTuple):
+    """
+    Word-level timing for one line, as two parallel arrays.
+    offsets[i] is the character offset in the line text where word i starts;
+    times[i] is its absolute start time in ms.
+    """
+
+    offsets: array  # typecode "H"
+    times: array  # typecode "L"
 
 
 def _to_ms(minutes: str, seconds: str, frac: str | None) -> int:
@@ -23,15 +40,57 @@ def _to_ms(minutes: str, seconds: str, frac: str | None) -> int:
     return (m * 60 + s) * 1000 + ms
 
 
-def parse_synced_lrc(synced: str) -> List[Tuple[int, str]]:
+def _split_word_tags(body: str) -> Tuple[str, Optional[WordTimings]]:
+    """Strip inline <mm:ss.xx> tags from body; return (text, word timings or None)."""
+    parts = _WORD_TAG_RE.split(body)
+    if len(parts) == 1:
+        return body.strip(), None
+
+    # parts = [segment, tag, segment, tag, segment, ...]
+    text = parts[0]
+    tagged: List[Tuple[int, str]] = []
+    for i in range(1, len(parts), 2):
+        tagged.append((len(text), parts[i]))
+        text += parts[i + 1]
+
+    lead = len(text) - len(text.lstrip())
+    text = text.strip()
+
+    offsets = array("H")
+    times = array("L")
+    for off, tag in tagged:
+        off = max(0, off - lead)
+        if off >= len(text):
+            # Trailing end-of-line tag: no word starts here
+            continue
+        tm = _WORD_TIME_RE.match(tag)
+        if not tm:
+            continue
+        ms = _to_ms(tm.group(1), tm.group(2), tm.group(3))
+        if offsets and offsets[-1] == off:
+            times[-1] = max(times[-1], ms)
+            continue
+        if times and ms < times[-1]:
+            continue
+        offsets.append(off)
+        times.append(ms)
+
+    if not offsets:
+        return text, None
+    return text, WordTimings(offsets, times)
+
+
+def parse_synced_lrc_words(
+    synced: str,
+) -> Tuple[List[Tuple[int, str]], List[Optional[WordTimings]]]:
     """
-    Return list of (start_time_ms, text) sorted by time.
-    Skips meta lines like [ar:...] and empty text.
+    Like parse_synced_lrc, but keep enhanced-LRC word timestamps.
+    Returns (lines, words) where words[i] belongs to lines[i] (None if the line has no word tags).
     """
     if not synced or not synced.strip():
-        return []
+        return [], []
 
-    lines: List[Tuple[int, str]] = []
+    rows: List[Tuple[int, str, Optional[WordTimings]]] = []
     for raw in synced.replace("\r\n", "\n").split("\n"):
         line = raw.strip()
         if not line:
@@ -39,16 +98,27 @@ def parse_synced_lrc(synced: str) -> List[Tuple[int, str]]:
         m = _LINE_RE.match(line)
         if not m:
             continue
-        text = m.group(4).strip()
-        # Strip common trailing inline time tags like <00:05.00>
-        text = re.sub(r"<[\d:.]+>\s*", "", text).strip()
+        text, words = _split_word_tags(m.group(4).strip())
         if not text:
             continue
         start_ms = _to_ms(m.group(1), m.group(2), m.group(3))
-        lines.append((start_ms, text))
+        rows.append((start_ms, text, words))
 
-    lines.sort(key=lambda x: x[0])
-    return lines
+    rows.sort(key=lambda x: x[0])
+    return [(t, tx) for t, tx, _ in rows], [w for _, _, w in rows]
+
+
+def parse_synced_lrc(synced: str) -> List[Tuple[int, str]]:
+    """
+    Return list of (start_time_ms, text) sorted by time.
+    Skips meta lines like [ar:...] and empty text; inline word tags are dropped.
+    """
+    return parse_synced_lrc_words(synced)[0]
+
+
+def _line_index(lines: List[Tuple[int, str]], progress_ms: int) -> int:
+    """Last line starting at or before progress_ms (0 before the first line)."""
+    return max(0, bisect_right(lines, progress_ms, key=itemgetter(0)) - 1)
 
 
 def line_at_progress(
@@ -61,14 +131,46 @@ def line_at_progress(
     if not lines:
         return -1, None, None, None
 
-    idx = 0
-    for i, (t, _) in enumerate(lines):
-        if t <= progress_ms:
-            idx = i
-        else:
-            break
-
+    idx = _line_index(lines, progress_ms)
     prev_t = lines[idx - 1][1] if idx > 0 else None
     cur_t = lines[idx][1]
     next_t = lines[idx + 1][1] if idx + 1 < len(lines) else None
     return idx, prev_t, cur_t, next_t
+
+
+def word_at_progress(words: Optional[WordTimings], progress_ms: int) -> int:
+    """Index of the word active at progress_ms, or -1 (no timings / before the first word)."""
+    if not words:
+        return -1
+    return bisect_right(words.times, progress_ms) - 1
+
+
+def word_span(text: str, words: WordTimings, index: int) -> Tuple[int, int]:
+    """(start, end) character span of word `index` within its line text."""
+    start = words.offsets[index]
+    end = words.offsets[index + 1] if index + 1 < len(words.offsets) else len(text)
+    return start, end
+
+
+def encode_word_timings(words: WordTimings, line_start_ms: int) -> List[int]:
+    """Flatten to [offset, delta_ms, offset, delta_ms, ...] relative to the line start (MQTT payload)."""
+    flat: List[int] = []
+    for off, t in zip(words.offsets, words.times):
+        flat.append(off)
+        flat.append(max(0, t - line_start_ms))
+    return flat
+
+
+def decode_word_timings(flat: object, line_start_ms: int) -> Optional[WordTimings]:
+    """Inverse of encode_word_timings; returns None for missing or malformed data."""
+    if not isinstance(flat, list) or len(flat) < 2 or len(flat) % 2:
+        return None
+    offsets = array("H")
+    times = array("L")
+    try:
+        for i in range(0, len(flat), 2):
+            offsets.append(int(flat[i]))
+            times.append(line_start_ms + int(flat[i + 1]))
+    except (TypeError, ValueError, OverflowError):
+        return None
+    return WordTimings(offsets, times)
@@ -2,17 +2,108 @@
 
 from __future__ import annotations
 
-from typing import Any, Dict, List, Optional
+import threading
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from typing import Any, Callable, Dict, List, Optional
 
 import requests
 
+from spotify.matching import (
+    MatchQuery,
+    best_record,
+    make_query,
+    primary_artist,
+    strip_title_suffixes,
+)
+
 LRCLIB_BASE = "https://lrclib.net/api"
 USER_AGENT = "HomeMatrixBoard/1.0 (+https://github.com/rayflinkerbusch/HomeMatrixBoard)"
 
+# Shared by every race (threads start on demand); each worker thread has its own requests.Session,
+# so an abandoned request only holds a connection of its worker's pool, and at most RACE_WORKERS run.
+RACE_WORKERS = 8
+_race_pool = ThreadPoolExecutor(max_workers=RACE_WORKERS, thread_name_prefix="lrclib")
+_worker = threading.local()
+
 
-def _record_has_synced(rec: Dict[str, Any]) -> bool:
-    sl = rec.get("syncedLyrics")
-    return isinstance(sl, str) and bool(sl.strip())
+def _worker_session() -> requests.Session:
+    sess = getattr(_worker, "session", None)
+    if sess is None:
+        sess = _worker.session = requests.Session()
+    return sess
+
+
+def _get_exact(
+    sess: requests.Session,
+    params: Dict[str, Any],
+    headers: Dict[str, str],
+    timeout: float,
+) -> Optional[str]:
+    """/api/get with artist, track, album and duration. None: LRCLIB has no synced lyrics for it."""
+    r = sess.get(f"{LRCLIB_BASE}/get", params=params, headers=headers, timeout=timeout)
+    if r.status_code == 404:
+        return None
+    if r.status_code != 200:
+        raise requests.HTTPError(f"LRCLIB /get: HTTP {r.status_code}")
+    data = r.json()
+    sl = data.get("syncedLyrics")
+    if isinstance(sl, str) and sl.strip():
+        return sl
+    return None
+
+
+def _search(
+    sess: requests.Session,
+    artist: str,
+    track: str,
+    query: MatchQuery,
+    headers: Dict[str, str],
+    timeout: float,
+) -> Optional[str]:
+    """/api/search (suffix-free title, primary artist) + best fuzzy title/artist/duration match."""
+    sparams = {"track_name": strip_title_suffixes(track), "artist_name": primary_artist(artist)}
+    r2 = sess.get(f"{LRCLIB_BASE}/search", params=sparams, headers=headers, timeout=min(timeout, 15.0))
+    if r2.status_code == 404:
+        return None
+    if r2.status_code != 200:
+        raise requests.HTTPError(f"LRCLIB /search: HTTP {r2.status_code}")
+
+    results: List[Dict[str, Any]] = r2.json()
+    if not isinstance(results, list):
+        raise ValueError("LRCLIB /search: expected a list")
+
+    best = best_record(query, results)
+    if not best:
+        return None
+    # Search records already embed syncedLyrics (only those are candidates), so no /api/get/{id}.
+    return best["syncedLyrics"]
+
+
+def _race(strategies: List[Callable[[], Optional[str]]]) -> Optional[str]:
+    """
+    Run strategies concurrently on the shared pool and return the first non-empty result without
+    waiting for the rest (queued strategies are cancelled, in-flight requests are abandoned).
+    None only if every strategy answered without a result; otherwise raises the last error.
+    """
+    pending = {_race_pool.submit(fn) for fn in strategies}
+    error: Optional[BaseException] = None
+    try:
+        while pending:
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+            for fut in done:
+                try:
+                    result = fut.result()
+                except (requests.RequestException, ValueError) as e:
+                    error = e
+                    continue
+                if result:
+                    return result
+        if error is not None:
+            raise error
+        return None
+    finally:
+        for fut in pending:
+            fut.cancel()
 
 
 def fetch_synced_lyrics(
@@ -22,12 +113,17 @@ def fetch_synced_lyrics(
     duration_sec: int,
     session: Optional[requests.Session] = None,
     timeout: float = 25.0,
+    race: bool = False,
 ) -> Optional[str]:
     """
-    Return LRC string or None if not found.
-    Tries /api/get then /api/search + best duration match + /api/get/{id}.
+    Return LRC string, or None if LRCLIB answered that it has none.
+    Tries /api/get then /api/search + best fuzzy match (normalized title/artist, ±5 s duration).
+    Raises (requests.RequestException, ValueError) if a request failed (timeout, 429, 5xx, bad
+    body) and the other one found nothing, so callers can tell an outage from a miss.
+    With race=True the exact-match and search requests are issued concurrently and the first
+    valid synced result wins; each runs on its pool worker's own session unless session is given
+    (it must then be thread-safe).
     """
-    sess = session or requests.Session()
     headers = {"User-Agent": USER_AGENT}
     album_use = album.strip() if album.strip() else "Unknown Album"
     params = {
@@ -36,50 +132,27 @@ def fetch_synced_lyrics(
         "album_name": album_use,
         "duration": max(1, int(duration_sec)),
     }
+    query = make_query(artist, track, int(duration_sec))
 
-    r = sess.get(f"{LRCLIB_BASE}/get", params=params, headers=headers, timeout=timeout)
-    if r.status_code == 200:
-        data = r.json()
-        sl = data.get("syncedLyrics")
-        if isinstance(sl, str) and sl.strip():
+    if race:
+        return _race(
+            [
+                lambda: _get_exact(session or _worker_session(), params, headers, timeout),
+                lambda: _search(session or _worker_session(), artist, track, query, headers, timeout),
+            ]
+        )
+
+    sess = session or requests.Session()
+    error: Optional[Exception] = None
+    try:
+        sl = _get_exact(sess, params, headers, timeout)
+        if sl:
             return sl
+    except (requests.RequestException, ValueError) as e:
+        error = e
 
     # Search fallback (e.g. album mismatch)
-    sparams = {"track_name": track, "artist_name": artist}
-    r2 = sess.get(f"{LRCLIB_BASE}/search", params=sparams, headers=headers, timeout=min(timeout, 15.0))
-    if r2.status_code != 200:
-        return None
-
-    results: List[Dict[str, Any]] = r2.json()
-    if not isinstance(results, list):
-        return None
-
-    best: Optional[Dict[str, Any]] = None
-    best_diff = 9999
-    for rec in results:
-        if not _record_has_synced(rec):
-            continue
-        d = rec.get("duration")
-        if not isinstance(d, (int, float)):
-            continue
-        diff = abs(int(d) - int(duration_sec))
-        if diff < best_diff and diff <= 5:
-            best_diff = diff
-            best = rec
-
-    if not best:
-        return None
-
-    rid = best.get("id")
-    if rid is None:
-        return best.get("syncedLyrics") if isinstance(best.get("syncedLyrics"), str) else None
-
-    r3 = sess.get(f"{LRCLIB_BASE}/get/{int(rid)}", headers=headers, timeout=timeout)
-    if r3.status_code != 200:
-        return best.get("syncedLyrics") if isinstance(best.get("syncedLyrics"), str) else None
-
-    data3 = r3.json()
-    sl = data3.get("syncedLyrics")
-    if isinstance(sl, str) and sl.strip():
+    sl = _search(sess, artist, track, query, headers, timeout)
+    if sl or error is None:
         return sl
-    return None
+    raise error
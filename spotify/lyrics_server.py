@@ -0,0 +1,291 @@
+#!/usr/bin/env python3
+"""
+Headless lyrics viewer: one MQTT subscription, many browsers (kiosk screens, tablets, TVs).
+
+Keeps the same in-memory state as the tkinter viewer (spotify/viewer_state.py) and streams the
+current / next line to every connected client with Server-Sent Events:
+
+  python3 -m spotify.lyrics_server --broker 172.16.234.55 --http-port 8090
+
+  GET /         full-screen lyrics page (EventSource, no external assets)
+  GET /events   text/event-stream; one event per change, "id:" is the change sequence number
+  GET /state    latest view as JSON (plus the number of connected clients)
+
+A single hub thread applies MQTT messages and recomputes the view at line / word boundaries;
+each client connection only keeps a cursor (the last sequence number it was sent). A slow
+client skips straight to the latest view instead of queueing old ones, and a reconnecting
+EventSource resumes with Last-Event-ID without a duplicate event.
+
+Environment (optional): MQTT_BROKER, MQTT_PORT, MQTT_USER, MQTT_PASSWORD
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import sys
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from typing import Any, Callable, Dict, Optional, Tuple
+
+_ROOT = Path(__file__).resolve().parent.parent
+if str(_ROOT) not in sys.path:
+    sys.path.insert(0, str(_ROOT))
+
+import paho.mqtt.client as mqtt
+
+from spotify import topics
+from spotify.viewer_state import (
+    BATCH_MS,
+    IDLE_TICK_MS,
+    ViewerState,
+    drain_messages,
+    on_message_factory,
+    render_view,
+    subscriptions,
+)
+
+try:
+    from mqtt_credentials import MQTT_BROKER, MQTT_PORT, MQTT_USER, MQTT_PASSWORD
+except ImportError:
+    MQTT_BROKER = "localhost"
+    MQTT_PORT = 1883
+    MQTT_USER = ""
+    MQTT_PASSWORD = ""
+
+# SSE comment line sent when nothing changed for this long (keeps proxies / idle timeouts quiet)
+KEEPALIVE_S = 15.0
+# EventSource reconnect delay suggested to browsers (ms)
+RETRY_MS = 2000
+
+PAGE = """<!doctype html>
+<html><head><meta charset="utf-8"><meta name="viewport" content="width=device-width, initial-scale=1">
+<title>Spotify lyrics</title>
+<style>
+html, body { margin: 0; height: 100%; background: #000; color: #fff; font-family: Helvetica, Arial, sans-serif; }
+body { display: flex; flex-direction: column; justify-content: center; text-align: center;
+       padding: 0 4vw; box-sizing: border-box; }
+#meta { color: #aaa; font-size: 3.2vh; white-space: pre-line; margin-bottom: 4vh; }
+#current { font-size: 7vh; font-weight: bold; }
+#word { color: #1db954; font-size: 5vh; font-weight: bold; min-height: 6vh; margin-top: 2vh; }
+#next { color: #666; font-size: 4.5vh; margin-top: 3vh; }
+</style></head>
+<body><div id="meta">Waiting for MQTT…</div><div id="current"></div><div id="word"></div><div id="next"></div>
+<script>
+const ids = ["meta", "current", "word", "next"];
+const src = new EventSource("events");
+src.onmessage = (e) => {
+  const v = JSON.parse(e.data);
+  for (const k of ids) {
+    const el = document.getElementById(k);
+    if (el.textContent !== v[k]) el.textContent = v[k];
+  }
+};
+</script></body></html>
+"""
+
+
+def _make_mqtt_client() -> mqtt.Client:
+    try:
+        return mqtt.Client(
+            callback_api_version=mqtt.CallbackAPIVersion.VERSION1,
+            client_id=f"spotify_lyrics_server_{os.getpid()}",
+        )
+    except (AttributeError, TypeError):
+        return mqtt.Client(f"spotify_lyrics_server_{os.getpid()}")
+
+
+class LyricsHub:
+    """
+    Owns the ViewerState: applies MQTT batches and recomputes the view on its own thread, then
+    publishes (seq, view) to waiting client threads. Clients never touch ViewerState.
+    """
+
+    def __init__(self, state: ViewerState, clock: Callable[[], float] = time.time) -> None:
+        self.state = state
+        self.clock = clock
+        self._cond = threading.Condition()
+        self._wake = threading.Event()
+        self.seq = 0
+        self.view: Dict[str, Any] = {}
+        self.clients = 0
+        state.on_update = self._wake.set
+
+    def update(self) -> Optional[int]:
+        """Apply queued messages and recompute the view; returns ms until it can next change."""
+        self.state.wake_pending.clear()
+        drain_messages(self.state)
+        view, wait = render_view(self.state, int(self.clock() * 1000))
+        view["track_uri"] = self.state.now_playing.get("track_uri")
+        view["playing"] = bool(self.state.now_playing.get("is_playing"))
+        with self._cond:
+            if view != self.view:
+                self.view = view
+                self.seq += 1
+                self._cond.notify_all()
+        return wait
+
+    def run(self) -> None:
+        wait: Optional[int] = 0
+        while True:
+            timeout = IDLE_TICK_MS if wait is None else min(IDLE_TICK_MS, wait + 1)
+            if self._wake.wait(timeout / 1000.0):
+                # MQTT burst (now_playing, anchor, lyrics/...): let it finish, apply it once
+                time.sleep(BATCH_MS / 1000.0)
+            self._wake.clear()
+            try:
+                wait = self.update()
+            except Exception as e:
+                print(f"Lyrics server update failed: {e}")
+                wait = None
+
+    def start(self) -> None:
+        threading.Thread(target=self.run, name="lyrics-hub", daemon=True).start()
+
+    def wait_for_change(self, cursor: int, timeout: float) -> Tuple[int, Dict[str, Any]]:
+        """Block until the view is newer than cursor (or timeout); returns (seq, view)."""
+        with self._cond:
+            self._cond.wait_for(lambda: self.seq != cursor, timeout)
+            return self.seq, self.view
+
+    def snapshot(self) -> Dict[str, Any]:
+        with self._cond:
+            return {"seq": self.seq, "clients": self.clients, "view": self.view}
+
+    def add_client(self, n: int) -> None:
+        with self._cond:
+            self.clients += n
+
+
+def serve_lyrics(hub: LyricsHub, port: int, host: str = "0.0.0.0") -> ThreadingHTTPServer:
+    """HTTP server for /, /events (SSE) and /state; one daemon thread per connected client."""
+
+    class Handler(BaseHTTPRequestHandler):
+        protocol_version = "HTTP/1.1"
+
+        def _send_body(self, body: bytes, ctype: str) -> None:
+            self.send_response(200)
+            self.send_header("Content-Type", ctype)
+            self.send_header("Content-Length", str(len(body)))
+            self.send_header("Cache-Control", "no-cache")
+            self.end_headers()
+            self.wfile.write(body)
+
+        def do_GET(self) -> None:
+            path = self.path.split("?", 1)[0]
+            if path == "/":
+                self._send_body(PAGE.encode(), "text/html; charset=utf-8")
+            elif path == "/state":
+                self._send_body(json.dumps(hub.snapshot()).encode(), "application/json")
+            elif path == "/events":
+                self._stream()
+            else:
+                self.send_error(404)
+
+        def _stream(self) -> None:
+            try:
+                cursor = int(self.headers.get("Last-Event-ID") or -1)
+            except ValueError:
+                cursor = -1
+            self.send_response(200)
+            self.send_header("Content-Type", "text/event-stream")
+            self.send_header("Cache-Control", "no-cache")
+            self.send_header("Connection", "close")
+            self.end_headers()
+            self.close_connection = True
+            hub.add_client(1)
+            try:
+                self.wfile.write(f"retry: {RETRY_MS}\n\n".encode())
+                self.wfile.flush()
+                while True:
+                    seq, view = hub.wait_for_change(cursor, KEEPALIVE_S)
+                    if seq == cursor:
+                        self.wfile.write(b": keepalive\n\n")
+                    else:
+                        cursor = seq
+                        self.wfile.write(f"id: {seq}\ndata: {json.dumps(view)}\n\n".encode())
+                    self.wfile.flush()
+            except (BrokenPipeError, ConnectionResetError, OSError):
+                pass
+            finally:
+                hub.add_client(-1)
+
+        def log_message(self, format: str, *args: Any) -> None:
+            pass
+
+    server = ThreadingHTTPServer((host, port), Handler)
+    server.daemon_threads = True
+    return server
+
+
+def run_server(
+    mqtt_broker: str,
+    mqtt_port: int,
+    mqtt_user: str,
+    mqtt_password: str,
+    http_port: int,
+    http_host: str = "0.0.0.0",
+    account: Optional[str] = None,
+) -> None:
+    state = ViewerState(topics.for_prefix(topics.account_prefix(account)) if account else None)
+    hub = LyricsHub(state)
+    client = _make_mqtt_client()
+    client.on_message = on_message_factory(state)
+    # Subscribe again on every reconnect (the server is meant to run unattended)
+    client.on_connect = lambda c, *_args: c.subscribe(subscriptions(state))
+    if mqtt_user:
+        client.username_pw_set(mqtt_user, mqtt_password or "")
+    client.connect(mqtt_broker, mqtt_port, keepalive=60)
+    client.loop_start()
+
+    hub.start()
+    server = serve_lyrics(hub, http_port, http_host)
+    print(f"Lyrics on http://{http_host}:{http_port}/ (topics under {state.topics.now_playing.rsplit('/', 1)[0]})")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+        client.loop_stop()
+        client.disconnect()
+
+
+def main() -> None:
+    p = argparse.ArgumentParser(description="Headless synced lyrics server (SSE) for web / kiosk screens")
+    p.add_argument("--broker", default=os.environ.get("MQTT_BROKER", MQTT_BROKER))
+    p.add_argument(
+        "--port",
+        type=int,
+        default=int(os.environ.get("MQTT_PORT", str(MQTT_PORT))),
+    )
+    p.add_argument("--mqtt-user", default=os.environ.get("MQTT_USER", MQTT_USER))
+    p.add_argument(
+        "--mqtt-password",
+        default=os.environ.get("MQTT_PASSWORD", MQTT_PASSWORD),
+    )
+    p.add_argument(
+        "--account",
+        default=None,
+        help="Multi-account bridge: serve this account (topics under home/spotify/ACCOUNT/...)",
+    )
+    p.add_argument("--http-port", type=int, default=8090, help="HTTP port (default: 8090)")
+    p.add_argument("--http-host", default="0.0.0.0", help="Bind address (default: all interfaces)")
+    args = p.parse_args()
+
+    run_server(
+        mqtt_broker=args.broker,
+        mqtt_port=args.port,
+        mqtt_user=str(args.mqtt_user or ""),
+        mqtt_password=str(args.mqtt_password or ""),
+        http_port=args.http_port,
+        http_host=args.http_host,
+        account=args.account,
+    )
+
+
+if __name__ == "__main__":
+    main()
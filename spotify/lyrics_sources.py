@@ -0,0 +1,131 @@
+"""Pluggable synced-lyrics sources, queried in order (e.g. local library first, then LRCLIB)."""
+
+from __future__ import annotations
+
+import threading
+import time
+from collections import OrderedDict
+from typing import Dict, Iterable, Optional, Protocol, Tuple
+
+import requests
+
+from spotify.lrclib_client import fetch_synced_lyrics
+from spotify.matching import MatchQuery, make_query
+
+# Tracks LRCLIB answered it has no match for are not re-queried for this long (errors are not cached)
+MISS_TTL_S = 6 * 3600
+MISS_CACHE_MAX = 512
+
+
+class LyricsSource(Protocol):
+    """Anything with a name and a lookup returning an LRC string (or None)."""
+
+    name: str
+
+    def lookup(self, artist: str, title: str, album: str, duration_sec: int) -> Optional[str]:
+        ...
+
+
+class LrclibSource:
+    """Remote LRCLIB API (spotify/lrclib_client.py), remembering recent misses by normalized key; thread-safe."""
+
+    name = "lrclib"
+
+    def __init__(self, session: Optional[requests.Session] = None, race: bool = False) -> None:
+        # Bridge accounts look lyrics up from several poll threads: without an injected session
+        # (which must then be thread-safe, like the bench fakes) each thread gets its own.
+        self._shared_session = session
+        self._local = threading.local()
+        self.race = race
+        # MatchQuery -> monotonic expiry; "Song - Remastered" and "Song" share one entry
+        self._misses: Dict[MatchQuery, float] = {}
+        self._lock = threading.Lock()
+
+    @property
+    def session(self) -> requests.Session:
+        if self._shared_session is not None:
+            return self._shared_session
+        sess = getattr(self._local, "session", None)
+        if sess is None:
+            sess = self._local.session = requests.Session()
+        return sess
+
+    def lookup(self, artist: str, title: str, album: str, duration_sec: int) -> Optional[str]:
+        key = make_query(artist, title, duration_sec)
+        with self._lock:
+            if self._misses.get(key, 0.0) > time.monotonic():
+                return None
+
+        # Raises on timeouts / 429 / 5xx (fetch_from_sources reports it): no miss is recorded
+        lrc = fetch_synced_lyrics(
+            artist,
+            title,
+            album,
+            duration_sec,
+            # Racing requests run on lrclib_client's pool threads, each with its own session
+            session=self._shared_session if self.race else self.session,
+            race=self.race,
+        )
+        with self._lock:
+            if lrc:
+                self._misses.pop(key, None)
+                return lrc
+
+            now = time.monotonic()
+            if len(self._misses) >= MISS_CACHE_MAX:
+                self._misses = {k: exp for k, exp in self._misses.items() if exp > now}
+                if len(self._misses) >= MISS_CACHE_MAX:
+                    self._misses.pop(next(iter(self._misses)))
+            self._misses[key] = now + MISS_TTL_S
+        return None
+
+
+class LyricsCache:
+    """Thread-safe LRU of found lyrics keyed by normalized query; shared by all bridge accounts."""
+
+    def __init__(self, max_entries: int = 128) -> None:
+        self.max_entries = max_entries
+        self._entries: "OrderedDict[MatchQuery, Tuple[str, str]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: MatchQuery) -> Optional[Tuple[str, str]]:
+        with self._lock:
+            hit = self._entries.get(key)
+            if hit is not None:
+                self._entries.move_to_end(key)
+            return hit
+
+    def put(self, key: MatchQuery, lrc: str, source: str) -> None:
+        with self._lock:
+            self._entries[key] = (lrc, source)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+
+def fetch_from_sources(
+    sources: Iterable[LyricsSource],
+    artist: str,
+    title: str,
+    album: str,
+    duration_sec: int,
+    cache: Optional[LyricsCache] = None,
+) -> Tuple[Optional[str], Optional[str]]:
+    """Return (lrc, source_name) from the cache or the first source with synced lyrics, else (None, None)."""
+    key = make_query(artist, title, duration_sec)
+    if cache is not None:
+        hit = cache.get(key)
+        if hit is not None:
+            return hit
+
+    for src in sources:
+        try:
+            lrc = src.lookup(artist, title, album, duration_sec)
+        except Exception as e:
+            print(f"Lyrics source {src.name} error: {e}")
+            continue
+        if lrc:
+            if cache is not None:
+                cache.put(key, lrc, src.name)
+            return lrc, src.name
+    return None, None
@@ -0,0 +1,131 @@
+"""
+Title / artist normalization and fuzzy scoring for lyrics search results.
+
+Spotify and LRCLIB disagree on details such as "Song - Remastered 2011", "Song (feat. X)",
+accents and punctuation. Both sides are reduced to the same normalized key before comparing;
+keys are memoized because the same strings come back for every search of a track.
+"""
+
+from __future__ import annotations
+
+import re
+import unicodedata
+from difflib import SequenceMatcher
+from functools import lru_cache
+from typing import Any, Dict, FrozenSet, Iterable, NamedTuple, Optional
+
+# Same tolerance as the LRCLIB duration rule
+MAX_DURATION_DIFF_S = 5
+# Minimum similarities for a record to count as the same track
+MIN_TITLE_SIMILARITY = 0.75
+MIN_ARTIST_SIMILARITY = 0.5
+
+_BRACKETED_RE = re.compile(r"\s*[\(\[\{][^\)\]\}]*[\)\]\}]")
+# " - Remastered 2011", " - Live at ...", " - Radio Edit"
+_DASH_SUFFIX_RE = re.compile(r"\s+[-–—]\s+.*$")
+_FEAT_RE = re.compile(r"\s+(?:feat\.?|ft\.?|featuring)\s+.*$", re.IGNORECASE)
+_ARTIST_SPLIT_RE = re.compile(r"\s*[,;&/]\s*")
+_APOSTROPHE_RE = re.compile(r"['\u2019`]")
+_NON_WORD_RE = re.compile(r"[^\w\s]+")
+
+
+@lru_cache(maxsize=2048)
+def fold(s: str) -> str:
+    """Case-fold, strip diacritics, drop punctuation, collapse whitespace."""
+    s = unicodedata.normalize("NFKD", s.casefold().replace("&", " and "))
+    s = "".join(ch for ch in s if not unicodedata.combining(ch))
+    s = _NON_WORD_RE.sub(" ", _APOSTROPHE_RE.sub("", s))
+    return " ".join(s.split())
+
+
+def strip_title_suffixes(title: str) -> str:
+    """Drop bracketed parts, " - Remastered ..." style suffixes and "feat." credits (keeps case)."""
+    stripped = _FEAT_RE.sub("", _DASH_SUFFIX_RE.sub("", _BRACKETED_RE.sub("", title))).strip()
+    return stripped or title.strip()
+
+
+def primary_artist(artist: str) -> str:
+    """First credited artist: "A, B" / "A & B" / "A feat. B" -> "A"."""
+    first = _ARTIST_SPLIT_RE.split(_FEAT_RE.sub("", artist.strip()), maxsplit=1)[0]
+    return first.strip() or artist.strip()
+
+
+@lru_cache(maxsize=2048)
+def normalize_title(title: str) -> str:
+    return fold(strip_title_suffixes(title))
+
+
+@lru_cache(maxsize=2048)
+def normalize_artist(artist: str) -> str:
+    return fold(primary_artist(artist))
+
+
+@lru_cache(maxsize=2048)
+def _tokens(key: str) -> FrozenSet[str]:
+    return frozenset(key.split())
+
+
+def similarity(a: str, b: str) -> float:
+    """0..1 similarity of two normalized keys: max of token Dice overlap and character ratio."""
+    if a == b:
+        return 1.0
+    if not a or not b:
+        return 0.0
+    ta, tb = _tokens(a), _tokens(b)
+    dice = 2 * len(ta & tb) / (len(ta) + len(tb))
+    if dice == 1.0:
+        return 1.0
+    return max(dice, SequenceMatcher(None, a, b).ratio())
+
+
+class MatchQuery(NamedTuple):
+    """Normalized keys for one Spotify track, computed once per lookup."""
+
+    artist_key: str
+    title_key: str
+    duration_sec: int
+
+
+@lru_cache(maxsize=256)
+def make_query(artist: str, title: str, duration_sec: int) -> MatchQuery:
+    return MatchQuery(normalize_artist(artist), normalize_title(title), int(duration_sec))
+
+
+def score_record(query: MatchQuery, rec: Dict[str, Any]) -> Optional[float]:
+    """
+    Score an LRCLIB record (trackName / artistName / duration) against the query.
+    None if it fails the duration rule or the title/artist thresholds; else 0..1, higher is better.
+    """
+    d = rec.get("duration")
+    if not isinstance(d, (int, float)):
+        return None
+    diff = abs(int(d) - query.duration_sec)
+    if diff > MAX_DURATION_DIFF_S:
+        return None
+
+    title_sim = similarity(query.title_key, normalize_title(str(rec.get("trackName") or "")))
+    if title_sim < MIN_TITLE_SIMILARITY:
+        return None
+    artist_sim = similarity(query.artist_key, normalize_artist(str(rec.get("artistName") or "")))
+    if artist_sim < MIN_ARTIST_SIMILARITY:
+        return None
+
+    duration_score = 1.0 - diff / (MAX_DURATION_DIFF_S + 1)
+    return 0.55 * title_sim + 0.3 * artist_sim + 0.15 * duration_score
+
+
+def best_record(
+    query: MatchQuery, records: Iterable[Dict[str, Any]]
+) -> Optional[Dict[str, Any]]:
+    """Highest-scoring record that carries synced lyrics, or None."""
+    best: Optional[Dict[str, Any]] = None
+    best_score = -1.0
+    for rec in records:
+        sl = rec.get("syncedLyrics")
+        if not isinstance(sl, str) or not sl.strip():
+            continue
+        score = score_record(query, rec)
+        if score is not None and score > best_score:
+            best_score = score
+            best = rec
+    return best
@@ -0,0 +1,152 @@
+"""
+Per-stage latency histograms and counters for the Spotify bridge.
+
+Stages timed by the bridge: poll (whole poll), spotify_api, lyrics_fetch, lrc_parse,
+json_encode, board_encode, mqtt_publish. Exposed in Prometheus text format on a local HTTP endpoint
+(--metrics-port) and optionally as JSON on home/spotify/bridge/metrics (--metrics-interval).
+
+  with METRICS.time("spotify_api"):
+      current = sp.current_user_playing_track()
+  METRICS.inc("spotify_api_errors")
+"""
+
+from __future__ import annotations
+
+import bisect
+import json
+import threading
+import time
+from contextlib import contextmanager
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Dict, Iterator, List, Tuple
+
+# Histogram bucket upper bounds in milliseconds (+Inf is implicit)
+BUCKETS_MS: Tuple[float, ...] = (0.5, 1, 2, 5, 10, 25, 50, 100, 250, 500, 1000, 2500, 5000)
+
+
+class Histogram:
+    """Fixed-bucket latency histogram (not thread-safe on its own; Metrics holds the lock)."""
+
+    __slots__ = ("counts", "count", "sum_ms", "max_ms")
+
+    def __init__(self) -> None:
+        self.counts: List[int] = [0] * (len(BUCKETS_MS) + 1)
+        self.count = 0
+        self.sum_ms = 0.0
+        self.max_ms = 0.0
+
+    def observe(self, ms: float) -> None:
+        self.counts[bisect.bisect_left(BUCKETS_MS, ms)] += 1
+        self.count += 1
+        self.sum_ms += ms
+        if ms > self.max_ms:
+            self.max_ms = ms
+
+    def quantile(self, q: float) -> float:
+        """Upper bound of the bucket holding the q-quantile, capped at the largest observed value."""
+        if not self.count:
+            return 0.0
+        target = q * self.count
+        seen = 0
+        for i, c in enumerate(self.counts):
+            seen += c
+            if seen >= target:
+                return min(float(BUCKETS_MS[i]), self.max_ms) if i < len(BUCKETS_MS) else self.max_ms
+        return self.max_ms
+
+
+class Metrics:
+    """Thread-safe registry of stage histograms and counters."""
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._hist: Dict[str, Histogram] = {}
+        self._counters: Dict[str, int] = {}
+        self.started = time.time()
+
+    def observe(self, stage: str, ms: float) -> None:
+        with self._lock:
+            h = self._hist.get(stage)
+            if h is None:
+                h = self._hist[stage] = Histogram()
+            h.observe(ms)
+
+    @contextmanager
+    def time(self, stage: str) -> Iterator[None]:
+        t0 = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.observe(stage, (time.perf_counter() - t0) * 1000.0)
+
+    def inc(self, name: str, n: int = 1) -> None:
+        with self._lock:
+            self._counters[name] = self._counters.get(name, 0) + n
+
+    def snapshot(self) -> Dict[str, Any]:
+        """JSON-friendly summary: count / avg / p50 / p95 / max per stage, plus counters."""
+        with self._lock:
+            stages = {
+                name: {
+                    "count": h.count,
+                    "avg_ms": round(h.sum_ms / h.count, 2) if h.count else 0.0,
+                    "p50_ms": round(h.quantile(0.5), 2),
+                    "p95_ms": round(h.quantile(0.95), 2),
+                    "max_ms": round(h.max_ms, 2),
+                }
+                for name, h in sorted(self._hist.items())
+            }
+            counters = dict(sorted(self._counters.items()))
+        return {"uptime_s": int(time.time() - self.started), "stages": stages, "counters": counters}
+
+    def prometheus_text(self) -> str:
+        """Prometheus exposition format (spotify_bridge_stage_ms histogram, spotify_bridge_<counter>_total)."""
+        out = [
+            "# HELP spotify_bridge_stage_ms Bridge stage latency in milliseconds",
+            "# TYPE spotify_bridge_stage_ms histogram",
+        ]
+        with self._lock:
+            for name, h in sorted(self._hist.items()):
+                cumulative = 0
+                for bound, c in zip(BUCKETS_MS, h.counts):
+                    cumulative += c
+                    out.append(f'spotify_bridge_stage_ms_bucket{{stage="{name}",le="{bound:g}"}} {cumulative}')
+                out.append(f'spotify_bridge_stage_ms_bucket{{stage="{name}",le="+Inf"}} {h.count}')
+                out.append(f'spotify_bridge_stage_ms_sum{{stage="{name}"}} {h.sum_ms:.3f}')
+                out.append(f'spotify_bridge_stage_ms_count{{stage="{name}"}} {h.count}')
+            for name, v in sorted(self._counters.items()):
+                out.append(f"# TYPE spotify_bridge_{name}_total counter")
+                out.append(f"spotify_bridge_{name}_total {v}")
+        return "\n".join(out) + "\n"
+
+
+# Process-wide registry used by the bridge
+METRICS = Metrics()
+
+
+def serve_metrics(port: int, host: str = "127.0.0.1", metrics: Metrics = METRICS) -> ThreadingHTTPServer:
+    """Serve GET /metrics (Prometheus text) and /metrics.json in a daemon thread."""
+
+    class Handler(BaseHTTPRequestHandler):
+        def do_GET(self) -> None:
+            if self.path == "/metrics":
+                body = metrics.prometheus_text().encode()
+                ctype = "text/plain; version=0.0.4"
+            elif self.path == "/metrics.json":
+                body = json.dumps(metrics.snapshot()).encode()
+                ctype = "application/json"
+            else:
+                self.send_error(404)
+                return
+            self.send_response(200)
+            self.send_header("Content-Type", ctype)
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, format: str, *args: Any) -> None:
+            pass
+
+    server = ThreadingHTTPServer((host, port), Handler)
+    threading.Thread(target=server.serve_forever, name="bridge-metrics", daemon=True).start()
+    return server
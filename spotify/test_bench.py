@@ -0,0 +1,43 @@
+"""Offline bridge run against the fakes (run: python3 spotify/test_bench.py)."""
+
+import contextlib
+import io
+from pathlib import Path
+import sys
+
+_ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(_ROOT))
+
+from spotify.bench import run_bench
+from spotify.fakes import FakeClock, FakeSpotify, FakeTrack
+
+
+def main() -> None:
+    clock = FakeClock()
+    tracks = [FakeTrack("u:a", "A", "One", "X", 10_000), FakeTrack("u:b", "A", "Two", "X", 10_000)]
+    sp = FakeSpotify(tracks, [(0, "play", 0), (2, "pause", None), (5, "resume", None), (6, "seek", 9_000)], clock)
+    t0 = clock.time()
+    assert sp.state_at(t0 + 1.5) == (tracks[0], 1500, True)
+    assert sp.state_at(t0 + 4) == (tracks[0], 2000, False)
+    # Seek near the end, then the next track starts on its own
+    assert sp.state_at(t0 + 7.5) == (tracks[1], 500, True)
+    assert sp.state_at(t0 + 30) == (None, 0, False)
+
+    with contextlib.redirect_stdout(io.StringIO()):
+        report = run_bench(minutes=20)
+        flaky = run_bench(minutes=20, spotify_errors=0.1, lrclib_errors=0.2, seed=3)
+
+    assert report["line_accuracy"] > 0.95, report
+    assert report["time_to_lyrics_s"]["count"] >= 5
+    assert report["time_to_lyrics_s"]["max"] < 3.0
+    # Adaptive polling: fewer calls than one per second
+    assert report["spotify_api_calls_per_hour"] < 3600
+    # lyrics/current only on line changes, not every poll
+    assert report["publishes"]["home/spotify/lyrics/current"] < report["spotify_api_calls"] / 2
+    assert flaky["spotify_api_errors"] > 0 and flaky["line_accuracy"] is not None
+
+    print("bench tests ok")
+
+
+if __name__ == "__main__":
+    main()
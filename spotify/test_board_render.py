@@ -0,0 +1,70 @@
+"""Quick checks for board-ready music payloads (run: python3 spotify/test_board_render.py)."""
+
+from pathlib import Path
+import sys
+
+_ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(_ROOT))
+
+from spotify.board_render import (
+    LYRICS_WINDOW,
+    MAX_LINE_CHARS,
+    RENDER_VERSION,
+    ascii_fold,
+    lyric_frames,
+    lyrics_payload,
+    music_payload,
+    profile_for,
+    render_line,
+    wrap_rows,
+)
+
+
+def main() -> None:
+    assert ascii_fold("Beyoncé") == "Beyonce"
+    assert ascii_fold("Don’t Stop – Live…") == "Don't Stop - Live..."
+    assert ascii_fold("Motörhead\nØresund") == "Motorhead Oresund"
+    assert ascii_fold("東京") == "??"
+
+    wc = profile_for("wc")
+    assert wc.max_chars == 10 and wc.inner_w == 60
+
+    # Fits: centered like DisplayText.set_marquee_line (x = margin + (inner - width) // 2)
+    short = render_line("Beyoncé", wc)
+    assert short == {"t": "Beyonce", "x": 11}
+
+    # Too wide: only flagged, the board's pixel scroller moves it
+    assert render_line("Bohemian Rhapsody", wc) == {"t": "Bohemian Rhapsody", "s": 1}
+    # Exactly the band: still centered
+    assert render_line("x" * 10, wc) == {"t": "x" * 10, "x": 2}
+
+    assert len(render_line("x" * 200, wc)["t"]) == MAX_LINE_CHARS
+
+    p = music_payload("", "Song", profile_for("bathroom"))
+    assert p["artist"] == "Unknown Artist" and p["preset_id"] == "music"
+    assert p["render"]["v"] == RENDER_VERSION and p["render"]["p"] == "bathroom"
+
+    # Lyrics: word wrap to the 10-char band, long words split
+    assert wrap_rows("Is this the real life?", 10) == ["Is this", "the real", "life?"]
+    assert wrap_rows("Supercalifragilistic", 10) == ["Supercalif", "ragilistic"]
+    assert wrap_rows("  ", 10) == []
+
+    # Two rows per frame; a four-row line is paged, time split by characters up to the next line
+    frames = lyric_frames([(1000, "Is this the real life? Is this just"), (9000, ""), (12000, "Mama")], wc, 20000)
+    assert frames[0] == (1000, "Is this", "the real")
+    assert frames[1][1:] == ("life? Is", "this just") and 1000 < frames[1][0] < 9000
+    assert frames[2] == (9000, "", "")
+    assert frames[3] == (12000, "Mama", "")
+    assert [f[0] for f in frames] == sorted(f[0] for f in frames)
+    assert all(len(row) <= wc.max_chars for f in frames for row in f[1:])
+
+    p = lyrics_payload("spotify:track:x", frames, 1, 5000, True, reset=True)
+    assert p["mode"] == "lyrics" and p["r"] == 1 and p["pl"] == 1 and p["p"] == 5000
+    assert p["f"][0] == [frames[1][0], "life? Is", "this just"]
+    assert len(p["f"]) == min(LYRICS_WINDOW, len(frames) - 1)
+
+    print("board render tests ok")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,76 @@
+"""Quick checks for bridge publishing (run: python3 spotify/test_bridge.py)."""
+
+from pathlib import Path
+import sys
+import time
+
+_ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(_ROOT))
+
+from spotify import topics
+from spotify.bridge import LINES_RESEND_MIN_S, AccountPoller
+from spotify.fakes import FakeClock, FakeLrclibSession, FakeMqttClient, FakeSpotify, FakeTrack, synthetic_lrc
+from spotify.lyrics_sources import LrclibSource, LyricsCache
+
+
+def make_poller(clock: FakeClock, mqtt_v5: bool = False) -> AccountPoller:
+    tracks = [FakeTrack("u:a", "A", "One", "X", 60_000, synthetic_lrc(60_000))]
+    return AccountPoller(
+        name="test",
+        sp=FakeSpotify(tracks, [(0, "play", 0)], clock),
+        client=FakeMqttClient(clock),  # type: ignore[arg-type]
+        topic_set=topics.for_prefix(),
+        sources=[LrclibSource(FakeLrclibSession(tracks, clock))],  # type: ignore[arg-type]
+        lyrics_cache=LyricsCache(),
+        library=None,
+        lyrics_save=False,
+        dry_run=False,
+        poll_interval=1.0,
+        paused_interval=5.0,
+        idle_interval=10.0,
+        clock=clock.time,
+        mqtt_v5=mqtt_v5,
+    )
+
+
+def main() -> None:
+    # Message expiry follows the connection's protocol flag, not the paho version's Client attributes
+    for mqtt_v5, expiry in ((False, None), (True, 300)):
+        poller = make_poller(FakeClock(), mqtt_v5)
+        poller.poll_once()
+        sink = poller.client
+        assert sink.expiry[topics.NOW_PLAYING] == expiry
+        assert sink.expiry[topics.LYRICS_ANCHOR] == expiry
+        assert sink.expiry[topics.LYRICS_TRACK] is None
+
+    # lyrics/request right after the lines went out: coalesced into one resend, not dropped
+    clock = FakeClock()
+    poller = make_poller(clock)
+    poller.poll_once()
+    sink = poller.client
+    sent = lambda: sink.counts().get(topics.LYRICS_LINES, 0)  # noqa: E731
+    assert sent() == 1
+    clock.advance(LINES_RESEND_MIN_S - 0.05)
+    for _ in range(3):
+        poller.handle_lyrics_request({})
+    poller.handle_lyrics_request({"track_uri": "u:other"})
+    assert sent() == 1
+    time.sleep(0.3)
+    assert sent() == 2
+    # Later requests go out at once; another track's request is ignored
+    clock.advance(LINES_RESEND_MIN_S)
+    poller.handle_lyrics_request({"track_uri": "u:a"})
+    poller.handle_lyrics_request({"track_uri": "u:other"})
+    assert sent() == 3
+    # A pending resend is dropped when the lines went out again meanwhile (track change)
+    clock.advance(LINES_RESEND_MIN_S - 0.05)
+    poller.handle_lyrics_request({})
+    poller._send_lines()
+    time.sleep(0.3)
+    assert sent() == 4
+
+    print("bridge tests ok")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,89 @@
+"""Quick checks for the local .lrc library index (run: python3 spotify/test_local_library.py)."""
+
+import contextlib
+import io
+import os
+from pathlib import Path
+import sqlite3
+import sys
+import tempfile
+
+_ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(_ROOT))
+
+from spotify.local_library import INDEX_FILENAME, INDEX_VERSION, LocalLibrary, LocalLibrarySource, read_lrc_metadata
+
+SUN = "[ar:The Beatles]\n[ti:Here Comes the Sun - Remastered 2009]\n[length:3:05]\n[00:01.00]sun\n"
+NO_LENGTH = "[00:01.00]no length\n"
+
+
+def write(path: Path, text: str, mtime_s: int) -> None:
+    path.write_text(text, encoding="utf-8")
+    os.utime(path, (mtime_s, mtime_s))
+
+
+def main() -> None:
+    assert read_lrc_metadata(Path("x.lrc"), SUN) == ("The Beatles", "Here Comes the Sun - Remastered 2009", 185)
+    assert read_lrc_metadata(Path("Queen - Bohemian Rhapsody.lrc"), "") == ("Queen", "Bohemian Rhapsody", None)
+    assert read_lrc_metadata(Path("x.lrc"), "[length: 225]\n")[2] == 225
+
+    with tempfile.TemporaryDirectory() as tmp:
+        root = Path(tmp)
+        (root / "sub").mkdir()
+        write(root / "sun.lrc", SUN, 1_000)
+        write(root / "sub" / "Queen - Bohemian Rhapsody.lrc", NO_LENGTH, 1_000)
+        write(root / "notes.txt", "not lyrics", 1_000)
+
+        lib = LocalLibrary(root)
+        assert lib.refresh() == (2, 0)
+        assert lib.refresh() == (0, 0)
+
+        # Normalized keys (suffix, case, featured artists); ±5 s with a [length:] tag
+        assert lib.lookup("The Beatles", "Here Comes The Sun", 185) == SUN
+        assert lib.lookup("the beatles, Someone", "Here Comes the Sun (Remastered)", 190) == SUN
+        assert lib.lookup("The Beatles", "Here Comes the Sun", 191) is None
+        # Without [length:] any duration matches
+        assert lib.lookup("Queen", "Bohemian Rhapsody", 354) == NO_LENGTH
+        assert lib.lookup("Queen", "Bohemian Rhapsody", 1) == NO_LENGTH
+        assert lib.lookup("Queen", "Other Song", 354) is None
+
+        # Changed mtime: re-read; deleted file: dropped
+        changed = SUN.replace("[length:3:05]", "[length:4:00]")
+        write(root / "sun.lrc", changed, 2_000)
+        (root / "sub" / "Queen - Bohemian Rhapsody.lrc").unlink()
+        assert lib.refresh() == (1, 1)
+        assert lib.lookup("The Beatles", "Here Comes the Sun", 185) is None
+        assert lib.lookup("The Beatles", "Here Comes the Sun", 240) == changed
+        assert lib.lookup("Queen", "Bohemian Rhapsody", 354) is None
+
+        # save(): tagged "<primary artist> - <title>.lrc", indexed at once, found again by duration
+        path = lib.save("Simon & Garfunkel, Other", "The Boxer: Live", "Bridge", 305, "[00:02.00]lie la lie\n")
+        assert path.name == "Simon & Garfunkel - The Boxer_ Live.lrc"
+        saved = path.read_text(encoding="utf-8")
+        assert saved.startswith("[ar:Simon & Garfunkel, Other]\n[ti:The Boxer: Live]\n[al:Bridge]\n[length:5:05]\n")
+        assert lib.lookup("Simon & Garfunkel", "The Boxer: Live", 303) == saved
+        assert lib.save("Simon & Garfunkel, Other", "The Boxer: Live", "Bridge", 305, "[00:02.00]lie la lie\n") == path
+        assert lib.refresh() == (0, 0)
+        lib.close()
+
+        # An index written with other key normalization is rebuilt on open
+        db = sqlite3.connect(str(root / INDEX_FILENAME))
+        db.execute(f"PRAGMA user_version = {INDEX_VERSION - 1}")
+        db.commit()
+        db.close()
+        lib = LocalLibrary(root)
+        assert lib.lookup("The Beatles", "Here Comes the Sun", 240) is None
+        assert lib.refresh() == (2, 0)
+
+        # As a lyrics source: indexed when created, refreshed in the background
+        with contextlib.redirect_stdout(io.StringIO()):
+            src = LocalLibrarySource(lib, refresh_interval=3600)
+        assert src.lookup("The Beatles", "Here Comes the Sun", "", 240) == changed
+        src.stop()
+        lib.close()
+
+    print("local library tests ok")
+
+
+if __name__ == "__main__":
+    main()
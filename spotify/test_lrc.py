@@ -6,7 +6,15 @@ import sys
 _ROOT = Path(__file__).resolve().parent.parent
 sys.path.insert(0, str(_ROOT))
 
-from spotify.lrc import line_at_progress, parse_synced_lrc
+from spotify.lrc import (
+    decode_word_timings,
+    encode_word_timings,
+    line_at_progress,
+    parse_synced_lrc,
+    parse_synced_lrc_words,
+    word_at_progress,
+    word_span,
+)
 
 
 def main() -> None:
@@ -30,6 +38,30 @@ def main() -> None:
     assert idx2 == 2
     assert cur2 == "Third line"
 
+    idx3, prev3, cur3, _ = line_at_progress(lines, 0)
+    assert idx3 == 0 and prev3 is None and cur3 == "First line"
+
+    enhanced = """[00:12.00]<00:12.00>Hello <00:12.50>big <00:13.10>world<00:14.00>
+[00:15.00]Plain line
+"""
+    elines, ewords = parse_synced_lrc_words(enhanced)
+    assert elines == [(12000, "Hello big world"), (15000, "Plain line")]
+    assert parse_synced_lrc(enhanced) == elines
+    w = ewords[0]
+    assert list(w.offsets) == [0, 6, 10]
+    assert list(w.times) == [12000, 12500, 13100]
+    assert ewords[1] is None
+    assert word_at_progress(w, 11999) == -1
+    assert word_at_progress(w, 12600) == 1
+    assert word_span(elines[0][1], w, 1) == (6, 10)
+    assert word_span(elines[0][1], w, 2) == (10, 15)
+
+    flat = encode_word_timings(w, 12000)
+    assert flat == [0, 0, 6, 500, 10, 1100]
+    back = decode_word_timings(flat, 12000)
+    assert back is not None and list(back.times) == list(w.times)
+    assert decode_word_timings([1, 2, 3], 0) is None
+
     print("lrc tests ok")
 
 
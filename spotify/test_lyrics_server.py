@@ -0,0 +1,103 @@
+"""Quick checks for the headless lyrics server (run: python3 spotify/test_lyrics_server.py)."""
+
+from pathlib import Path
+import http.client
+import json
+import sys
+import threading
+
+_ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(_ROOT))
+
+from spotify.lyrics_server import LyricsHub, serve_lyrics
+from spotify.viewer_state import ViewerState
+
+
+def _queue(state: ViewerState, topic: str, payload: dict) -> None:
+    state.lock_msg_queue.put((topic, payload))
+
+
+def _read_event(resp: http.client.HTTPResponse) -> dict:
+    """Next "id: / data:" event from an SSE stream (skips retry / keepalive lines)."""
+    event: dict = {}
+    while True:
+        line = resp.readline().decode().rstrip("\n")
+        if not line:
+            if "data" in event:
+                return event
+            continue
+        key, _, value = line.partition(": ")
+        if key in ("id", "data"):
+            event[key] = value
+
+
+def main() -> None:
+    now = [1.0]
+    state = ViewerState()
+    hub = LyricsHub(state, clock=lambda: now[0])
+    t = state.topics
+    _queue(
+        state,
+        t.now_playing,
+        {"track_uri": "u", "artist": "A", "title": "T", "is_playing": True, "duration_ms": 60000},
+    )
+    _queue(state, t.lyrics_anchor, {"u": "u", "p": 0, "a": 1000, "r": 1.0, "pl": 1})
+    _queue(state, t.lyrics_lines, {"track_uri": "u", "lines": [{"t": 0, "text": "one"}, {"t": 4000, "text": "two"}]})
+    assert hub.update() == 4000
+    assert hub.seq == 1 and hub.view["current"] == "one" and hub.view["next"] == "two"
+
+    # Unchanged view: no new sequence number for clients
+    now[0] = 2.0
+    hub.update()
+    assert hub.seq == 1
+
+    server = serve_lyrics(hub, 0, "127.0.0.1")
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    port = server.server_address[1]
+    try:
+        conn = http.client.HTTPConnection("127.0.0.1", port, timeout=5)
+        conn.request("GET", "/events")
+        resp = conn.getresponse()
+        assert resp.status == 200 and resp.getheader("Content-Type") == "text/event-stream"
+        first = _read_event(resp)
+        assert first["id"] == "1" and json.loads(first["data"])["current"] == "one"
+
+        # Next line: every client gets the new view with the next sequence number
+        now[0] = 5.0
+        hub.update()
+        second = _read_event(resp)
+        assert second["id"] == "2" and json.loads(second["data"])["current"] == "two"
+
+        snap = json.loads(http_get(port, "/state"))
+        assert snap["seq"] == 2 and snap["clients"] == 1
+        conn.close()
+
+        # Resuming with Last-Event-ID does not resend the view the client already has
+        now[0] = 6.0
+        conn = http.client.HTTPConnection("127.0.0.1", port, timeout=5)
+        conn.request("GET", "/events", headers={"Last-Event-ID": "2"})
+        resp = conn.getresponse()
+        _queue(state, t.now_playing, {"track_uri": "v", "artist": "B", "title": "S", "is_playing": True})
+        hub.update()
+        third = _read_event(resp)
+        assert third["id"] == "3" and json.loads(third["data"])["meta"] == "B\nS"
+        conn.close()
+
+        assert "EventSource" in http_get(port, "/")
+    finally:
+        server.shutdown()
+        server.server_close()
+
+    print("lyrics server tests ok")
+
+
+def http_get(port: int, path: str) -> str:
+    conn = http.client.HTTPConnection("127.0.0.1", port, timeout=5)
+    conn.request("GET", path)
+    body = conn.getresponse().read().decode()
+    conn.close()
+    return body
+
+
+if __name__ == "__main__":
+    main()
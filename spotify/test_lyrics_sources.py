@@ -0,0 +1,111 @@
+"""Quick checks for the LRCLIB source miss cache (run: python3 spotify/test_lyrics_sources.py)."""
+
+import contextlib
+import io
+from pathlib import Path
+import sys
+import threading
+from urllib.parse import urlparse
+
+_ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(_ROOT))
+
+import requests
+
+from spotify.fakes import FakeResponse
+from spotify.lrclib_client import _race, _worker_session
+from spotify.lyrics_sources import LrclibSource, fetch_from_sources
+
+LRC = "[00:01.00]hello"
+
+
+class ScriptedSession:
+    """Answers /get and /search with a fixed status (or raises an exception instance); counts requests."""
+
+    def __init__(self, get, search) -> None:
+        self.answers = {"/get": get, "/search": search}
+        self.requests = 0
+        self._lock = threading.Lock()
+
+    def get(self, url, params=None, **_kwargs):
+        with self._lock:
+            self.requests += 1
+        path = urlparse(url).path
+        answer = self.answers["/get" if path.endswith("/get") else "/search"]
+        if isinstance(answer, Exception):
+            raise answer
+        if answer == 200:
+            if path.endswith("/get"):
+                return FakeResponse(200, {"syncedLyrics": LRC})
+            return FakeResponse(200, [])
+        return FakeResponse(answer, {"message": "x"})
+
+
+def looked_up_again(get, search, race) -> bool:
+    """Look the same track up twice; True if the second lookup went to LRCLIB again."""
+    sess = ScriptedSession(get, search)
+    src = LrclibSource(sess, race=race)  # type: ignore[arg-type]
+    with contextlib.redirect_stdout(io.StringIO()):
+        assert fetch_from_sources([src], "Queen", "Bohemian Rhapsody", "", 354) == (None, None)
+        first = sess.requests
+        fetch_from_sources([src], "Queen", "Bohemian Rhapsody", "", 354)
+    return sess.requests > first
+
+
+def main() -> None:
+    for race in (False, True):
+        # Both endpoints answered "nothing": a real miss, cached
+        assert not looked_up_again(404, 200, race)
+        # 500, 429, a timeout or a dropped connection on either endpoint: not cached
+        assert looked_up_again(500, 200, race)
+        assert looked_up_again(404, 429, race)
+        assert looked_up_again(requests.Timeout("read timed out"), 200, race)
+        assert looked_up_again(404, requests.ConnectionError("reset"), race)
+
+        # A failed search does not hide a found exact match
+        src = LrclibSource(ScriptedSession(200, 503), race=race)  # type: ignore[arg-type]
+        assert src.lookup("Queen", "Bohemian Rhapsody", "", 354) == LRC
+
+    # Several poll threads: one requests.Session per thread, one shared miss cache
+    src = LrclibSource()
+    sessions = []
+    thread = threading.Thread(target=lambda: sessions.append(src.session))
+    thread.start()
+    thread.join()
+    assert src.session is src.session and sessions[0] is not src.session
+    shared = ScriptedSession(404, 200)
+    src = LrclibSource(shared)  # type: ignore[arg-type]
+    threads = [
+        threading.Thread(target=lambda k=k: [src.lookup("Artist", f"Song {k} {n}", "", 200) for n in range(50)])
+        for k in range(4)
+    ]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert len(src._misses) == 200
+    src.lookup("Artist", "Song 0 0", "", 200)
+    assert shared.requests == 400
+
+    # Races run on one shared pool; each worker uses its own session, never the caller's thread's
+    seen = []
+    gate = threading.Barrier(2)
+
+    def strategy():
+        gate.wait(timeout=5)  # both strategies in flight at once
+        seen.append((threading.current_thread().name, _worker_session()))
+        return None
+
+    for _ in range(3):
+        assert _race([strategy, strategy]) is None
+    assert all(name.startswith("lrclib") for name, _sess in seen)
+    by_thread = {}
+    for name, sess in seen:
+        assert by_thread.setdefault(name, sess) is sess
+    assert len(set(map(id, by_thread.values()))) == len(by_thread) >= 2
+
+    print("lyrics sources tests ok")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,38 @@
+"""Quick checks for lyrics search matching (run: python3 spotify/test_matching.py)."""
+
+from pathlib import Path
+import sys
+
+_ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(_ROOT))
+
+from spotify.matching import best_record, make_query, normalize_artist, normalize_title
+
+
+def main() -> None:
+    assert normalize_title("Here Comes the Sun - Remastered 2009") == "here comes the sun"
+    assert normalize_title("Señorita (feat. Someone) [Live]") == "senorita"
+    assert normalize_title("Don't Stop Me Now") == normalize_title("Dont Stop Me Now")
+    assert normalize_title("Stay With Me") == "stay with me"
+    assert normalize_artist("Beyoncé, JAY-Z") == "beyonce"
+    assert normalize_artist("Simon & Garfunkel") == "simon"
+
+    q = make_query("The Beatles", "Here Comes the Sun - Remastered 2009", 185)
+    assert make_query("The Beatles", "Here Comes the Sun - Remastered 2009", 185) is q
+
+    records = [
+        # Closest duration, but a different song: must not win any more
+        {"trackName": "Here Comes the Rain", "artistName": "Other", "duration": 185, "syncedLyrics": "[00:01.00]x"},
+        {"trackName": "Here Comes The Sun", "artistName": "The Beatles", "duration": 188, "syncedLyrics": "[00:01.00]ok"},
+        {"trackName": "Here Comes The Sun", "artistName": "The Beatles", "duration": 186, "syncedLyrics": ""},
+        {"trackName": "Here Comes The Sun", "artistName": "The Beatles", "duration": 200, "syncedLyrics": "[00:01.00]long"},
+    ]
+    best = best_record(q, records)
+    assert best is not None and best["syncedLyrics"] == "[00:01.00]ok"
+    assert best_record(make_query("Nobody", "Nothing", 185), records) is None
+
+    print("matching tests ok")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,44 @@
+"""Quick checks for bridge stage metrics (run: python3 spotify/test_metrics.py)."""
+
+from pathlib import Path
+import sys
+
+_ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(_ROOT))
+
+from spotify.metrics import Metrics
+
+
+def main() -> None:
+    m = Metrics()
+    for ms in (0.2, 3, 3, 40, 7000):
+        m.observe("spotify_api", ms)
+    m.inc("mqtt_publishes")
+    m.inc("mqtt_publish_bytes", 120)
+
+    snap = m.snapshot()
+    api = snap["stages"]["spotify_api"]
+    assert api["count"] == 5
+    assert api["p50_ms"] == 5
+    # Quantiles in the +Inf bucket report the largest observation
+    assert api["max_ms"] == 7000 and api["p95_ms"] == 7000
+    assert snap["counters"] == {"mqtt_publish_bytes": 120, "mqtt_publishes": 1}
+
+    # Single fast observation: quantile capped at the observed value, not the bucket bound
+    m.observe("json_encode", 0.04)
+    assert m.snapshot()["stages"]["json_encode"]["p50_ms"] == 0.04
+
+    text = m.prometheus_text()
+    assert 'spotify_bridge_stage_ms_bucket{stage="spotify_api",le="5"} 3' in text
+    assert 'spotify_bridge_stage_ms_bucket{stage="spotify_api",le="+Inf"} 5' in text
+    assert "spotify_bridge_mqtt_publishes_total 1" in text
+
+    with m.time("poll"):
+        pass
+    assert m.snapshot()["stages"]["poll"]["count"] == 1
+
+    print("metrics tests ok")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,46 @@
+"""Quick checks for progress extrapolation (run: python3 spotify/test_timing.py)."""
+
+from pathlib import Path
+import sys
+
+_ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(_ROOT))
+
+from spotify.timing import (
+    anchor_changed,
+    extrapolate_progress,
+    index_at,
+    make_anchor,
+    ms_until_next,
+)
+
+
+def main() -> None:
+    a = make_anchor("spotify:track:1", 10_000, 1_000_000, True)
+    assert extrapolate_progress(a, 1_002_500) == 12_500
+    assert extrapolate_progress(a, 1_002_500, duration_ms=11_000) == 11_000
+
+    paused = make_anchor("spotify:track:1", 10_000, 1_000_000, False)
+    assert extrapolate_progress(paused, 1_060_000) == 10_000
+
+    # Steady playback polled a second later: within tolerance, no re-publish
+    assert not anchor_changed(a, make_anchor("spotify:track:1", 11_100, 1_001_000, True))
+    # Seek, pause and track change all re-publish
+    assert anchor_changed(a, make_anchor("spotify:track:1", 60_000, 1_001_000, True))
+    assert anchor_changed(a, make_anchor("spotify:track:1", 11_000, 1_001_000, False))
+    assert anchor_changed(a, make_anchor("spotify:track:2", 0, 1_001_000, True))
+    assert anchor_changed(None, a)
+
+    times = [1000, 5500, 10000]
+    assert index_at(times, 0) == -1
+    assert index_at(times, 5500) == 1
+    assert index_at(times, 99999) == 2
+    assert ms_until_next(times, 5600) == 4400
+    assert ms_until_next(times, 10000) is None
+    assert ms_until_next(times, 5600, rate=0.0) is None
+
+    print("timing tests ok")
+
+
+if __name__ == "__main__":
+    main()
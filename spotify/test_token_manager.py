@@ -0,0 +1,100 @@
+"""Quick checks for the Spotify token refresh (run: python3 spotify/test_token_manager.py)."""
+
+import contextlib
+import io
+import json
+import os
+from pathlib import Path
+import sys
+import tempfile
+import threading
+import time
+
+_ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(_ROOT))
+
+from spotipy.oauth2 import SpotifyOauthError
+
+from spotify.token_manager import REFRESH_MARGIN_S, AtomicCacheFileHandler, TokenManager
+
+
+class StubOAuth:
+    """SpotifyOAuth stand-in: refresh_access_token() writes a new token through the cache handler."""
+
+    def __init__(self, handler: AtomicCacheFileHandler) -> None:
+        self.handler = handler
+        self.refreshes = 0
+        self._lock = threading.Lock()
+
+    def refresh_access_token(self, refresh_token):
+        with self._lock:
+            self.refreshes += 1
+            n = self.refreshes
+        token = {"access_token": f"fresh{n}", "refresh_token": refresh_token, "expires_at": int(time.time()) + 3600}
+        self.handler.save_token_to_cache(token)
+        return token
+
+
+def token(access, expires_in, refresh="r"):
+    return {"access_token": access, "refresh_token": refresh, "expires_at": int(time.time() + expires_in)}
+
+
+def main() -> None:
+    with tempfile.TemporaryDirectory() as tmp:
+        cache = Path(tmp) / ".spotify_cache"
+        handler = AtomicCacheFileHandler(cache)
+        assert handler.get_cached_token() is None
+
+        # Valid token: served from memory, no refresh
+        handler.save_token_to_cache(token("a", 3600))
+        oauth = StubOAuth(handler)
+        tm = TokenManager(oauth, handler)  # type: ignore[arg-type]
+        assert tm.get_access_token() == "a" and oauth.refreshes == 0
+        # Inside the refresh margin but not expired: still no inline refresh (the background thread's job)
+        tm._token = token("soon", REFRESH_MARGIN_S - 10)
+        assert tm.get_access_token() == "soon"
+
+        # Another process already refreshed: the fresher token on disk is adopted, not refreshed again
+        handler.save_token_to_cache(token("other", 3600))
+        tm._token = token("old", -1)
+        assert tm.refresh()["access_token"] == "other" and oauth.refreshes == 0
+
+        # Expired everywhere: refreshed once (inline call and background thread serialize on the lock file)
+        handler.save_token_to_cache(token("old", -1))
+        oauth = StubOAuth(handler)
+        tm = TokenManager(oauth, handler)  # type: ignore[arg-type]
+        assert tm.get_access_token().startswith("fresh")
+        time.sleep(0.2)
+        assert oauth.refreshes == 1 and handler.get_cached_token()["access_token"] == "fresh1"
+
+        # Nothing to refresh with
+        handler.save_token_to_cache(token("old", -1, refresh=None))
+        tm = TokenManager(StubOAuth(handler), handler)  # type: ignore[arg-type]
+        tm._thread = threading.current_thread()  # no background refresh in this check
+        try:
+            tm.get_access_token()
+        except SpotifyOauthError:
+            pass
+        else:
+            raise AssertionError("expected SpotifyOauthError")
+
+        # A failed write never leaves a partial or temp file behind
+        before = cache.read_text(encoding="utf-8")
+        try:
+            handler.save_token_to_cache({"access_token": object()})
+        except TypeError:
+            pass
+        assert cache.read_text(encoding="utf-8") == before
+        assert json.loads(before)["access_token"] == "old"
+        assert sorted(os.listdir(tmp)) == [".spotify_cache", ".spotify_cache.lock"]
+        with contextlib.redirect_stdout(io.StringIO()) as out:
+            AtomicCacheFileHandler(Path(tmp) / "missing" / "cache").save_token_to_cache(token("x", 1))
+        assert "Couldn't write" in out.getvalue()
+        if os.name == "posix":
+            assert cache.stat().st_mode & 0o777 == 0o600
+
+    print("token manager tests ok")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,76 @@
+"""Quick checks for the lyrics viewer's redraw logic (run: python3 spotify/test_viewer.py)."""
+
+import json
+from pathlib import Path
+import sys
+from types import SimpleNamespace
+
+_ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(_ROOT))
+
+from spotify.viewer_state import ViewerState, apply_message, on_message_factory, render_view
+
+
+def main() -> None:
+    state = ViewerState()
+    view, wait = render_view(state, 0)
+    assert view["current"] == "Not playing" and wait is None
+
+    apply_message(
+        state,
+        state.topics.now_playing,
+        {"track_uri": "u", "artist": "A", "title": "T", "is_playing": True, "duration_ms": 60000},
+    )
+    apply_message(state, state.topics.lyrics_anchor, {"u": "u", "p": 5000, "a": 1000, "r": 1.0, "pl": 1})
+    view, wait = render_view(state, 1000)
+    assert view["current"] == "No lyric data yet" and wait is None
+
+    apply_message(
+        state,
+        state.topics.lyrics_lines,
+        {
+            "track_uri": "u",
+            "lines": [
+                {"t": 8000, "text": "two"},
+                {"t": 1000, "text": "one"},
+                {"t": 12000, "text": "three four", "w": [0, 0, 6, 1500]},
+            ],
+        },
+    )
+    assert state.line_times == [1000, 8000, 12000]
+
+    # Next redraw exactly at the next line start (progress 5000 -> 8000)
+    view, wait = render_view(state, 1000)
+    assert view == {"meta": "A\nT", "current": "one", "word": "", "next": "two"}
+    assert wait == 3000
+
+    # Word timings: the next word start comes before the end of the track
+    view, wait = render_view(state, 8000)
+    assert view["current"] == "three four" and view["word"] == "three"
+    assert wait == 1500
+
+    # Paused: nothing changes until the next MQTT message
+    apply_message(state, state.topics.lyrics_anchor, {"u": "u", "p": 5000, "a": 1000, "r": 0.0, "pl": 0})
+    view, wait = render_view(state, 60000)
+    assert view["current"] == "one" and wait is None
+
+    # lyrics/request only for the retained summary delivered on connect, not on a live track change
+    requests = []
+    client = SimpleNamespace(publish=lambda topic, body, qos=0: requests.append((topic, json.loads(body))))
+    state = ViewerState()
+    on_message = on_message_factory(state)
+    summary = json.dumps({"track_uri": "u", "has_lyrics": True, "line_count": 3}).encode()
+    on_message(client, None, SimpleNamespace(topic=state.topics.lyrics_track, payload=summary, retain=False))
+    assert requests == []
+    on_message(client, None, SimpleNamespace(topic=state.topics.lyrics_track, payload=summary, retain=True))
+    assert requests == [(state.topics.lyrics_request, {"track_uri": "u"})]
+    # Valid JSON that is not an object is ignored
+    for body in (b"[1, 2]", b"null", b'"x"'):
+        on_message(client, None, SimpleNamespace(topic=state.topics.lyrics_track, payload=body, retain=True))
+    assert state.lock_msg_queue.qsize() == 2 and len(requests) == 1
+
+    print("viewer tests ok")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,101 @@
+"""
+Playback timing anchor shared by the bridge, the viewer and display boards.
+
+The bridge publishes a small anchor (retained, only when it changes) on
+home/spotify/lyrics/anchor; subscribers extrapolate progress locally instead
+of receiving the current lyric line every second.
+
+Anchor keys:
+  u   track URI (None when nothing is playing)
+  p   playback progress in ms at the anchor
+  a   wall-clock time of the anchor in ms (Unix epoch)
+  r   playback rate (1.0 while playing)
+  pl  1 while playing, 0 when paused
+
+Plain Python on purpose (no typing / __future__ imports) so the same file can
+be copied to a CircuitPython board.
+"""
+
+# Re-publish when the extrapolated progress is off by more than this (seek, buffering).
+DRIFT_TOLERANCE_MS = 1500
+
+
+def make_anchor(track_uri, progress_ms, anchor_ms, is_playing, rate=1.0):
+    return {
+        "u": track_uri,
+        "p": int(progress_ms),
+        "a": int(anchor_ms),
+        "r": rate if is_playing else 0.0,
+        "pl": 1 if is_playing else 0,
+    }
+
+
+def anchor_from_now_playing(now_playing):
+    """Anchor equivalent of a home/spotify/now_playing payload (progress_ms at timestamp_ms)."""
+    return make_anchor(
+        now_playing.get("track_uri"),
+        now_playing.get("progress_ms") or 0,
+        now_playing.get("timestamp_ms") or 0,
+        bool(now_playing.get("is_playing")),
+    )
+
+
+def rebase_anchor(anchor, local_now_ms):
+    """
+    Copy of anchor re-expressed on a local clock, for boards without wall-clock time:
+    treats the moment of receipt as the anchor time (MQTT delivery latency is ignored).
+    """
+    rebased = dict(anchor)
+    rebased["a"] = int(local_now_ms)
+    return rebased
+
+
+def extrapolate_progress(anchor, now_ms, duration_ms=0):
+    """Progress in ms at now_ms (same clock as anchor["a"]); clamped to [0, duration_ms] if known."""
+    if not anchor:
+        return 0
+    base = int(anchor.get("p") or 0)
+    if anchor.get("pl"):
+        rate = anchor.get("r")
+        if rate is None:
+            rate = 1.0
+        base += int((now_ms - int(anchor.get("a") or now_ms)) * rate)
+    if duration_ms and base > duration_ms:
+        base = duration_ms
+    return max(0, base)
+
+
+def anchor_changed(prev, new, tolerance_ms=DRIFT_TOLERANCE_MS):
+    """True when subscribers holding prev would now compute the wrong progress for new."""
+    if not prev:
+        return True
+    if prev.get("u") != new.get("u") or prev.get("pl") != new.get("pl") or prev.get("r") != new.get("r"):
+        return True
+    if not new.get("pl"):
+        # Paused: any seek matters
+        return prev.get("p") != new.get("p")
+    predicted = extrapolate_progress(prev, new.get("a") or 0)
+    return abs(predicted - int(new.get("p") or 0)) > tolerance_ms
+
+
+def index_at(times, progress_ms):
+    """Binary search over sorted start times: last index with times[i] <= progress_ms, or -1."""
+    lo = 0
+    hi = len(times)
+    while lo < hi:
+        mid = (lo + hi) // 2
+        if times[mid] <= progress_ms:
+            lo = mid + 1
+        else:
+            hi = mid
+    return lo - 1
+
+
+def ms_until_next(times, progress_ms, rate=1.0):
+    """Wall-clock ms until the next start time after progress_ms, or None (last line / paused)."""
+    if not rate:
+        return None
+    nxt = index_at(times, progress_ms) + 1
+    if nxt >= len(times):
+        return None
+    return max(0, int((times[nxt] - progress_ms) / rate))
@@ -0,0 +1,190 @@
+"""
+Spotify OAuth token kept in memory and refreshed in the background, before it expires.
+
+spotipy's SpotifyOAuth refreshes lazily inside the API call that finds the token expired
+(cache file read, HTTP to accounts.spotify.com, cache file write), which shows up as a latency
+spike on a Flask request or a bridge poll. TokenManager is passed to spotipy as auth_manager
+instead: API calls only read the in-memory token.
+
+The Flask app and the bridge both use it on the same .spotify_cache: writes are atomic
+(temp file + os.replace) and refreshes are serialized across processes with a lock file, so a
+process that finds a token freshly refreshed by the other one adopts it instead of refreshing again.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import tempfile
+import threading
+import time
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Any, Dict, Iterator, Optional
+
+from spotipy.cache_handler import CacheHandler
+from spotipy.oauth2 import SpotifyOauthError, SpotifyOAuth
+
+try:
+    import fcntl
+except ImportError:  # Windows: atomic writes only, no cross-process refresh lock
+    fcntl = None  # type: ignore[assignment]
+
+SCOPE = "user-read-currently-playing user-read-playback-state"
+# Refresh this long before expiry (Spotify access tokens live 3600 s)
+REFRESH_MARGIN_S = 300
+# Wait before retrying a failed background refresh
+RETRY_DELAY_S = 30
+
+
+class AtomicCacheFileHandler(CacheHandler):
+    """spotipy cache handler that never leaves a half-written token file behind."""
+
+    def __init__(self, cache_path: Path) -> None:
+        self.cache_path = Path(cache_path)
+
+    def get_cached_token(self) -> Optional[Dict[str, Any]]:
+        try:
+            with open(self.cache_path, encoding="utf-8") as f:
+                token_info = json.load(f)
+        except (OSError, ValueError):
+            return None
+        return token_info if isinstance(token_info, dict) else None
+
+    def save_token_to_cache(self, token_info: Dict[str, Any]) -> None:
+        directory = self.cache_path.parent
+        try:
+            fd, tmp = tempfile.mkstemp(prefix=f".{self.cache_path.name}.", dir=str(directory))
+            try:
+                with os.fdopen(fd, "w", encoding="utf-8") as f:
+                    json.dump(token_info, f)
+                os.chmod(tmp, 0o600)
+                os.replace(tmp, self.cache_path)
+            except BaseException:
+                os.unlink(tmp)
+                raise
+        except OSError as e:
+            print(f"Couldn't write Spotify token cache {self.cache_path}: {e}")
+
+
+class TokenManager:
+    """In-memory access token with proactive background refresh; usable as spotipy auth_manager."""
+
+    def __init__(
+        self,
+        oauth: SpotifyOAuth,
+        cache_handler: AtomicCacheFileHandler,
+        refresh_margin: float = REFRESH_MARGIN_S,
+    ) -> None:
+        self.oauth = oauth
+        self.cache_handler = cache_handler
+        self.refresh_margin = refresh_margin
+        self._lock = threading.Lock()
+        self._wake = threading.Event()
+        self._token: Optional[Dict[str, Any]] = cache_handler.get_cached_token()
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def lock_path(self) -> Path:
+        return self.cache_handler.cache_path.with_name(self.cache_handler.cache_path.name + ".lock")
+
+    @contextmanager
+    def _cross_process_lock(self) -> Iterator[None]:
+        if fcntl is None:
+            yield
+            return
+        with open(self.lock_path, "a") as lf:
+            fcntl.flock(lf, fcntl.LOCK_EX)
+            try:
+                yield
+            finally:
+                fcntl.flock(lf, fcntl.LOCK_UN)
+
+    def _expires_in(self, token: Optional[Dict[str, Any]]) -> float:
+        if not token:
+            return 0.0
+        return float(token.get("expires_at") or 0) - time.time()
+
+    def start(self) -> None:
+        """Start the refresh thread (idempotent; also restarts it in a forked worker process)."""
+        with self._lock:
+            if self._thread is not None and self._thread.is_alive():
+                return
+            self._thread = threading.Thread(target=self._refresh_loop, name="spotify-token", daemon=True)
+            self._thread.start()
+
+    def reload(self) -> None:
+        """Re-read the cache file (e.g. after the OAuth callback wrote a new token)."""
+        token = self.cache_handler.get_cached_token()
+        with self._lock:
+            self._token = token
+        self._wake.set()
+
+    def refresh(self) -> Dict[str, Any]:
+        """Refresh now unless another process already did; returns the current token."""
+        with self._cross_process_lock():
+            on_disk = self.cache_handler.get_cached_token()
+            if on_disk and self._expires_in(on_disk) > self.refresh_margin:
+                token = on_disk
+            else:
+                current = on_disk or self._token
+                if not current or not current.get("refresh_token"):
+                    raise SpotifyOauthError("No Spotify token cached; authorize via /spotify/auth first")
+                # Writes the new token through cache_handler (atomic)
+                token = self.oauth.refresh_access_token(current["refresh_token"])
+        with self._lock:
+            self._token = token
+        return token
+
+    def _refresh_loop(self) -> None:
+        while True:
+            with self._lock:
+                token = self._token
+            if not token:
+                # Not authorized yet: woken by reload() after the OAuth callback, or poll the file
+                if not self._wake.wait(RETRY_DELAY_S):
+                    token = self.cache_handler.get_cached_token()
+                    with self._lock:
+                        self._token = self._token or token
+                self._wake.clear()
+                continue
+            delay = self._expires_in(token) - self.refresh_margin
+            if delay > 0:
+                self._wake.wait(delay)
+                self._wake.clear()
+                continue
+            try:
+                self.refresh()
+            except Exception as e:
+                print(f"Spotify token refresh failed: {e}")
+                self._wake.wait(RETRY_DELAY_S)
+                self._wake.clear()
+
+    def get_access_token(self, as_dict: bool = False) -> Any:
+        """spotipy auth_manager hook: returns the in-memory token, refreshing inline only if it already expired."""
+        self.start()
+        with self._lock:
+            token = self._token
+        if self._expires_in(token) <= 0:
+            token = self.refresh()
+        return token if as_dict else token["access_token"]
+
+
+def make_token_manager(
+    client_id: str,
+    client_secret: str,
+    redirect_uri: str,
+    cache_path: Path,
+    scope: str = SCOPE,
+) -> TokenManager:
+    """SpotifyOAuth with an atomic cache file, wrapped in a TokenManager (call .start() or let the first API call do it)."""
+    handler = AtomicCacheFileHandler(Path(cache_path))
+    oauth = SpotifyOAuth(
+        client_id=client_id,
+        client_secret=client_secret,
+        redirect_uri=redirect_uri,
+        scope=scope,
+        cache_handler=handler,
+        open_browser=False,
+    )
+    return TokenManager(oauth, handler)
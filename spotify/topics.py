@@ -1,5 +1,101 @@
 """MQTT topic layout for Spotify bridge subscribers."""
 
+from typing import Dict, NamedTuple, Optional, Tuple
+
+PREFIX = "home/spotify"
+
 NOW_PLAYING = "home/spotify/now_playing"
+# Retained summary of the current track's lyrics (no lines)
 LYRICS_TRACK = "home/spotify/lyrics/track"
+# Full timed lines, not retained: published on track change and on request
+LYRICS_LINES = "home/spotify/lyrics/lines"
+# Subscribers publish here (optionally {"track_uri": ...}) to get lyrics/lines re-sent
+LYRICS_REQUEST = "home/spotify/lyrics/request"
 LYRICS_CURRENT = "home/spotify/lyrics/current"
+# Retained timing anchor (spotify/timing.py), published only on play/pause/seek/track change
+LYRICS_ANCHOR = "home/spotify/lyrics/anchor"
+# Display boards (same topics the Flask app publishes to); bridge --board-target
+DISPLAYS_PREFIX = "home/displays"
+# Bridge stage timings / counters (spotify/metrics.py), published with --metrics-interval
+BRIDGE_METRICS = "home/spotify/bridge/metrics"
+
+
+class TopicSet(NamedTuple):
+    """The bridge topics under one prefix (one per Spotify account in multi-account mode)."""
+
+    now_playing: str
+    lyrics_track: str
+    lyrics_current: str
+    lyrics_anchor: str
+    lyrics_lines: str
+    lyrics_request: str
+
+
+def for_prefix(prefix: str = PREFIX) -> TopicSet:
+    """Topics under prefix, e.g. for_prefix("home/spotify/alice").now_playing."""
+    prefix = prefix.rstrip("/")
+    return TopicSet(
+        now_playing=f"{prefix}/now_playing",
+        lyrics_track=f"{prefix}/lyrics/track",
+        lyrics_current=f"{prefix}/lyrics/current",
+        lyrics_anchor=f"{prefix}/lyrics/anchor",
+        lyrics_lines=f"{prefix}/lyrics/lines",
+        lyrics_request=f"{prefix}/lyrics/request",
+    )
+
+
+def account_prefix(account: str) -> str:
+    """Prefix for a named account in multi-account mode: home/spotify/<account>."""
+    return f"{PREFIX}/{account}"
+
+
+def display_topic(target: str) -> str:
+    """MQTT topic of a display board, e.g. display_topic("wc") -> home/displays/wc."""
+    return f"{DISPLAYS_PREFIX}/{target.lower()}"
+
+
+class TopicPolicy(NamedTuple):
+    """How the bridge publishes one topic. expiry_s needs an MQTT v5 connection (ignored on 3.1.1)."""
+
+    qos: int
+    retain: bool
+    expiry_s: Optional[int] = None
+
+
+# Keyed by TopicSet field name (plus "bridge_metrics", "display"); override with bridge --topic-policy.
+DEFAULT_POLICIES: Dict[str, TopicPolicy] = {
+    # Stale after the bridge stops: expire from the broker (re-published before expiry while valid)
+    "now_playing": TopicPolicy(qos=0, retain=True, expiry_s=300),
+    "lyrics_anchor": TopicPolicy(qos=1, retain=True, expiry_s=300),
+    "lyrics_track": TopicPolicy(qos=1, retain=True),
+    "lyrics_lines": TopicPolicy(qos=1, retain=False),
+    "lyrics_current": TopicPolicy(qos=0, retain=False),
+    "bridge_metrics": TopicPolicy(qos=0, retain=False),
+    # home/displays/<target> music frames (--board-target); not retained, like the Flask app
+    "display": TopicPolicy(qos=1, retain=False),
+}
+
+
+def parse_policy(value: str) -> Tuple[str, TopicPolicy]:
+    """
+    "ROLE=QOS[,retain|noretain][,expiry=SECONDS]" -> (role, policy), starting from the role's default,
+    e.g. "now_playing=1,retain,expiry=120" or "lyrics_track=0,noretain".
+    """
+    role, sep, spec = value.partition("=")
+    role = role.strip()
+    if not sep or role not in DEFAULT_POLICIES:
+        raise ValueError(f"unknown topic role {role!r} (one of {', '.join(DEFAULT_POLICIES)})")
+    policy = DEFAULT_POLICIES[role]
+    for part in (p.strip() for p in spec.split(",")):
+        if part in ("0", "1", "2"):
+            policy = policy._replace(qos=int(part))
+        elif part == "retain":
+            policy = policy._replace(retain=True)
+        elif part == "noretain":
+            policy = policy._replace(retain=False)
+        elif part.startswith("expiry="):
+            seconds = int(part[len("expiry="):])
+            policy = policy._replace(expiry_s=seconds if seconds > 0 else None)
+        elif part:
+            raise ValueError(f"bad policy option {part!r}")
+    return role, policy
@@ -18,14 +18,12 @@ Environment (optional): MQTT_BROKER, MQTT_PORT, MQTT_USER, MQTT_PASSWORD
 from __future__ import annotations
 
 import argparse
-import json
 import os
-import queue
 import sys
 import time
 import tkinter as tk
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Tuple
+from typing import Any, Dict, Optional
 
 _ROOT = Path(__file__).resolve().parent.parent
 if str(_ROOT) not in sys.path:
@@ -34,6 +32,15 @@ if str(_ROOT) not in sys.path:
 import paho.mqtt.client as mqtt
 
 from spotify import topics
+from spotify.viewer_state import (
+    BATCH_MS,
+    IDLE_TICK_MS,
+    ViewerState,
+    drain_messages,
+    on_message_factory,
+    render_view,
+    subscriptions,
+)
 
 try:
     from mqtt_credentials import MQTT_BROKER, MQTT_PORT, MQTT_USER, MQTT_PASSWORD
@@ -43,8 +50,6 @@ except ImportError:
     MQTT_USER = ""
     MQTT_PASSWORD = ""
 
-from spotify.lrc import line_at_progress
-
 
 def _make_mqtt_client() -> mqtt.Client:
     try:
@@ -56,53 +61,6 @@ def _make_mqtt_client() -> mqtt.Client:
         return mqtt.Client(f"spotify_lyrics_viewer_{os.getpid()}")
 
 
-def _estimate_progress(now_playing: Dict[str, Any], now_ms: int) -> int:
-    base = int(now_playing.get("progress_ms") or 0)
-    ts = int(now_playing.get("timestamp_ms") or now_ms)
-    if not now_playing.get("is_playing"):
-        return max(0, base)
-    return max(0, base + (now_ms - ts))
-
-
-class ViewerState:
-    def __init__(self) -> None:
-        self.lock_msg_queue: queue.Queue = queue.Queue()
-        self.now_playing: Dict[str, Any] = {}
-        self.lyric_lines: List[Tuple[int, str]] = []
-        self.last_current: Dict[str, Any] = {}
-
-
-def _on_message_factory(state: ViewerState):
-    def on_message(_client: mqtt.Client, _userdata: Any, msg: mqtt.MQTTMessage) -> None:
-        try:
-            payload = json.loads(msg.payload.decode("utf-8"))
-        except (json.JSONDecodeError, UnicodeDecodeError):
-            return
-        state.lock_msg_queue.put((msg.topic, payload))
-
-    return on_message
-
-
-def _apply_message(state: ViewerState, topic: str, payload: Dict[str, Any]) -> None:
-    if topic == topics.NOW_PLAYING:
-        state.now_playing = payload
-    elif topic == topics.LYRICS_TRACK:
-        raw_lines = payload.get("lines") or []
-        tuples: List[Tuple[int, str]] = []
-        if isinstance(raw_lines, list):
-            for row in raw_lines:
-                if not isinstance(row, dict):
-                    continue
-                t = row.get("t")
-                text = row.get("text")
-                if isinstance(t, (int, float)) and isinstance(text, str):
-                    tuples.append((int(t), text))
-        tuples.sort(key=lambda x: x[0])
-        state.lyric_lines = tuples
-    elif topic == topics.LYRICS_CURRENT:
-        state.last_current = payload
-
-
 def run_ui(
     mqtt_broker: str,
     mqtt_port: int,
@@ -111,15 +69,16 @@ def run_ui(
     fullscreen: bool,
     font_main: int,
     font_meta: int,
+    account: Optional[str] = None,
 ) -> None:
-    state = ViewerState()
+    state = ViewerState(topics.for_prefix(topics.account_prefix(account)) if account else None)
     client = _make_mqtt_client()
-    client.on_message = _on_message_factory(state)
+    client.on_message = on_message_factory(state)
     if mqtt_user:
         client.username_pw_set(mqtt_user, mqtt_password or "")
     client.connect(mqtt_broker, mqtt_port, keepalive=60)
 
-    client.subscribe([(topics.NOW_PLAYING, 0), (topics.LYRICS_TRACK, 0), (topics.LYRICS_CURRENT, 0)])
+    client.subscribe(subscriptions(state))
     client.loop_start()
 
     root = tk.Tk()
@@ -153,6 +112,16 @@ def run_ui(
     )
     current.pack(pady=16, padx=24, fill="both", expand=True)
 
+    # Active word (enhanced LRC only); empty when the track has no word timings
+    word = tk.Label(
+        root,
+        text="",
+        fg="#1db954",
+        bg="black",
+        font=("Helvetica", max(font_main - 12, 14), "bold"),
+    )
+    word.pack(pady=(0, 8), padx=24)
+
     nxt = tk.Label(
         root,
         text="",
@@ -173,49 +142,46 @@ def run_ui(
     )
     hint.pack(side="bottom", pady=8)
 
-    def drain_queue() -> None:
-        try:
-            while True:
-                topic, payload = state.lock_msg_queue.get_nowait()
-                _apply_message(state, topic, payload)
-        except queue.Empty:
-            pass
+    labels = {"meta": meta, "current": current, "word": word, "next": nxt}
+    shown: Dict[str, str] = {"meta": meta.cget("text")}
+    pending: Dict[str, Any] = {"id": None, "due": 0.0}
+
+    def schedule(delay_ms: int) -> None:
+        """Run tick in delay_ms unless one is already due sooner."""
+        due = time.monotonic() + delay_ms / 1000.0
+        if pending["id"] is not None:
+            if pending["due"] <= due:
+                return
+            root.after_cancel(pending["id"])
+        pending["due"] = due
+        pending["id"] = root.after(delay_ms, tick)
 
     def tick() -> None:
-        drain_queue()
-        now_ms = int(time.time() * 1000)
-        np = state.now_playing
-
-        artist = np.get("artist") or "—"
-        title = np.get("title") or "—"
-        meta.config(text=f"{artist}\n{title}")
-
-        if not np.get("is_playing") and not np.get("title"):
-            current.config(text="Not playing")
-            nxt.config(text="")
-        elif state.lyric_lines:
-            prog = _estimate_progress(np, now_ms)
-            _, _p, cur, nex = line_at_progress(state.lyric_lines, prog)
-            current.config(text=cur or "…")
-            nxt.config(text=nex or "")
-        else:
-            cur = state.last_current.get("current")
-            nex = state.last_current.get("next")
-            msg = state.last_current.get("message")
-            if cur:
-                current.config(text=cur)
-                nxt.config(text=nex or "")
-            elif msg:
-                current.config(text=msg)
-                nxt.config(text="")
-            else:
-                current.config(text="No lyric data yet")
-                nxt.config(text="")
-
-        root.after(100, tick)
-
-    root.after(100, tick)
+        pending["id"] = None
+        # Cleared before draining: a message queued after this point wakes the UI again
+        state.wake_pending.clear()
+        drain_messages(state)
+        view, wait = render_view(state, int(time.time() * 1000))
+        # Tk relayouts on every config(); only touch labels whose text changed
+        for key, text in view.items():
+            if shown.get(key) != text:
+                shown[key] = text
+                labels[key].config(text=text)
+        # +1 ms so the tick lands on the new line, not just before it
+        schedule(IDLE_TICK_MS if wait is None else min(IDLE_TICK_MS, wait + 1))
+
+    def notify() -> None:
+        # MQTT thread: event_generate is the Tk call that is safe to make from another thread
+        try:
+            root.event_generate("<<MqttUpdate>>", when="tail")
+        except (RuntimeError, tk.TclError):
+            pass  # mainloop not running (yet / any more): the first / next tick drains the queue
+
+    root.bind("<<MqttUpdate>>", lambda e: schedule(BATCH_MS))
+    state.on_update = notify
+    schedule(0)
     root.mainloop()
+    state.on_update = None
     client.loop_stop()
     client.disconnect()
 
@@ -233,6 +199,11 @@ def main() -> None:
         "--mqtt-password",
         default=os.environ.get("MQTT_PASSWORD", MQTT_PASSWORD),
     )
+    p.add_argument(
+        "--account",
+        default=None,
+        help="Multi-account bridge: show this account (topics under home/spotify/ACCOUNT/...)",
+    )
     p.add_argument("--fullscreen", action="store_true", help="Fullscreen (Esc toggles off)")
     p.add_argument("--font-main", type=int, default=42, help="Main lyric font size")
     p.add_argument("--font-meta", type=int, default=22, help="Artist/title font size")
@@ -246,6 +217,7 @@ def main() -> None:
         fullscreen=args.fullscreen,
         font_main=args.font_main,
         font_meta=args.font_meta,
+        account=args.account,
     )
 
 
@@ -0,0 +1,169 @@
+"""
+Viewer state shared by the tkinter viewer (spotify/viewer.py) and the headless lyrics server
+(spotify/lyrics_server.py): MQTT messages are queued from the network thread, applied in
+batches on the UI / server thread, and render_view() turns the state into the lines to show.
+No tkinter here, so the server runs on hosts without Tk.
+"""
+
+from __future__ import annotations
+
+import json
+import queue
+import threading
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+import paho.mqtt.client as mqtt
+
+from spotify import topics
+from spotify.lrc import (
+    WordTimings,
+    decode_word_timings,
+    line_at_progress,
+    word_at_progress,
+    word_span,
+)
+from spotify.timing import anchor_from_now_playing, extrapolate_progress, ms_until_next
+
+# Redraws are scheduled for the next line / word start; this is only the fallback between them
+IDLE_TICK_MS = 5000
+# A burst of MQTT messages (now_playing, anchor, lyrics/...) is applied in one redraw
+BATCH_MS = 25
+
+
+class ViewerState:
+    def __init__(self, topic_set: Optional[topics.TopicSet] = None) -> None:
+        self.topics = topic_set or topics.for_prefix()
+        self.lock_msg_queue: queue.Queue = queue.Queue()
+        self.now_playing: Dict[str, Any] = {}
+        # Timing anchor from lyrics/anchor; None until received (older bridges: use now_playing)
+        self.anchor: Optional[Dict[str, Any]] = None
+        self.lyric_lines: List[Tuple[int, str]] = []
+        # Start times of lyric_lines (for ms_until_next)
+        self.line_times: List[int] = []
+        # Aligned with lyric_lines; None where the line has no word timings
+        self.lyric_words: List[Optional[WordTimings]] = []
+        # Track the lines above belong to (lyrics/lines arrives separately from the retained summary)
+        self.lines_uri: Optional[str] = None
+        self.last_current: Dict[str, Any] = {}
+        # Called from the MQTT thread for the first message queued since the last drain_messages()
+        self.on_update: Optional[Callable[[], None]] = None
+        self.wake_pending = threading.Event()
+
+
+def on_message_factory(state: ViewerState):
+    def on_message(client: mqtt.Client, _userdata: Any, msg: mqtt.MQTTMessage) -> None:
+        try:
+            payload = json.loads(msg.payload.decode("utf-8"))
+        except (json.JSONDecodeError, UnicodeDecodeError):
+            return
+        if not isinstance(payload, dict):
+            return
+        state.lock_msg_queue.put((msg.topic, payload))
+        if not state.wake_pending.is_set() and state.on_update is not None:
+            state.wake_pending.set()
+            state.on_update()
+        # Retained summary for a track we have no lines for (just connected): ask for them. A live
+        # lyrics/track (track change) is followed by its lines anyway, so it asks for nothing.
+        if (
+            msg.topic == state.topics.lyrics_track
+            and msg.retain
+            and payload.get("has_lyrics")
+            and "lines" not in payload
+            and payload.get("track_uri") != state.lines_uri
+        ):
+            client.publish(state.topics.lyrics_request, json.dumps({"track_uri": payload.get("track_uri")}), qos=1)
+
+    return on_message
+
+
+def apply_message(state: ViewerState, topic: str, payload: Dict[str, Any]) -> None:
+    if topic == state.topics.now_playing:
+        state.now_playing = payload
+    elif topic == state.topics.lyrics_lines or (topic == state.topics.lyrics_track and "lines" in payload):
+        # Older bridges sent the lines inside the retained lyrics/track payload
+        raw_lines = payload.get("lines") or []
+        rows: List[Tuple[int, str, Optional[WordTimings]]] = []
+        if isinstance(raw_lines, list):
+            for row in raw_lines:
+                if not isinstance(row, dict):
+                    continue
+                t = row.get("t")
+                text = row.get("text")
+                if isinstance(t, (int, float)) and isinstance(text, str):
+                    rows.append((int(t), text, decode_word_timings(row.get("w"), int(t))))
+        rows.sort(key=lambda x: x[0])
+        state.lyric_lines = [(t, text) for t, text, _ in rows]
+        state.lyric_words = [w for _, _, w in rows]
+        state.line_times = [t for t, _, _ in rows]
+        state.lines_uri = payload.get("track_uri")
+    elif topic == state.topics.lyrics_current:
+        state.last_current = payload
+    elif topic == state.topics.lyrics_anchor:
+        state.anchor = payload
+
+
+def render_view(state: ViewerState, now_ms: int) -> Tuple[Dict[str, str], Optional[int]]:
+    """
+    Label texts (meta, current, word, next) at now_ms, and the ms until they can change without
+    a new MQTT message (next line or word start; None while paused or without local lyrics).
+    """
+    np = state.now_playing
+    artist = np.get("artist") or "—"
+    title = np.get("title") or "—"
+    view = {"meta": f"{artist}\n{title}", "current": "", "word": "", "next": ""}
+    wait: Optional[int] = None
+
+    if not np.get("is_playing") and not np.get("title"):
+        view["current"] = "Not playing"
+    elif state.lyric_lines and state.lines_uri == np.get("track_uri"):
+        anchor = state.anchor or anchor_from_now_playing(np)
+        prog = extrapolate_progress(anchor, now_ms, int(np.get("duration_ms") or 0))
+        rate = float(anchor.get("r") or 0.0) if anchor.get("pl") else 0.0
+        idx, _p, cur, nex = line_at_progress(state.lyric_lines, prog)
+        view["current"] = cur or "…"
+        view["next"] = nex or ""
+        wait = ms_until_next(state.line_times, prog, rate)
+        words = state.lyric_words[idx] if idx < len(state.lyric_words) else None
+        wi = word_at_progress(words, prog)
+        if cur and words is not None and wi >= 0:
+            start, end = word_span(cur, words, wi)
+            view["word"] = cur[start:end].strip()
+        if words is not None:
+            word_wait = ms_until_next(words.times, prog, rate)
+            if word_wait is not None and (wait is None or word_wait < wait):
+                wait = word_wait
+    else:
+        cur = state.last_current.get("current")
+        msg = state.last_current.get("message")
+        if cur:
+            view["current"] = cur
+            view["next"] = state.last_current.get("next") or ""
+        elif msg:
+            view["current"] = msg
+        else:
+            view["current"] = "No lyric data yet"
+    return view, wait
+
+
+def drain_messages(state: ViewerState) -> int:
+    """Apply every queued MQTT message (UI / server thread); returns how many there were."""
+    n = 0
+    try:
+        while True:
+            topic, payload = state.lock_msg_queue.get_nowait()
+            apply_message(state, topic, payload)
+            n += 1
+    except queue.Empty:
+        pass
+    return n
+
+
+def subscriptions(state: ViewerState) -> List[Tuple[str, int]]:
+    """(topic, qos) pairs a viewer subscribes to."""
+    return [
+        (state.topics.now_playing, 0),
+        (state.topics.lyrics_track, 0),
+        (state.topics.lyrics_lines, 1),
+        (state.topics.lyrics_current, 0),
+        (state.topics.lyrics_anchor, 0),
+    ]